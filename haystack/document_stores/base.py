@@ -618,6 +618,34 @@ class BaseDocumentStore(BaseComponent):
     def update_document_meta(self, id: str, meta: Dict[str, Any], index: Optional[str] = None):
         pass
 
+    def get_document_fingerprints(
+        self,
+        fingerprint_field: str = "fingerprint",
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Returns the value of the metadata field `fingerprint_field` of all documents that have one, by document ID.
+        This is how `SkipUnchangedDocuments` finds out which documents are already in the store.
+
+        This implementation fetches whole documents. Document stores that can fetch a single metadata field
+        override it.
+
+        :param fingerprint_field: Name of the metadata field holding the fingerprints.
+        :param index: Name of the index to get the fingerprints from. If None, the DocumentStore's default index
+                      (self.index) will be used.
+        :param batch_size: Number of documents to fetch at a time.
+        :param headers: Custom HTTP headers to pass to the document store client if supported.
+        """
+        fingerprints = {}
+        for document in self.get_all_documents_generator(
+            index=index, return_embedding=False, batch_size=batch_size, headers=headers
+        ):
+            if document.meta.get(fingerprint_field) is not None:
+                fingerprints[document.id] = document.meta[fingerprint_field]
+        return fingerprints
+
     def _drop_duplicate_documents(self, documents: List[Document], index: Optional[str] = None) -> List[Document]:
         """
         Drop duplicates documents based on same hash ID
@@ -1,10 +1,11 @@
-from typing import Union, List, Optional, Dict, Generator
+from typing import Hashable, Union, List, Optional, Dict, Generator, Set, Tuple
 
 import json
 import logging
 import warnings
 from pathlib import Path
 from copy import deepcopy
+from collections import OrderedDict
 from inspect import Signature, signature
 
 import numpy as np
@@ -20,12 +21,17 @@ except (ImportError, ModuleNotFoundError) as ie:
     _optional_component_not_installed(__name__, "faiss", ie)
 
 from haystack.schema import Document, FilterType
+from haystack.errors import DocumentStoreError, HaystackError
 from haystack.document_stores.base import get_batches_from_generator
+from haystack.document_stores.filter_utils import _filter_cache_key
 from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
 
+# Number of filters whose vector ids are cached per FAISSDocumentStore
+VECTOR_IDS_CACHE_SIZE = 64
+
 
 class FAISSDocumentStore(SQLDocumentStore):
     """
@@ -60,6 +66,8 @@ class FAISSDocumentStore(SQLDocumentStore):
         ef_search: int = 20,
         ef_construction: int = 80,
         validate_index_sync: bool = True,
+        faiss_index_mmap: bool = False,
+        compaction_threshold: float = 0.2,
     ):
         """
         :param sql_url: SQL connection URL for the database. The default value is "sqlite:///faiss_document_store.db"`. It defaults to a local, file-based SQLite DB. For large scale deployment, we recommend Postgres.
@@ -106,14 +114,25 @@ class FAISSDocumentStore(SQLDocumentStore):
         :param ef_search: Used only if `index_factory == "HNSW"`.
         :param ef_construction: Used only if `index_factory == "HNSW"`.
         :param validate_index_sync: Checks if the document count equals the embedding count at initialization time.
+        :param faiss_index_mmap: Used only with `faiss_index_path`. Memory-maps the index file read-only instead of
+            reading it into RAM. The index is loaded from disk as it's searched, and processes that map the same file
+            share its pages in the page cache, for example the workers of the REST API. The index can't be modified:
+            writing documents with embeddings, updating embeddings, training and deleting raise an error. Not all
+            FAISS index types support memory mapping; the ones that don't are read into RAM.
+        :param compaction_threshold: Some FAISS index types, like HNSW, can't remove vectors. When documents with such
+            an index are deleted or overwritten, their vectors stay in the index and are skipped in search results
+            until the index is compacted. The index is compacted once the share of these vectors exceeds this
+            threshold, and before saving it. You can also compact it by calling `compact()`.
         """
         # special case if we want to load an existing index from disk
         # load init params from disk and run init again
         if faiss_index_path is not None:
             sig = signature(self.__class__.__init__)
             self._validate_params_load_from_disk(sig, locals())
-            init_params = self._load_init_params_from_config(faiss_index_path, faiss_config_path)
+            init_params = self._load_init_params_from_config(faiss_index_path, faiss_config_path, faiss_index_mmap)
             self.__class__.__init__(self, **init_params)  # pylint: disable=non-parent-init-called
+            if faiss_index_mmap:
+                self._read_only_indexes.add(self.index)
             return
 
         if similarity in ("dot_product", "cosine"):
@@ -140,6 +159,15 @@ class FAISSDocumentStore(SQLDocumentStore):
 
         self.faiss_index_factory_str = faiss_index_factory_str
         self.faiss_indexes: Dict[str, faiss.swigfaiss.Index] = {}
+        # Names of the memory-mapped indexes, which can't be modified
+        self._read_only_indexes: Set[str] = set()
+        # index -> next vector id to assign, for indexes that map vector ids to vectors
+        self._next_vector_ids: Dict[str, int] = {}
+        # index -> vector ids of deleted or overwritten documents whose vectors the index couldn't remove
+        self._removed_vector_ids: Dict[str, Set[int]] = {}
+        self.compaction_threshold = compaction_threshold
+        # (index, filters) -> vector ids of the matching documents, cleared whenever the documents change
+        self._vector_ids_cache: "OrderedDict[Tuple[str, Hashable], np.ndarray]" = OrderedDict()
         if faiss_index:
             self.faiss_indexes[index] = faiss_index
         else:
@@ -165,7 +193,7 @@ class FAISSDocumentStore(SQLDocumentStore):
             self._validate_index_sync()
 
     def _validate_params_load_from_disk(self, sig: Signature, locals: dict):
-        allowed_params = ["faiss_index_path", "faiss_config_path", "self"]
+        allowed_params = ["faiss_index_path", "faiss_config_path", "faiss_index_mmap", "self"]
         invalid_param_set = False
 
         for param in sig.parameters.values():
@@ -188,6 +216,13 @@ class FAISSDocumentStore(SQLDocumentStore):
                 "you used when you saved the original index."
             )
 
+    def _check_index_writable(self, index: str):
+        if index in self._read_only_indexes:
+            raise DocumentStoreError(
+                f"The FAISS index '{index}' was loaded with `faiss_index_mmap=True` and is read-only. "
+                "Load it without memory mapping to modify it."
+            )
+
     def _create_new_index(
         self,
         embedding_dim: int,
@@ -212,8 +247,107 @@ class FAISSDocumentStore(SQLDocumentStore):
             )
         else:
             index = faiss.index_factory(embedding_dim, index_factory, metric_type)
+
+        # Store the vectors under the vector ids of their documents, so that vectors can be replaced and removed
+        # without changing the vector ids of the other documents
+        if isinstance(index, faiss.IndexIVF):
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+        elif not isinstance(index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            index = faiss.IndexIDMap2(index)
         return index
 
+    def _uses_vector_id_map(self, index: str) -> bool:
+        """
+        Whether the vectors of the FAISS index are stored under the vector ids of their documents. Otherwise, for
+        example for indexes passed in with `faiss_index` or saved by older versions, the vector id of a document is
+        the position of its vector in the index, and vectors can't be replaced.
+        """
+        faiss_index = self.faiss_indexes[index]
+        if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            return True
+        return isinstance(faiss_index, faiss.IndexIVF) and faiss_index.direct_map.type != faiss.DirectMap.Array
+
+    def _add_vectors(self, index: str, embeddings: np.ndarray) -> List[int]:
+        """
+        Adds embeddings to the FAISS index and returns their vector ids.
+        """
+        faiss_index = self.faiss_indexes[index]
+        if not self._uses_vector_id_map(index):
+            vector_ids = list(range(faiss_index.ntotal, faiss_index.ntotal + len(embeddings)))
+            faiss_index.add(embeddings)
+            return vector_ids
+
+        next_vector_id = self._next_vector_ids.get(index)
+        if next_vector_id is None:
+            if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+                # The id map also holds the ids of removed vectors that the index still contains
+                ids = faiss.vector_to_array(faiss_index.id_map)
+                next_vector_id = int(ids.max()) + 1 if len(ids) else 0
+            else:
+                vector_ids_in_use = [int(vector_id) + 1 for vector_id in self._get_vector_ids(index=index)]
+                next_vector_id = max([faiss_index.ntotal] + vector_ids_in_use)
+        vector_ids = np.arange(next_vector_id, next_vector_id + len(embeddings), dtype=np.int64)
+        faiss_index.add_with_ids(embeddings, vector_ids)
+        self._next_vector_ids[index] = next_vector_id + len(embeddings)
+        return vector_ids.tolist()
+
+    def _remove_vectors(self, index: str, vector_ids: List[str]):
+        """
+        Removes vectors from the FAISS index. If the index maps vector ids but its type can't remove vectors, like
+        HNSW, their vector ids are kept so that they can be skipped in search results and the index is compacted once
+        there are too many of them.
+        """
+        if not vector_ids:
+            return
+        try:
+            self.faiss_indexes[index].remove_ids(np.array(vector_ids, dtype=np.int64))
+        except RuntimeError:
+            # Compacting an index that stores vectors by position would change the vector ids of the other documents
+            if not self._uses_vector_id_map(index):
+                raise
+            self._removed_vector_ids.setdefault(index, set()).update(int(vector_id) for vector_id in vector_ids)
+
+    def _reset_index(self, index: str):
+        self.faiss_indexes[index].reset()
+        self._next_vector_ids.pop(index, None)
+        self._removed_vector_ids.pop(index, None)
+
+    def _compact_if_needed(self, index: str):
+        removed_vector_count = len(self._removed_vector_ids.get(index, ()))
+        if removed_vector_count > self.compaction_threshold * self.faiss_indexes[index].ntotal:
+            self.compact(index=index)
+
+    def compact(self, index: Optional[str] = None):
+        """
+        Rebuilds the FAISS index without the vectors of deleted and overwritten documents that the index type
+        couldn't remove right away, like with HNSW indexes. The vector ids of the documents don't change.
+        The new index is built next to the old one, so compacting temporarily needs memory for both.
+
+        :param index: Name of the index to compact. If None, the DocumentStore's default index (self.index) will be
+                      used.
+        """
+        index = index or self.index
+        if not self._removed_vector_ids.get(index):
+            return
+        self._check_index_writable(index)
+        if not self._uses_vector_id_map(index):
+            raise DocumentStoreError(
+                f"The FAISS index '{index}' stores vectors by position and can't be compacted without changing the "
+                "vector ids of the documents."
+            )
+
+        faiss_index = self.faiss_indexes[index]
+        vector_ids = np.array(sorted(int(vector_id) for vector_id in self._get_vector_ids(index=index)), dtype=np.int64)
+        logger.info("Compacting the FAISS index '%s' to %s vectors", index, len(vector_ids))
+        embeddings = [faiss_index.reconstruct(int(vector_id)) for vector_id in vector_ids]
+        # Clone the index to keep its type, parameters, and training, and only replace it once the copy is complete
+        compacted_index = faiss.clone_index(faiss_index)
+        compacted_index.reset()
+        if embeddings:
+            compacted_index.add_with_ids(np.array(embeddings, dtype=np.float32), vector_ids)
+        self.faiss_indexes[index] = compacted_index
+        self._removed_vector_ids.pop(index, None)
+
     def write_documents(
         self,
         documents: Union[List[dict], List[Document]],
@@ -247,6 +381,7 @@ class FAISSDocumentStore(SQLDocumentStore):
             duplicate_documents in self.duplicate_documents_options
         ), f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
 
+        self._vector_ids_cache.clear()
         if not self.faiss_indexes.get(index):
             self.faiss_indexes[index] = self._create_new_index(
                 embedding_dim=self.embedding_dim,
@@ -261,15 +396,28 @@ class FAISSDocumentStore(SQLDocumentStore):
         )
         if len(document_objects) > 0:
             add_vectors = all(doc.embedding is not None for doc in document_objects)
-
-            if self.duplicate_documents == "overwrite" and add_vectors:
+            if add_vectors:
+                self._check_index_writable(index)
+
+            # The vectors of overwritten documents are replaced, or removed if the new documents don't have one
+            replaced_vector_ids: List[str] = []
+            if duplicate_documents == "overwrite" and self._uses_vector_id_map(index):
+                previous_vector_ids = self._get_vector_ids_by_document_id(
+                    [doc.id for doc in document_objects], index=index
+                )
+                for doc in document_objects:
+                    vector_id = previous_vector_ids.get(doc.id)
+                    if vector_id is not None and (add_vectors or str(doc.meta.get("vector_id")) != vector_id):
+                        replaced_vector_ids.append(vector_id)
+                if replaced_vector_ids:
+                    self._check_index_writable(index)
+            elif self.duplicate_documents == "overwrite" and add_vectors:
                 logger.warning(
                     "You have to provide `duplicate_documents = 'overwrite'` arg and "
                     "`FAISSDocumentStore` does not support update in existing `faiss_index`.\n"
                     "Please call `update_embeddings` method to repopulate `faiss_index`"
                 )
 
-            vector_id = self.faiss_indexes[index].ntotal
             with tqdm(
                 total=len(document_objects), disable=not self.progress_bar, position=0, desc="Writing Documents"
             ) as progress_bar:
@@ -289,14 +437,13 @@ class FAISSDocumentStore(SQLDocumentStore):
                         if self.similarity == "cosine":
                             self.normalize_embedding(embeddings_to_index)
 
-                        self.faiss_indexes[index].add(embeddings_to_index)
+                        vector_ids = self._add_vectors(index, embeddings_to_index)
 
                     docs_to_write_in_sql = []
-                    for doc in document_objects[i : i + batch_size]:
+                    for j, doc in enumerate(document_objects[i : i + batch_size]):
                         meta = doc.meta
                         if add_vectors:
-                            meta["vector_id"] = vector_id
-                            vector_id += 1
+                            meta["vector_id"] = vector_ids[j]
                         docs_to_write_in_sql.append(doc)
 
                     super(FAISSDocumentStore, self).write_documents(
@@ -308,6 +455,9 @@ class FAISSDocumentStore(SQLDocumentStore):
                     progress_bar.update(batch_size)
             progress_bar.close()
 
+            self._remove_vectors(index, replaced_vector_ids)
+            self._compact_if_needed(index)
+
     def _create_document_field_map(self) -> Dict:
         return {self.index: self.embedding_field}
 
@@ -331,21 +481,26 @@ class FAISSDocumentStore(SQLDocumentStore):
                                            get processed.
         :param filters: Optional filters to narrow down the documents for which embeddings are to be updated.
                         Example: {"name": ["some", "more"], "category": ["only_one"]}
+                        With `update_existing_embeddings=True`, the vectors of the matching documents are replaced in
+                        place. This isn't supported for indexes that don't store vectors under the vector ids of their
+                        documents (see `_create_new_index()`).
         :param batch_size: When working with large number of documents, batching can help reduce memory footprint.
         :return: None
         """
         index = index or self.index
+        self._check_index_writable(index)
+        self._vector_ids_cache.clear()
+
+        if not self.faiss_indexes.get(index):
+            raise ValueError("Couldn't find a FAISS index. Try to init the FAISSDocumentStore() again ...")
 
         if update_existing_embeddings is True:
             if filters is None:
-                self.faiss_indexes[index].reset()
+                self._reset_index(index)
                 self.reset_vector_ids(index)
-            else:
+            elif not self._uses_vector_id_map(index):
                 raise Exception("update_existing_embeddings=True is not supported with filters.")
 
-        if not self.faiss_indexes.get(index):
-            raise ValueError("Couldn't find a FAISS index. Try to init the FAISSDocumentStore() again ...")
-
         if not self.faiss_indexes[index].is_trained:
             raise ValueError(
                 "FAISS index of type {} must be trained before adding vectors. Call `train_index()` "
@@ -360,7 +515,6 @@ class FAISSDocumentStore(SQLDocumentStore):
             return
 
         logger.info("Updating embeddings for %s docs...", document_count)
-        vector_id = self.faiss_indexes[index].ntotal
 
         result = self._query(
             index=index,
@@ -382,16 +536,21 @@ class FAISSDocumentStore(SQLDocumentStore):
                 if self.similarity == "cosine":
                     self.normalize_embedding(embeddings)
 
-                self.faiss_indexes[index].add(embeddings.astype(np.float32))
+                vector_ids = self._add_vectors(index, embeddings.astype(np.float32))
 
                 vector_id_map = {}
-                for doc in document_batch:
+                for doc, vector_id in zip(document_batch, vector_ids):
                     vector_id_map[str(doc.id)] = str(vector_id)
-                    vector_id += 1
                 self.update_vector_ids(vector_id_map, index=index)
+                # Replaced embeddings, only present if update_existing_embeddings is used with filters
+                self._remove_vectors(
+                    index, [doc.meta["vector_id"] for doc in document_batch if doc.meta.get("vector_id") is not None]
+                )
                 progress_bar.set_description_str("Documents Processed")
                 progress_bar.update(batch_size)
 
+        self._compact_if_needed(index)
+
     def get_all_documents(
         self,
         index: Optional[str] = None,
@@ -470,7 +629,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         if filters:
             raise Exception("filters are not supported for get_embedding_count in FAISSDocumentStore")
         index = index or self.index
-        return self.faiss_indexes[index].ntotal
+        return self.faiss_indexes[index].ntotal - len(self._removed_vector_ids.get(index, ()))
 
     def train_index(
         self,
@@ -483,12 +642,17 @@ class FAISSDocumentStore(SQLDocumentStore):
         The train vectors should come from the same distribution as your final ones.
         You can pass either documents (incl. embeddings) or just the plain embeddings that the index shall be trained on.
 
+        IVF indices created by the FAISSDocumentStore already keep a direct map from vector ids to vectors, so you don't
+        need to call `make_direct_map()` on them to return embeddings. Calling it switches the index to a direct map
+        that stores vectors by position, and then vectors can't be replaced or removed in place anymore.
+
         :param documents: Documents (incl. the embeddings)
         :param embeddings: Plain embeddings
         :param index: Name of the index to train. If None, the DocumentStore's default index (self.index) will be used.
         :return: None
         """
         index = index or self.index
+        self._check_index_writable(index)
         if isinstance(embeddings, np.ndarray) and documents:
             raise ValueError("Either pass `documents` or `embeddings`. You passed both.")
 
@@ -548,21 +712,20 @@ class FAISSDocumentStore(SQLDocumentStore):
             raise NotImplementedError("FAISSDocumentStore does not support headers.")
 
         index = index or self.index
+        self._check_index_writable(index)
+        self._vector_ids_cache.clear()
         if index in self.faiss_indexes.keys():
             if not filters and not ids:
-                self.faiss_indexes[index].reset()
+                self._reset_index(index)
             else:
-                affected_docs = self.get_all_documents(filters=filters)
+                vector_ids = set(self._get_vector_ids(filters=filters, index=index))
                 if ids:
-                    affected_docs = [doc for doc in affected_docs if doc.id in ids]
-                doc_ids = [
-                    doc.meta.get("vector_id")
-                    for doc in affected_docs
-                    if doc.meta and doc.meta.get("vector_id") is not None
-                ]
-                self.faiss_indexes[index].remove_ids(np.array(doc_ids, dtype="int64"))
+                    vector_ids &= set(self._get_vector_ids_by_document_id(ids, index=index).values())
+                self._remove_vectors(index, sorted(vector_ids, key=int))
 
         super().delete_documents(index=index, ids=ids, filters=filters)
+        if index in self.faiss_indexes.keys():
+            self._compact_if_needed(index)
 
     def delete_index(self, index: str):
         """
@@ -580,9 +743,20 @@ class FAISSDocumentStore(SQLDocumentStore):
             )
         if index in self.faiss_indexes:
             del self.faiss_indexes[index]
+            self._read_only_indexes.discard(index)
+            self._next_vector_ids.pop(index, None)
+            self._removed_vector_ids.pop(index, None)
             logger.info("Index '%s' deleted.", index)
+        self._vector_ids_cache.clear()
         super().delete_index(index)
 
+    def update_document_meta(self, id: str, meta: Dict[str, str], index: Optional[str] = None):
+        """
+        Update the metadata dictionary of a document by specifying its string id.
+        """
+        self._vector_ids_cache.clear()
+        super().update_document_meta(id=id, meta=meta, index=index)
+
     def query_by_embedding(
         self,
         query_emb: np.ndarray,
@@ -597,7 +771,8 @@ class FAISSDocumentStore(SQLDocumentStore):
         Find the document that is most similar to the provided `query_emb` by using a vector similarity metric.
 
         :param query_emb: Embedding of the query (e.g. gathered from DPR)
-        :param filters: Optional filters to narrow down the search space.
+        :param filters: Optional filters to narrow down the search space. The filters are resolved to the vector ids
+                        of the matching documents with the SQL database, and only these vectors are searched.
                         Example: {"name": ["some", "more"], "category": ["only_one"]}
         :param top_k: How many documents to return
         :param index: Index name to query the document from.
@@ -607,12 +782,45 @@ class FAISSDocumentStore(SQLDocumentStore):
                             Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
         :return:
         """
+        return self.query_by_embedding_batch(
+            query_embs=[query_emb],
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            return_embedding=return_embedding,
+            headers=headers,
+            scale_score=scale_score,
+        )[0]
+
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[Union[FilterType, List[Optional[FilterType]]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        scale_score: bool = True,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric. Queries sharing the same filters are searched with a single FAISS search, and the documents of all
+        queries are fetched from the SQL database at once.
+
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR). Can be a list of one-dimensional
+                           numpy arrays or a two-dimensional numpy array.
+        :param filters: Optional filters to narrow down the search space. Can be a single filter that is applied to
+                        each query or a list of filters (one per query). See `query_by_embedding()`.
+        :param top_k: How many documents to return per query.
+        :param index: Index name to query the document from.
+        :param return_embedding: To return document embedding. Unlike other document stores, FAISS will return normalized embeddings
+        :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
+                            If true (default) similarity scores (e.g. cosine or dot_product) which naturally have a different value range will be scaled to a range of [0,1], where 1 means extremely relevant.
+                            Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
+        """
         if headers:
             raise NotImplementedError("FAISSDocumentStore does not support headers.")
 
-        if filters:
-            logger.warning("Query filters are not implemented for the FAISSDocumentStore.")
-
         index = index or self.index
         if not self.faiss_indexes.get(index):
             raise Exception(f"Index named '{index}' does not exists. Use 'update_embeddings()' to create an index.")
@@ -620,30 +828,158 @@ class FAISSDocumentStore(SQLDocumentStore):
         if return_embedding is None:
             return_embedding = self.return_embedding
 
-        query_emb = query_emb.reshape(1, -1).astype(np.float32)
+        if len(query_embs) == 0:
+            return []
 
+        query_embs = np.array(query_embs, dtype=np.float32).reshape(len(query_embs), -1)
         if self.similarity == "cosine":
-            self.normalize_embedding(query_emb)
+            self.normalize_embedding(query_embs)
 
-        score_matrix, vector_id_matrix = self.faiss_indexes[index].search(query_emb, top_k)
-        vector_ids_for_query = [str(vector_id) for vector_id in vector_id_matrix[0] if vector_id != -1]
-
-        documents = self.get_documents_by_vector_ids(vector_ids_for_query, index=index)
-
-        # assign query score to each document
-        scores_for_vector_ids: Dict[str, float] = {
-            str(v_id): s for v_id, s in zip(vector_id_matrix[0], score_matrix[0])
+        if isinstance(filters, list):
+            if len(filters) != len(query_embs):
+                raise HaystackError(
+                    "Number of filters does not match number of query_embs. Please provide as many filters"
+                    " as query_embs or a single filter that will be applied to each query_emb."
+                )
+        else:
+            filters = [filters] * len(query_embs)
+
+        # Group the queries by filter so that each filter is resolved and searched once
+        query_groups: List[Tuple[Optional[FilterType], List[int]]] = []
+        for i, query_filters in enumerate(filters):
+            for group_filters, positions in query_groups:
+                if group_filters == query_filters:
+                    positions.append(i)
+                    break
+            else:
+                query_groups.append((query_filters, [i]))
+
+        score_matrix = np.zeros((len(query_embs), top_k), dtype=np.float32)
+        vector_id_matrix = np.full((len(query_embs), top_k), -1, dtype=np.int64)
+        for group_filters, positions in query_groups:
+            vector_ids = self._get_filtered_vector_ids(filters=group_filters, index=index) if group_filters else None
+            group_scores, group_vector_ids = self._search(
+                query_embs=query_embs[positions], top_k=top_k, index=index, vector_ids=vector_ids
+            )
+            score_matrix[positions, : group_scores.shape[1]] = group_scores
+            vector_id_matrix[positions, : group_vector_ids.shape[1]] = group_vector_ids
+
+        # Fetch the documents of all queries with a single SQL query
+        unique_vector_ids = np.unique(vector_id_matrix[vector_id_matrix != -1])
+        documents_by_vector_id = {
+            int(doc.meta["vector_id"]): doc
+            for doc in self.get_documents_by_vector_ids(
+                [str(vector_id) for vector_id in unique_vector_ids], index=index
+            )
         }
-        for doc in documents:
-            score = scores_for_vector_ids[doc.meta["vector_id"]]
-            if scale_score:
-                score = self.scale_to_unit_interval(score, self.similarity)
-            doc.score = score
 
-            if return_embedding is True:
-                doc.embedding = self.faiss_indexes[index].reconstruct(int(doc.meta["vector_id"]))
+        results: List[List[Document]] = []
+        returned_vector_ids = set()
+        for scores, vector_ids in zip(score_matrix, vector_id_matrix):
+            documents = []
+            for score, vector_id in zip(scores, vector_ids):
+                doc = documents_by_vector_id.get(int(vector_id))
+                if doc is None:
+                    continue
+                if len(documents) == top_k:
+                    break
+                # Documents returned for multiple queries get a copy for each query, as their scores differ
+                if vector_id in returned_vector_ids:
+                    doc = deepcopy(doc)
+                returned_vector_ids.add(vector_id)
+
+                doc.score = self.scale_to_unit_interval(score, self.similarity) if scale_score else score
+                if return_embedding is True:
+                    doc.embedding = self.faiss_indexes[index].reconstruct(int(vector_id))
+                documents.append(doc)
+            results.append(documents)
+        return results
+
+    def _get_filtered_vector_ids(self, filters: FilterType, index: str) -> np.ndarray:
+        """
+        Returns the vector ids of the documents matching the filters. The vector ids are cached per filter until
+        the documents in the DocumentStore change.
+        """
+        try:
+            key: Optional[Tuple[str, Hashable]] = (index, _filter_cache_key(filters))
+        except TypeError:
+            key = None
+        vector_ids = self._vector_ids_cache.get(key) if key is not None else None
+        if vector_ids is not None:
+            self._vector_ids_cache.move_to_end(key)
+            return vector_ids
+
+        vector_ids = np.array(
+            sorted(int(vector_id) for vector_id in self._get_vector_ids(filters=filters, index=index)), dtype=np.int64
+        )
+        if key is None:
+            return vector_ids
+        self._vector_ids_cache[key] = vector_ids
+        if len(self._vector_ids_cache) > VECTOR_IDS_CACHE_SIZE:
+            self._vector_ids_cache.popitem(last=False)
+        return vector_ids
+
+    def _search(
+        self, query_embs: np.ndarray, top_k: int, index: str, vector_ids: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Searches the FAISS index and returns the score and vector id matrices. If `vector_ids` is set, only these
+        vectors are searched. Otherwise, the vectors of deleted documents that the index couldn't remove yet are
+        skipped. Both work with an id selector if the FAISS version and index type support it, otherwise by searching
+        more results than needed until enough of them match.
+        """
+        faiss_index = self.faiss_indexes[index]
+        removed_vector_ids = self._removed_vector_ids.get(index)
+        if vector_ids is None and not removed_vector_ids:
+            return faiss_index.search(query_embs, top_k)
+
+        if vector_ids is not None:
+            # The vector ids come from the SQL database, which doesn't contain removed vectors
+            selected_vector_ids, exclude_selected = vector_ids, False
+            match_count = len(vector_ids)
+        else:
+            selected_vector_ids = np.array(sorted(removed_vector_ids or ()), dtype=np.int64)
+            exclude_selected = True
+            match_count = faiss_index.ntotal - len(selected_vector_ids)
+        if match_count <= 0 or top_k == 0 or faiss_index.ntotal == 0:
+            return np.zeros((len(query_embs), 0), dtype=np.float32), np.zeros((len(query_embs), 0), dtype=np.int64)
+
+        # Search parameters with id selectors are available from FAISS 1.7.3 on, IDSelectorNot from FAISS 1.7.4 on
+        if hasattr(faiss, "SearchParameters") and (not exclude_selected or hasattr(faiss, "IDSelectorNot")):
+            batch_selector = faiss.IDSelectorBatch(len(selected_vector_ids), faiss.swig_ptr(selected_vector_ids))
+            # IDSelectorNot doesn't own the selector it wraps, so batch_selector must stay referenced
+            selector = faiss.IDSelectorNot(batch_selector) if exclude_selected else batch_selector
+            # The id map of IndexIDMap translates the selector and passes the parameters on to the wrapped index
+            inner_index = faiss_index
+            if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+                inner_index = faiss.downcast_index(faiss_index.index)
+            if isinstance(inner_index, faiss.IndexIVF):
+                search_parameters = faiss.SearchParametersIVF(sel=selector, nprobe=inner_index.nprobe)
+            elif isinstance(inner_index, faiss.IndexHNSW):
+                search_parameters = faiss.SearchParametersHNSW(sel=selector, efSearch=inner_index.hnsw.efSearch)
+            else:
+                search_parameters = faiss.SearchParameters(sel=selector)
+            try:
+                return faiss_index.search(query_embs, top_k, params=search_parameters)
+            except RuntimeError as e:
+                logger.debug("Searching with an id selector failed, searching without it instead: %s", e)
+
+        # Over-fetch in proportion to the share of matching vectors and double until enough results match
+        fetch_k = min(faiss_index.ntotal, max(top_k, top_k * faiss_index.ntotal // match_count))
+        while True:
+            scores, ids = faiss_index.search(query_embs, fetch_k)
+            matches = np.isin(ids, selected_vector_ids, invert=exclude_selected) & (ids != -1)
+            if fetch_k >= faiss_index.ntotal or matches.sum(axis=1).min() >= min(top_k, match_count):
+                break
+            fetch_k = min(faiss_index.ntotal, 2 * fetch_k)
 
-        return documents
+        filtered_scores = np.zeros((len(query_embs), top_k), dtype=np.float32)
+        filtered_ids = np.full((len(query_embs), top_k), -1, dtype=np.int64)
+        for i in range(len(query_embs)):
+            matching_positions = np.flatnonzero(matches[i])[:top_k]
+            filtered_scores[i, : len(matching_positions)] = scores[i, matching_positions]
+            filtered_ids[i, : len(matching_positions)] = ids[i, matching_positions]
+        return filtered_scores, filtered_ids
 
     def save(self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None):
         """
@@ -666,10 +1002,12 @@ class FAISSDocumentStore(SQLDocumentStore):
             index_path = Path(index_path)
             config_path = index_path.with_suffix(".json")
 
+        # The vectors that the index couldn't remove are only tracked in memory
+        self.compact(index=self.index)
         faiss.write_index(self.faiss_indexes[self.index], str(index_path))
 
         config_to_save = deepcopy(self._component_config["params"])
-        keys_to_remove = ["faiss_index", "faiss_index_path"]
+        keys_to_remove = ["faiss_index", "faiss_index_path", "faiss_index_mmap"]
         for key in keys_to_remove:
             if key in config_to_save.keys():
                 del config_to_save[key]
@@ -678,7 +1016,7 @@ class FAISSDocumentStore(SQLDocumentStore):
             json.dump(config_to_save, ipp, default=str)
 
     def _load_init_params_from_config(
-        self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None
+        self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None, mmap: bool = False
     ):
         if not config_path:
             index_path = Path(index_path)
@@ -695,7 +1033,8 @@ class FAISSDocumentStore(SQLDocumentStore):
                 "to access it."
             ) from e
 
-        faiss_index = faiss.read_index(str(index_path))
+        io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        faiss_index = faiss.read_index(str(index_path), io_flags)
 
         # Add other init params to override the ones defined in the init params file
         init_params["faiss_index"] = faiss_index
@@ -704,7 +1043,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         return init_params
 
     @classmethod
-    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None):
+    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None, mmap: bool = False):
         """
         Load a saved FAISS index from a file and connect to the SQL database. `load()` is a class method, so, you need to call it on the class itself instead of the instance. For more information, see [DocumentStore](https://docs.haystack.deepset.ai/docs/document_store).
 
@@ -714,5 +1053,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         :param index_path: The stored FAISS index file. Call `save()` to create this file. Use the same index file path you specified when calling `save()`.
         :param config_path: Stored FAISS initial configuration parameters.
             Call `save()` to create it.
+        :param mmap: Memory-maps the index file read-only instead of reading it into RAM, so that it's loaded as it's
+            searched and shared between processes. See `faiss_index_mmap` in `FAISSDocumentStore.__init__()`.
         """
-        return cls(faiss_index_path=index_path, faiss_config_path=config_path)
+        return cls(faiss_index_path=index_path, faiss_config_path=config_path, faiss_index_mmap=mmap)
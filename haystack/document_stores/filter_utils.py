@@ -1,7 +1,9 @@
 import logging
-from typing import Union, List, Dict, Optional, Tuple
+from typing import Any, Callable, Hashable, Union, List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
+from copy import deepcopy
 
 from haystack.document_stores.utils import convert_date_to_rfc3339
 from haystack.errors import FilterError
@@ -28,6 +30,18 @@ def nested_defaultdict() -> defaultdict:
     return defaultdict(nested_defaultdict)
 
 
+def _to_frozenset(values: Any) -> Optional[frozenset]:
+    """
+    Returns the values of a list as a frozenset for fast membership tests, or None if they are not hashable.
+    """
+    if not isinstance(values, list):
+        return None
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
 class LogicalFilterClause(ABC):
     """
     Class that is able to parse a filter and convert it to the format that the underlying databases of our
@@ -103,6 +117,15 @@ class LogicalFilterClause(ABC):
     def evaluate(self, fields) -> bool:
         pass
 
+    @abstractmethod
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compiles the filter into a predicate function that takes the metadata fields of a document and returns the
+        same result as `evaluate()`. Compiling walks the filter tree only once, so the predicate is cheaper to call
+        for each document than `evaluate()`.
+        """
+        pass
+
     @classmethod
     def parse(cls, filter_term: Union[dict, List[dict]]) -> Union["LogicalFilterClause", "ComparisonOperation"]:
         """
@@ -199,6 +222,14 @@ class ComparisonOperation(ABC):
     def evaluate(self, fields) -> bool:
         pass
 
+    @abstractmethod
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compiles the comparison into a predicate function that takes the metadata fields of a document and returns
+        the same result as `evaluate()`.
+        """
+        pass
+
     @classmethod
     def parse(cls, field_name, comparison_clause: Union[Dict, List, str, float]) -> List["ComparisonOperation"]:
         comparison_operations: List[ComparisonOperation] = []
@@ -313,6 +344,17 @@ class NotOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return not any(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        predicates = tuple(condition.compile() for condition in self.conditions)
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            for condition in predicates:
+                if condition(fields):
+                    return False
+            return True
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -364,6 +406,19 @@ class AndOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return all(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        predicates = tuple(condition.compile() for condition in self.conditions)
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            for condition in predicates:
+                if not condition(fields):
+                    return False
+            return True
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -400,6 +455,19 @@ class OrOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return any(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        predicates = tuple(condition.compile() for condition in self.conditions)
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            for condition in predicates:
+                if condition(fields):
+                    return True
+            return False
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -438,6 +506,15 @@ class EqOperation(ComparisonOperation):
             return False
         return fields[self.field_name] == self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] == comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(
         self,
     ) -> Dict[str, Dict[str, Union[str, int, float, bool, Dict[str, Union[list, Dict[str, str]]]]]]:
@@ -485,6 +562,25 @@ class InOperation(ComparisonOperation):
         return fields[self.field_name] in self.comparison_value  # type: ignore
         # is only initialized with lists, but changing the type annotation would mean duplicating __init__
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+        comparison_set = _to_frozenset(comparison_value)
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            if field_name not in fields:
+                return False
+            field_value = fields[field_name]
+            if comparison_set is not None:
+                try:
+                    return field_value in comparison_set
+                except TypeError:
+                    # unhashable field values are compared element by element
+                    pass
+            return field_value in comparison_value  # type: ignore
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, List]]:
         if not isinstance(self.comparison_value, list):
             raise FilterError("'$in' operation requires comparison value to be a list.")
@@ -531,6 +627,15 @@ class NeOperation(ComparisonOperation):
             return False
         return fields[self.field_name] != self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] != comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Union[str, int, float, bool]]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Use '$nin' operation for lists as comparison values.")
@@ -567,6 +672,25 @@ class NinOperation(ComparisonOperation):
         return fields[self.field_name] not in self.comparison_value  # type: ignore
         # is only initialized with lists, but changing the type annotation would mean duplicating __init__
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+        comparison_set = _to_frozenset(comparison_value)
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            if field_name not in fields:
+                return False
+            field_value = fields[field_name]
+            if comparison_set is not None:
+                try:
+                    return field_value not in comparison_set
+                except TypeError:
+                    # unhashable field values are compared element by element
+                    pass
+            return field_value not in comparison_value  # type: ignore
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Dict[str, List]]]]:
         if not isinstance(self.comparison_value, list):
             raise FilterError("'$nin' operation requires comparison value to be a list.")
@@ -613,6 +737,15 @@ class GtOperation(ComparisonOperation):
             return False
         return fields[self.field_name] > self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] > comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$gt' operation must not be a list.")
@@ -652,6 +785,15 @@ class GteOperation(ComparisonOperation):
             return False
         return fields[self.field_name] >= self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] >= comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$gte' operation must not be a list.")
@@ -691,6 +833,15 @@ class LtOperation(ComparisonOperation):
             return False
         return fields[self.field_name] < self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] < comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$lt' operation must not be a list.")
@@ -730,6 +881,15 @@ class LteOperation(ComparisonOperation):
             return False
         return fields[self.field_name] <= self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def predicate(fields: Dict[str, Any]) -> bool:
+            return field_name in fields and fields[field_name] <= comparison_value
+
+        return predicate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$lte' operation must not be a list.")
@@ -757,3 +917,65 @@ class LteOperation(ComparisonOperation):
 
     def invert(self) -> "GtOperation":
         return GtOperation(self.field_name, self.comparison_value)
+
+
+class CompiledFilter:
+    """
+    A parsed filter together with its compiled predicate. Use `compile_filter()` to get an instance, so that
+    repeated filters are only parsed and compiled once.
+    """
+
+    def __init__(self, filters: Union[dict, List[dict]]):
+        self.filter_clause = LogicalFilterClause.parse(filters)
+        self.predicate = self.filter_clause.compile()
+
+    def __call__(self, fields: Dict[str, Any]) -> bool:
+        return self.predicate(fields)
+
+
+FILTER_CACHE_SIZE = 256
+_filter_cache: "OrderedDict[Hashable, CompiledFilter]" = OrderedDict()
+_filter_cache_lock = threading.Lock()
+
+
+def _filter_cache_key(value: Any) -> Hashable:
+    """
+    Converts a filter into a canonical, hashable key. Filters that only differ in the order of their dictionary keys
+    get the same key. The type of every value is part of the key, so values that are equal or print the same but have
+    different types, such as `1` and `True`, a date and its string, or a list and a tuple, get different keys.
+    Raises a TypeError if the filter contains values that are not hashable.
+    """
+    if isinstance(value, dict):
+        items = [(_filter_cache_key(key), _filter_cache_key(item)) for key, item in value.items()]
+        return (dict, tuple(sorted(items, key=repr)))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_filter_cache_key(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def compile_filter(filters: Union[dict, List[dict]]) -> CompiledFilter:
+    """
+    Parses and compiles a filter, reusing the result if the same filter was compiled recently. The compiled
+    filters are kept in an LRU cache of `FILTER_CACHE_SIZE` entries and are shared, so they must not be modified.
+
+    :param filters: Dictionary or list that contains the filter definition. See `LogicalFilterClause` for the syntax.
+    """
+    try:
+        key = _filter_cache_key(filters)
+    except TypeError:
+        return CompiledFilter(filters)
+
+    with _filter_cache_lock:
+        compiled_filter = _filter_cache.get(key)
+        if compiled_filter is not None:
+            _filter_cache.move_to_end(key)
+            return compiled_filter
+
+    # The filter is copied so that changes to the caller's filter don't affect the cached one
+    compiled_filter = CompiledFilter(deepcopy(filters))
+    with _filter_cache_lock:
+        _filter_cache[key] = compiled_filter
+        if len(_filter_cache) > FILTER_CACHE_SIZE:
+            _filter_cache.popitem(last=False)
+    return compiled_filter
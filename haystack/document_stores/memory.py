@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union, Generator
+from typing import Any, Dict, List, Optional, Tuple, Union, Generator
 
 try:
     from typing import Literal
@@ -7,22 +7,24 @@ except ImportError:
 
 import time
 import logging
-from copy import deepcopy
+from copy import copy, deepcopy
 from collections import defaultdict
 import re
 
 import numpy as np
 import torch
 from tqdm.auto import tqdm
-import rank_bm25
 import pandas as pd
 
 from haystack.schema import Document, FilterType, Label
-from haystack.errors import DuplicateDocumentError, DocumentStoreError
+from haystack.errors import DuplicateDocumentError, DocumentStoreError, HaystackError
 from haystack.document_stores import KeywordDocumentStore
 from haystack.document_stores.base import get_batches_from_generator
 from haystack.modeling.utils import initialize_device_settings
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
+from haystack.document_stores.memory_bm25 import BM25_ALGORITHMS, BM25Index, top_k_indices
+from haystack.document_stores.memory_embeddings import EmbeddingMatrix
+from haystack.document_stores.memory_metadata import MetadataIndex
 from haystack.nodes.retriever.dense import DenseRetriever
 from haystack.utils.scipy_utils import expit
 
@@ -53,6 +55,8 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         bm25_tokenization_regex: str = r"(?u)\b\w\w+\b",
         bm25_algorithm: Literal["BM25Okapi", "BM25L", "BM25Plus"] = "BM25Okapi",
         bm25_parameters: Optional[Dict] = None,
+        copy_on_read: bool = True,
+        meta_index_fields: Optional[List[str]] = None,
     ):
         """
         :param index: The documents are scoped to an index attribute that can be used when writing, querying,
@@ -89,8 +93,22 @@ class InMemoryDocumentStore(KeywordDocumentStore):
                                Parameter options : ( 'BM25Okapi', 'BM25L', 'BM25Plus')
         :param bm25_parameters: Parameters for BM25 implementation in a dictionary format.
                                 For example: {'k1':1.5, 'b':0.75, 'epsilon':0.25}
-                                You can learn more about these parameters by visiting https://github.com/dorianbrown/rank_bm25
+                                BM25L and BM25Plus take a 'delta' parameter instead of 'epsilon'.
+                                The scoring functions follow https://github.com/dorianbrown/rank_bm25
                                 By default, no parameters are set.
+        :param copy_on_read: Whether the documents returned by the document store are deep copies of the stored ones.
+                             Documents are always filtered before they are copied, so only the returned documents are
+                             copied. If set to False, the returned documents are shallow copies that share their
+                             content, metadata and embedding with the stored documents. This avoids copying large
+                             embeddings and metadata on every read, but the returned documents must then be treated
+                             as read-only: modifying their metadata or embedding in place also modifies the
+                             documents in the store.
+        :param meta_index_fields: Metadata fields to build secondary indexes for. Filters with `"$eq"`, `"$in"`,
+                                  `"$gt"`, `"$gte"`, `"$lt"` or `"$lte"` conditions on these fields look up the
+                                  matching documents in the indexes instead of evaluating the filter on every document
+                                  of the index, which makes selective filters much faster on large indexes.
+                                  The metadata of stored documents must then only be modified with
+                                  `update_document_meta()`.
         """
         if bm25_parameters is None:
             bm25_parameters = {}
@@ -111,7 +129,11 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         self.bm25_tokenization_regex = bm25_tokenization_regex
         self.bm25_algorithm = bm25_algorithm
         self.bm25_parameters = bm25_parameters
-        self.bm25: Dict[str, rank_bm25.BM25] = {}
+        self.copy_on_read = copy_on_read
+        self.meta_index_fields = meta_index_fields
+        self.meta_indexes: Dict[str, MetadataIndex] = {}
+        self.bm25: Dict[str, BM25Index] = {}
+        self.embedding_matrices: Dict[str, EmbeddingMatrix] = defaultdict(EmbeddingMatrix)
 
         self.devices, _ = initialize_device_settings(devices=devices, use_cuda=self.use_gpu, multi_gpu=False)
         if len(self.devices) > 1:
@@ -133,11 +155,13 @@ class InMemoryDocumentStore(KeywordDocumentStore):
 
     @property
     def bm25_algorithm(self):
-        return self._bm25_class
+        return self._bm25_algorithm
 
     @bm25_algorithm.setter
     def bm25_algorithm(self, algorithm: str):
-        self._bm25_class = getattr(rank_bm25, algorithm)
+        if algorithm not in BM25_ALGORITHMS:
+            raise ValueError(f"Unknown BM25 algorithm '{algorithm}'. Choose one of {', '.join(BM25_ALGORITHMS)}.")
+        self._bm25_algorithm = algorithm
 
     def write_documents(
         self,
@@ -177,12 +201,18 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         ), f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
 
         field_map = self._create_document_field_map()
-        documents = deepcopy(documents)
-        documents_objects = [
-            Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents
-        ]
+        # Only the top level of each document is copied: the store keeps its own Document object and metadata
+        # dictionary, but content and embedding are shared with the written documents
+        documents_objects = []
+        for d in documents:
+            if isinstance(d, dict):
+                document = Document.from_dict({**d, "meta": dict(d.get("meta") or {})}, field_map=field_map)
+            else:
+                document = copy(d)
+                document.meta = dict(d.meta)
+            documents_objects.append(document)
         documents_objects = self._drop_duplicate_documents(documents=documents_objects)
-        modified_documents = 0
+        modified_documents = []
         for document in documents_objects:
             if document.id in self.indexes[index]:
                 if duplicate_documents == "fail":
@@ -194,42 +224,73 @@ class InMemoryDocumentStore(KeywordDocumentStore):
                         "Duplicate Documents: Document with id '%s' already exists in index '%s'", document.id, index
                     )
                     continue
-            self.indexes[index][document.id] = document
-            modified_documents += 1
+            modified_documents.append(document)
+
+        # Check all documents before storing any, so that a failing write leaves the index, the embedding matrix
+        # and the BM25 representation as they were
+        self.embedding_matrices[index].check_dimensions(
+            (document.id, document.embedding) for document in modified_documents if document.embedding is not None
+        )
 
-        if self.use_bm25 is True and modified_documents > 0:
-            self.update_bm25(index=index)
+        for document in modified_documents:
+            self.indexes[index][document.id] = document
+            if self.meta_index_fields:
+                self._get_meta_index(index).add(document.id, document.meta)
+            if document.embedding is not None:
+                self.embedding_matrices[index].set(document.id, document.embedding)
+            else:
+                self.embedding_matrices[index].remove(document.id)
+
+        if self.use_bm25 is True and len(modified_documents) > 0:
+            if index not in self.bm25:
+                self.bm25[index] = BM25Index(algorithm=self.bm25_algorithm, **self.bm25_parameters)
+            self._add_to_bm25(documents=modified_documents, index=index)
 
     def update_bm25(self, index: Optional[str] = None):
         """
-        Updates the BM25 sparse representation in the the document store.
+        Rebuilds the BM25 sparse representation in the the document store from scratch.
+        Writing or deleting documents keeps the representation up to date, so this is only needed if the
+        tokenization settings changed.
 
         :param index: Index name for which the BM25 representation is to be updated. If set to None, the default self.index is used.
         """
         index = index or self.index
 
-        all_documents = self.get_all_documents(index=index)
-        textual_documents = []
-        for doc in all_documents:
-            if doc.content_type == "text":
-                textual_documents.append(doc.content.lower())
-            elif doc.content_type == "table":
-                if isinstance(doc.content, pd.DataFrame):
-                    textual_documents.append(doc.content.astype(str).to_csv(index=False).lower())
-                else:
-                    raise DocumentStoreError("Documents of type 'table' need to have a pd.DataFrame as content field")
-        if len(textual_documents) < len(all_documents):
+        self.bm25[index] = BM25Index(algorithm=self.bm25_algorithm, **self.bm25_parameters)
+        documents = [doc for doc in self.indexes[index].values() if isinstance(doc, Document)]
+        self._add_to_bm25(documents=documents, index=index)
+
+    def _add_to_bm25(self, documents: List[Document], index: str):
+        """
+        Tokenizes the given documents and adds them to the BM25 representation of the index, replacing any
+        previous representation of documents with the same ID.
+        """
+        bm25 = self.bm25[index]
+        non_textual_documents = 0
+        for doc in tqdm(documents, disable=not self.progress_bar, unit=" docs", desc="Updating BM25 representation..."):
+            text = self._get_bm25_text(doc)
+            if text is None:
+                # the document might have replaced a textual one with the same ID
+                bm25.remove(doc.id)
+                non_textual_documents += 1
+                continue
+            bm25.add(doc.id, self.bm25_tokenization_regex(text))
+        if non_textual_documents > 0:
             logger.warning(
                 "Some documents in %s index are non-textual."
                 " They will be written to the index, but the corresponding BM25 representations will not be generated.",
                 index,
             )
 
-        tokenized_corpus = [
-            self.bm25_tokenization_regex(doc)
-            for doc in tqdm(textual_documents, unit=" docs", desc="Updating BM25 representation...")
-        ]
-        self.bm25[index] = self.bm25_algorithm(tokenized_corpus, **self.bm25_parameters)
+    @staticmethod
+    def _get_bm25_text(document: Document) -> Optional[str]:
+        if document.content_type == "text":
+            return document.content.lower()
+        if document.content_type == "table":
+            if isinstance(document.content, pd.DataFrame):
+                return document.content.astype(str).to_csv(index=False).lower()
+            raise DocumentStoreError("Documents of type 'table' need to have a pd.DataFrame as content field")
+        return None
 
     def _create_document_field_map(self):
         return {self.embedding_field: "embedding"}
@@ -303,86 +364,76 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         documents = [self.indexes[index][id] for id in ids]
         return documents
 
-    def _get_scores_torch(self, query_emb: np.ndarray, documents_to_search: List[Document]) -> List[float]:
+    def _get_scores_torch(self, query_embs: np.ndarray, doc_embeds: np.ndarray) -> np.ndarray:
         """
-        Calculate similarity scores between query embedding and a list of documents using torch.
+        Calculate similarity scores between query embeddings and a matrix of document embeddings using torch.
 
-        :param query_emb: Embedding of the query (e.g. gathered from DPR)
-        :param documents_to_search: List of documents to compare `query_emb` against.
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR), one per row.
+        :param doc_embeds: Embeddings of the documents to compare `query_embs` against, one per row.
+        :return: Array of shape (number of queries, number of documents).
         """
-        query_emb_tensor = torch.tensor(query_emb, dtype=torch.float).to(self.main_device)
-        if query_emb_tensor.ndim == 1:
-            query_emb_tensor = query_emb_tensor.unsqueeze(dim=0)
-
-        doc_embeds = np.array([doc.embedding for doc in documents_to_search])
+        query_embs_tensor = torch.as_tensor(query_embs, dtype=torch.float).to(self.main_device)
         doc_embeds_tensor = torch.as_tensor(doc_embeds, dtype=torch.float)
-        if doc_embeds_tensor.ndim == 1:
-            # if there are no embeddings, return an empty list
-            if doc_embeds_tensor.shape[0] == 0:
-                return []
-            doc_embeds_tensor = doc_embeds_tensor.unsqueeze(dim=0)
-
-        if self.similarity == "cosine":
-            # cosine similarity is just a normed dot product
-            query_emb_norm = torch.norm(query_emb_tensor, dim=1)
-            query_emb_tensor = torch.div(query_emb_tensor, query_emb_norm)
-
-            doc_embeds_norms = torch.norm(doc_embeds_tensor, dim=1)
-            doc_embeds_tensor = torch.div(doc_embeds_tensor.T, doc_embeds_norms).T
 
         curr_pos = 0
-        scores: List[float] = []
+        scores = np.zeros((len(query_embs), len(doc_embeds)), dtype=np.float32)
         while curr_pos < len(doc_embeds_tensor):
             doc_embeds_slice = doc_embeds_tensor[curr_pos : curr_pos + self.scoring_batch_size]
             doc_embeds_slice = doc_embeds_slice.to(self.main_device)
             with torch.inference_mode():
-                slice_scores = torch.matmul(doc_embeds_slice, query_emb_tensor.T).cpu()
-                slice_scores = slice_scores.squeeze(dim=1)
-                slice_scores = slice_scores.numpy().tolist()
-
-            scores.extend(slice_scores)
+                slice_scores = torch.matmul(query_embs_tensor, doc_embeds_slice.T).cpu()
+            scores[:, curr_pos : curr_pos + self.scoring_batch_size] = slice_scores.numpy()
             curr_pos += self.scoring_batch_size
 
         return scores
 
-    def _get_scores_numpy(self, query_emb: np.ndarray, documents_to_search: List[Document]) -> List[float]:
+    def _get_scores_numpy(self, query_embs: np.ndarray, doc_embeds: np.ndarray) -> np.ndarray:
         """
-        Calculate similarity scores between query embedding and a list of documents using numpy.
+        Calculate similarity scores between query embeddings and a matrix of document embeddings using numpy.
 
-        :param query_emb: Embedding of the query (e.g. gathered from DPR)
-        :param documents_to_search: List of documents to compare `query_emb` against.
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR), one per row.
+        :param doc_embeds: Embeddings of the documents to compare `query_embs` against, one per row.
+        :return: Array of shape (number of queries, number of documents).
         """
-        if query_emb.ndim == 1:
-            query_emb = np.expand_dims(a=query_emb, axis=0)
+        return np.dot(query_embs, doc_embeds.T)
 
-        doc_embeds = np.array([doc.embedding for doc in documents_to_search])
-        if doc_embeds.ndim == 1:
-            # if there are no embeddings, return an empty list
-            if doc_embeds.shape[0] == 0:
-                return []
-            doc_embeds = np.expand_dims(a=doc_embeds, axis=0)
+    def _get_scores(
+        self, query_embs: np.ndarray, index: str, doc_ids: Optional[List[str]] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Calculate similarity scores between query embeddings and the documents of an index with one matrix product.
 
+        :param query_embs: Embeddings of the queries, one per row.
+        :param index: Index whose embedding matrix to search.
+        :param doc_ids: The IDs of the documents to score. If None, all documents with an embedding are scored.
+        :return: The IDs of the scored documents and an array of shape (number of queries, number of documents).
+        """
+        matrix = self.embedding_matrices[index]
+        if doc_ids is None:
+            doc_ids = matrix.ids
+            doc_embeds = matrix.embeddings
+            doc_norms = matrix.norms
+        else:
+            rows = matrix.rows(doc_ids)
+            doc_ids = [matrix.ids[row] for row in rows]
+            doc_embeds = matrix.embeddings[rows]
+            doc_norms = matrix.norms[rows]
+        if len(doc_ids) == 0:
+            return doc_ids, np.zeros((len(query_embs), 0), dtype=np.float32)
+
+        query_embs = query_embs.astype(np.float32, copy=False)
         if self.similarity == "cosine":
-            # cosine similarity is just a normed dot product
-            query_emb_norm = np.apply_along_axis(np.linalg.norm, 1, query_emb)
-            query_emb_norm = np.expand_dims(query_emb_norm, 1)
-            query_emb = np.divide(query_emb, query_emb_norm)
-
-            doc_embeds_norms = np.apply_along_axis(np.linalg.norm, 1, doc_embeds)
-            doc_embeds_norms = np.expand_dims(doc_embeds_norms, 1)
-            doc_embeds = np.divide(doc_embeds, doc_embeds_norms)
-
-        scores = np.dot(query_emb, doc_embeds.T)[0].tolist()
-
-        return scores
+            # cosine similarity is just a normed dot product, the document norms are precomputed
+            query_embs = query_embs / np.linalg.norm(query_embs, axis=1, keepdims=True)
 
-    def _get_scores(self, query_emb: np.ndarray, documents_to_search: List[Document]) -> List[float]:
         if self.main_device.type == "cuda":
-            scores = self._get_scores_torch(query_emb, documents_to_search)
+            scores = self._get_scores_torch(query_embs, doc_embeds)
         else:
-            scores = self._get_scores_numpy(query_emb, documents_to_search)
+            scores = self._get_scores_numpy(query_embs, doc_embeds)
 
-        return scores
+        if self.similarity == "cosine":
+            scores = scores / doc_norms
+        return doc_ids, scores
 
     def query_by_embedding(
         self,
@@ -476,30 +527,111 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         if query_emb is None:
             return []
 
-        documents = self.get_all_documents(index=index, filters=filters, return_embedding=True)
-        documents_with_embeddings = [doc for doc in documents if doc.embedding is not None]
-        if len(documents) != len(documents_with_embeddings):
+        return self._query_by_embedding_batch(
+            query_embs=np.asarray(query_emb).reshape(1, -1),
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            return_embedding=return_embedding,
+            scale_score=scale_score,
+        )[0]
+
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[Union[FilterType, List[Optional[FilterType]]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        scale_score: bool = True,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric. Queries sharing the same filters are scored against the documents with a single matrix product.
+
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR).
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions. Can be a single filter that is applied to each query or a list of filters
+                        (one per query). See `query_by_embedding` for the filter syntax.
+        :param top_k: How many documents to return per query.
+        :param index: Index name for storing the docs and metadata
+        :param return_embedding: To return document embedding
+        :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
+                            If true (default) similarity scores (e.g. cosine or dot_product) which naturally have a different value range will be scaled to a range of [0,1], where 1 means extremely relevant.
+                            Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+
+        if isinstance(filters, list):
+            if len(filters) != len(query_embs):
+                raise HaystackError(
+                    "Number of filters does not match number of query_embs. Please provide as many filters"
+                    " as query_embs or a single filter that will be applied to each query_emb."
+                )
+            return [
+                self.query_by_embedding(
+                    query_emb=query_emb,
+                    filters=query_filters,
+                    top_k=top_k,
+                    index=index,
+                    return_embedding=return_embedding,
+                    scale_score=scale_score,
+                )
+                for query_emb, query_filters in zip(query_embs, filters)
+            ]
+
+        index = index or self.index
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+        if len(query_embs) == 0:
+            return []
+
+        return self._query_by_embedding_batch(
+            query_embs=np.stack([np.asarray(query_emb).reshape(-1) for query_emb in query_embs]),
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            return_embedding=return_embedding,
+            scale_score=scale_score,
+        )
+
+    def _query_by_embedding_batch(
+        self,
+        query_embs: np.ndarray,
+        filters: Optional[FilterType],
+        top_k: int,
+        index: str,
+        return_embedding: bool,
+        scale_score: bool,
+    ) -> List[List[Document]]:
+        if filters:
+            doc_ids: Optional[List[str]] = [doc.id for doc in self._filter_documents(index=index, filters=filters)]
+            num_documents = len(doc_ids)  # type: ignore [arg-type]
+        else:
+            doc_ids = None
+            num_documents = sum(isinstance(doc, Document) for doc in self.indexes[index].values())
+        doc_ids, scores = self._get_scores(query_embs, index=index, doc_ids=doc_ids)
+        if num_documents != len(doc_ids):
             logger.warning(
                 "Skipping some of your documents that don't have embeddings. "
                 "To generate embeddings, run the document store's update_embeddings() method."
             )
-        scores = self._get_scores(query_emb, documents_with_embeddings)
 
-        candidate_docs = []
-        for doc, score in zip(documents_with_embeddings, scores):
-            curr_meta = deepcopy(doc.meta)
-            new_document = Document(
-                id=doc.id, content=doc.content, content_type=doc.content_type, meta=curr_meta, embedding=doc.embedding
-            )
-            new_document.embedding = doc.embedding if return_embedding is True else None
+        results = []
+        for query_scores, top_positions in zip(scores, top_k_indices(scores, top_k)):
+            candidate_docs = []
+            for i in top_positions:
+                new_document = self._copy_document(self.indexes[index][doc_ids[i]], return_embedding=return_embedding)
+                score = float(query_scores[i])
+                if scale_score:
+                    score = self.scale_to_unit_interval(score, self.similarity)
+                new_document.score = score
+                candidate_docs.append(new_document)
+            results.append(candidate_docs)
 
-            new_document.embedding = doc.embedding if return_embedding is True else None
-            if scale_score:
-                score = self.scale_to_unit_interval(score, self.similarity)
-            new_document.score = score
-            candidate_docs.append(new_document)
-
-        return sorted(candidate_docs, key=lambda x: x.score if x.score is not None else 0.0, reverse=True)[0:top_k]
+        return results
 
     def update_embeddings(
         self,
@@ -569,6 +701,7 @@ class InMemoryDocumentStore(KeywordDocumentStore):
 
                 for doc, emb in zip(document_batch, embeddings):
                     self.indexes[index][doc.id].embedding = emb
+                    self.embedding_matrices[index].set(doc.id, emb)
                 progress_bar.set_description_str("Documents Processed")
                 progress_bar.update(batch_size)
 
@@ -585,7 +718,7 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         if headers:
             raise NotImplementedError("InMemoryDocumentStore does not support headers.")
 
-        documents = self._query(
+        documents = self._filter_documents(
             index=index, filters=filters, only_documents_without_embedding=only_documents_without_embedding
         )
         return len(documents)
@@ -602,12 +735,39 @@ class InMemoryDocumentStore(KeywordDocumentStore):
             index = self.index
         for key, value in meta.items():
             self.indexes[index][id].meta[key] = value
+        if index in self.meta_indexes:
+            self.meta_indexes[index].add(id, self.indexes[index][id].meta)
+
+    def get_document_fingerprints(
+        self,
+        fingerprint_field: str = "fingerprint",
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Returns the value of the metadata field `fingerprint_field` of all documents that have one, by document ID.
+
+        :param fingerprint_field: Name of the metadata field holding the fingerprints.
+        :param index: Name of the index to get the fingerprints from. If None, the DocumentStore's default index
+                      (self.index) will be used.
+        :param batch_size: Not used by InMemoryDocumentStore.
+        :param headers: Not supported by InMemoryDocumentStore.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+        index = index or self.index
+        return {
+            id: doc.meta[fingerprint_field]
+            for id, doc in self.indexes.get(index, {}).items()
+            if doc.meta.get(fingerprint_field) is not None
+        }
 
     def get_embedding_count(self, filters: Optional[FilterType] = None, index: Optional[str] = None) -> int:
         """
         Return the count of embeddings in the document store.
         """
-        documents = self.get_all_documents_generator(filters=filters, index=index, return_embedding=True)
+        documents = self._filter_documents(filters=filters, index=index)
         embedding_count = sum(doc.embedding is not None for doc in documents)
         return embedding_count
 
@@ -628,25 +788,62 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         return_embedding: Optional[bool] = None,
         only_documents_without_embedding: bool = False,
     ):
-        index = index or self.index
-        documents = deepcopy(list(self.indexes[index].values()))
-        documents = [d for d in documents if isinstance(d, Document)]
-
         if return_embedding is None:
             return_embedding = self.return_embedding
-        if return_embedding is False:
-            for doc in documents:
-                doc.embedding = None
+
+        documents = self._filter_documents(
+            index=index, filters=filters, only_documents_without_embedding=only_documents_without_embedding
+        )
+        return [self._copy_document(doc, return_embedding=return_embedding) for doc in documents]
+
+    def _filter_documents(
+        self,
+        index: Optional[str] = None,
+        filters: Optional[FilterType] = None,
+        only_documents_without_embedding: bool = False,
+    ) -> List[Document]:
+        """
+        Returns the stored documents matching the filters, without copying them.
+        """
+        index = index or self.index
+        compiled_filter = compile_filter(filters) if filters else None
+
+        candidate_ids = None
+        if compiled_filter is not None and index in self.meta_indexes:
+            candidate_ids = self.meta_indexes[index].find_candidates(compiled_filter.filter_clause)
+        if candidate_ids is not None:
+            documents = [self.indexes[index][doc_id] for doc_id in self.meta_indexes[index].sort(candidate_ids)]
+        else:
+            documents = [d for d in self.indexes[index].values() if isinstance(d, Document)]
 
         if only_documents_without_embedding:
             documents = [doc for doc in documents if doc.embedding is None]
-        if filters:
-            parsed_filter = LogicalFilterClause.parse(filters)
-            filtered_documents = list(filter(lambda doc: parsed_filter.evaluate(doc.meta), documents))
-        else:
-            filtered_documents = documents
+        if compiled_filter is not None:
+            predicate = compiled_filter.predicate
+            documents = [doc for doc in documents if predicate(doc.meta)]
 
-        return filtered_documents
+        return documents
+
+    def _get_meta_index(self, index: str) -> MetadataIndex:
+        if index not in self.meta_indexes:
+            self.meta_indexes[index] = MetadataIndex(fields=self.meta_index_fields or [])
+        return self.meta_indexes[index]
+
+    def _copy_document(self, document: Document, return_embedding: bool) -> Document:
+        """
+        Copies a stored document before it's returned, according to `copy_on_read`.
+        The embedding is only copied if it's returned.
+        """
+        new_document = copy(document)
+        if not return_embedding:
+            new_document.embedding = None
+        if self.copy_on_read:
+            new_document.meta = deepcopy(document.meta)
+            if isinstance(document.content, pd.DataFrame):
+                new_document.content = document.content.copy()
+            if return_embedding and document.embedding is not None:
+                new_document.embedding = document.embedding.copy()
+        return new_document
 
     def get_all_documents(
         self,
@@ -869,16 +1066,22 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         index = index or self.index
         if not filters and not ids:
             self.indexes[index] = {}
+            self.embedding_matrices.pop(index, None)
+            self.meta_indexes.pop(index, None)
             if index in self.bm25:
-                self.bm25[index] = {}
+                self.bm25[index] = BM25Index(algorithm=self.bm25_algorithm, **self.bm25_parameters)
             return
-        docs_to_delete = self.get_all_documents(index=index, filters=filters)
+        docs_to_delete = self._filter_documents(index=index, filters=filters)
         if ids:
-            docs_to_delete = [doc for doc in docs_to_delete if doc.id in ids]
+            ids_to_delete = set(ids)
+            docs_to_delete = [doc for doc in docs_to_delete if doc.id in ids_to_delete]
         for doc in docs_to_delete:
             del self.indexes[index][doc.id]
-        if self.use_bm25 is True and len(docs_to_delete) > 0:
-            self.update_bm25(index=index)
+            self.embedding_matrices[index].remove(doc.id)
+            if index in self.meta_indexes:
+                self.meta_indexes[index].remove(doc.id)
+            if index in self.bm25:
+                self.bm25[index].remove(doc.id)
 
     def delete_index(self, index: str):
         """
@@ -891,6 +1094,8 @@ class InMemoryDocumentStore(KeywordDocumentStore):
             del self.indexes[index]
             logger.info("Index '%s' deleted.", index)
 
+        self.embedding_matrices.pop(index, None)
+        self.meta_indexes.pop(index, None)
         if index in self.bm25:
             del self.bm25[index]
 
@@ -961,8 +1166,15 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         Scan through documents in DocumentStore and return a small number documents
         that are most relevant to the query as defined by the BM25 algorithm.
         :param query: The query.
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions. Only the documents matching the filters are scored.
+                        See `query_by_embedding` for the filter syntax.
         :param top_k: How many documents to return per query.
         :param index: The name of the index in the DocumentStore from which to retrieve documents.
+        :param all_terms_must_match: Whether all terms of the query must match the document.
+                                     If true all query terms must be present in a document in order to be retrieved (i.e the AND operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy AND fish AND restaurant").
+                                     Otherwise at least one query term must be present in a document in order to be retrieved (i.e the OR operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy OR fish OR restaurant").
+                                     Defaults to false.
         :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
         """
 
@@ -970,12 +1182,6 @@ class InMemoryDocumentStore(KeywordDocumentStore):
             logger.warning("InMemoryDocumentStore does not support headers. This parameter is ignored.")
         if custom_query:
             logger.warning("InMemoryDocumentStore does not support custom_query. This parameter is ignored.")
-        if all_terms_must_match is True:
-            logger.warning("InMemoryDocumentStore does not support all_terms_must_match. This parameter is ignored.")
-        if filters:
-            logger.warning(
-                "InMemoryDocumentStore does not support filters for BM25 retrieval. This parameter is ignored."
-            )
 
         index = index or self.index
         if index not in self.bm25:
@@ -986,21 +1192,14 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         if query is None:
             return []
 
-        tokenized_query = self.bm25_tokenization_regex(query.lower())
-        docs_scores = self.bm25[index].get_scores(tokenized_query)
-        if scale_score is True:
-            # scaling probability from BM25
-            docs_scores = [float(expit(np.asarray(score / 8))) for score in docs_scores]
-        top_docs_positions = np.argsort(docs_scores)[::-1][:top_k]
-
-        textual_docs_list = [doc for doc in self.indexes[index].values() if doc.content_type in ["text", "table"]]
-        top_docs = []
-        for i in top_docs_positions:
-            doc = textual_docs_list[i]
-            doc.score = docs_scores[i]
-            top_docs.append(doc)
-
-        return top_docs
+        return self._query_bm25(
+            queries=[query],
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            all_terms_must_match=all_terms_must_match,
+            scale_score=scale_score,
+        )[0]
 
     def query_batch(
         self,
@@ -1017,9 +1216,17 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         Scan through documents in DocumentStore and return a small number documents
         that are most relevant to the provided queries as defined by keyword matching algorithms like BM25.
         This method lets you find relevant documents for list of query strings (output: List of Lists of Documents).
+        Queries sharing the same filters are scored in one batch.
         :param query: The query.
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions. Can be a single filter that is applied to each query or a list of filters
+                        (one per query). See `query_by_embedding` for the filter syntax.
         :param top_k: How many documents to return per query.
         :param index: The name of the index in the DocumentStore from which to retrieve documents.
+        :param all_terms_must_match: Whether all terms of the query must match the document.
+                                     If true all query terms must be present in a document in order to be retrieved (i.e the AND operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy AND fish AND restaurant").
+                                     Otherwise at least one query term must be present in a document in order to be retrieved (i.e the OR operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy OR fish OR restaurant").
+                                     Defaults to false.
         :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
         """
 
@@ -1027,12 +1234,6 @@ class InMemoryDocumentStore(KeywordDocumentStore):
             logger.warning("InMemoryDocumentStore does not support headers. This parameter is ignored.")
         if custom_query:
             logger.warning("InMemoryDocumentStore does not support custom_query. This parameter is ignored.")
-        if all_terms_must_match is True:
-            logger.warning("InMemoryDocumentStore does not support all_terms_must_match. This parameter is ignored.")
-        if filters:
-            logger.warning(
-                "InMemoryDocumentStore does not support filters for BM25 retrieval. This parameter is ignored."
-            )
 
         index = index or self.index
         if index not in self.bm25:
@@ -1040,8 +1241,82 @@ class InMemoryDocumentStore(KeywordDocumentStore):
                 f"No BM25 representation found for the index: {index}. The Document store should be initialized with use_bm25=True"
             )
 
+        if not isinstance(filters, list):
+            return self._query_bm25(
+                queries=queries,
+                filters=filters,
+                top_k=top_k,
+                index=index,
+                all_terms_must_match=all_terms_must_match,
+                scale_score=scale_score,
+            )
+
+        if len(filters) != len(queries):
+            raise HaystackError(
+                "Number of filters does not match number of queries. Please provide as many filters"
+                " as queries or a single filter that will be applied to each query."
+            )
+        # Group the queries by filter so that each filter is only evaluated once
+        query_groups: List[Tuple[Optional[FilterType], List[int]]] = []
+        for i, query_filters in enumerate(filters):
+            for group_filters, positions in query_groups:
+                if group_filters == query_filters:
+                    positions.append(i)
+                    break
+            else:
+                query_groups.append((query_filters, [i]))
+
+        result_documents: List[List[Document]] = [[] for _ in queries]
+        for group_filters, positions in query_groups:
+            group_results = self._query_bm25(
+                queries=[queries[i] for i in positions],
+                filters=group_filters,
+                top_k=top_k,
+                index=index,
+                all_terms_must_match=all_terms_must_match,
+                scale_score=scale_score,
+            )
+            for i, documents in zip(positions, group_results):
+                result_documents[i] = documents
+        return result_documents
+
+    def _query_bm25(
+        self,
+        queries: List[str],
+        filters: Optional[FilterType],
+        top_k: int,
+        index: str,
+        all_terms_must_match: bool,
+        scale_score: bool,
+    ) -> List[List[Document]]:
+        """
+        Scores all queries against the BM25 representation of the index in one batch and returns the top_k
+        documents for each query. With filters, only the documents matching them are scored.
+        """
+        candidate_ids = None
+        if filters:
+            candidate_ids = [doc.id for doc in self._filter_documents(index=index, filters=filters)]
+
+        tokenized_queries = [self.bm25_tokenization_regex(query.lower()) for query in queries]
+        doc_ids, docs_scores = self.bm25[index].get_scores_batch(
+            tokenized_queries, doc_ids=candidate_ids, all_terms_must_match=all_terms_must_match
+        )
+        top_docs_positions = top_k_indices(docs_scores, top_k)
+        # Documents that don't contain all query terms are scored -inf and sorted last
+        docs_matching = docs_scores > -np.inf
+        if scale_score is True:
+            # scaling probability from BM25
+            docs_scores = expit(docs_scores / 8)
+
         result_documents = []
-        for query in queries:
-            result_documents.append(self.query(query=query, top_k=top_k, index=index, scale_score=scale_score))
+        for query_scores, query_matching, query_positions in zip(docs_scores, docs_matching, top_docs_positions):
+            top_docs = []
+            for i in query_positions:
+                if not query_matching[i]:
+                    break
+                doc = self._copy_document(self.indexes[index][doc_ids[i]], return_embedding=self.return_embedding)
+                doc.score = float(query_scores[i])
+                top_docs.append(doc)
+            result_documents.append(top_docs)
 
         return result_documents
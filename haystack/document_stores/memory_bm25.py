@@ -0,0 +1,313 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import logging
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+
+logger = logging.getLogger(__name__)
+
+
+BM25_ALGORITHMS = ("BM25Okapi", "BM25L", "BM25Plus")
+
+
+class BM25Index:
+    """
+    Incrementally maintained inverted index used by the InMemoryDocumentStore for BM25 retrieval.
+
+    Term frequencies, document lengths and document frequencies are updated in place whenever documents are added or
+    removed, so adding N documents costs O(N) tokens regardless of the size of the index. The IDF values and the
+    sparse document-term weight matrix used for scoring are rebuilt lazily at query time, and only when the index
+    changed since the last query. A batch of queries is then scored with a single sparse matrix product.
+
+    The scoring functions match the ones of the `rank_bm25` package (https://github.com/dorianbrown/rank_bm25).
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "BM25Okapi",
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        delta: Optional[float] = None,
+    ):
+        """
+        :param algorithm: The BM25 variant to score documents with.
+                          Parameter options : ( 'BM25Okapi', 'BM25L', 'BM25Plus')
+        :param k1: Term frequency saturation parameter.
+        :param b: Document length normalization parameter.
+        :param epsilon: Floor for negative IDF values, as a fraction of the average IDF. Only used by BM25Okapi.
+        :param delta: Lower bound of the term frequency normalization. Only used by BM25L (default 0.5) and
+                      BM25Plus (default 1.0).
+        """
+        if algorithm not in BM25_ALGORITHMS:
+            raise ValueError(f"Unknown BM25 algorithm '{algorithm}'. Choose one of {', '.join(BM25_ALGORITHMS)}.")
+        self.algorithm = algorithm
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        if delta is None:
+            delta = 0.5 if algorithm == "BM25L" else 1.0
+        self.delta = delta
+
+        self.vocabulary: Dict[str, int] = {}
+        self._doc_freqs = np.zeros(0, dtype=np.int64)
+        # row -> (term ids, term frequencies), needed to build the weight matrix and to remove a document
+        self._doc_terms: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._doc_len = np.zeros(0, dtype=np.float64)
+        self._row_ids: List[Optional[str]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._total_len = 0
+        self._cache: Optional[_Weights] = None
+
+    @property
+    def corpus_size(self) -> int:
+        return len(self._id_to_row)
+
+    @property
+    def avgdl(self) -> float:
+        return self._total_len / self.corpus_size if self.corpus_size else 0.0
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._id_to_row
+
+    def add(self, doc_id: str, tokens: List[str]):
+        """
+        Add the tokens of a document to the index. If a document with the same id is already indexed, it is replaced.
+        """
+        if doc_id in self._id_to_row:
+            self.remove(doc_id)
+
+        row = len(self._row_ids)
+        self._row_ids.append(doc_id)
+        self._id_to_row[doc_id] = row
+        if row >= len(self._doc_len):
+            self._doc_len = np.resize(self._doc_len, max(16, 2 * len(self._doc_len)))
+        self._doc_len[row] = len(tokens)
+        self._total_len += len(tokens)
+
+        term_freqs = Counter(tokens)
+        term_ids = np.fromiter(
+            (self.vocabulary.setdefault(term, len(self.vocabulary)) for term in term_freqs),
+            dtype=np.int64,
+            count=len(term_freqs),
+        )
+        if len(self.vocabulary) > len(self._doc_freqs):
+            new_doc_freqs = np.zeros(max(1024, 2 * len(self.vocabulary)), dtype=np.int64)
+            new_doc_freqs[: len(self._doc_freqs)] = self._doc_freqs
+            self._doc_freqs = new_doc_freqs
+        self._doc_freqs[term_ids] += 1
+        self._doc_terms[row] = (term_ids, np.fromiter(term_freqs.values(), dtype=np.float64, count=len(term_freqs)))
+        self._cache = None
+
+    def remove(self, doc_id: str):
+        """
+        Remove a document from the index. Unknown ids are ignored.
+        """
+        row = self._id_to_row.pop(doc_id, None)
+        if row is None:
+            return
+        self._row_ids[row] = None
+        self._total_len -= int(self._doc_len[row])
+        self._doc_len[row] = 0
+        term_ids, _ = self._doc_terms.pop(row)
+        self._doc_freqs[term_ids] -= 1
+        self._cache = None
+
+        # Rows of removed documents are recycled once they make up the majority of the index
+        if len(self._row_ids) > 1024 and self.corpus_size < len(self._row_ids) // 2:
+            self._compact()
+
+    def _compact(self):
+        live_rows = [row for row, doc_id in enumerate(self._row_ids) if doc_id is not None]
+        self._doc_terms = {new_row: self._doc_terms[old_row] for new_row, old_row in enumerate(live_rows)}
+        self._doc_len = self._doc_len[live_rows]
+        self._row_ids = [self._row_ids[row] for row in live_rows]
+        self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._row_ids)}  # type: ignore [misc]
+
+    def _calc_idf(self) -> np.ndarray:
+        corpus_size = self.corpus_size
+        doc_freqs = self._doc_freqs[: len(self.vocabulary)].astype(np.float64)
+        # terms whose documents were all removed are not part of the corpus anymore
+        in_corpus = doc_freqs > 0
+        idf = np.zeros_like(doc_freqs)
+        if not in_corpus.any():
+            return idf
+        if self.algorithm == "BM25Okapi":
+            idf[in_corpus] = np.log(corpus_size - doc_freqs[in_corpus] + 0.5) - np.log(doc_freqs[in_corpus] + 0.5)
+            eps = self.epsilon * idf[in_corpus].mean()
+            idf[in_corpus & (idf < 0)] = eps
+        elif self.algorithm == "BM25L":
+            idf[in_corpus] = np.log(corpus_size + 1) - np.log(doc_freqs[in_corpus] + 0.5)
+        else:
+            idf[in_corpus] = np.log((corpus_size + 1) / doc_freqs[in_corpus])
+        return idf
+
+    def _get_weights(self) -> "_Weights":
+        """
+        Returns the IDF vector and the matrices of term frequency weights used for scoring, rebuilding them if the
+        index changed since the last query.
+        """
+        if self._cache is not None:
+            return self._cache
+
+        live_rows = sorted(self._doc_terms.keys())
+        row_terms = [self._doc_terms[row] for row in live_rows]
+        nnz_per_row = np.fromiter((len(term_ids) for term_ids, _ in row_terms), dtype=np.int64, count=len(row_terms))
+        indptr = np.concatenate(([0], np.cumsum(nnz_per_row)))
+        if row_terms:
+            indices = np.concatenate([term_ids for term_ids, _ in row_terms])
+            freqs = np.concatenate([term_freqs for _, term_freqs in row_terms])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+            freqs = np.zeros(0, dtype=np.float64)
+
+        doc_len = np.repeat(self._doc_len[live_rows], nnz_per_row)
+        length_norm = 1 - self.b + self.b * doc_len / self.avgdl if self.avgdl else np.ones_like(doc_len)
+        if self.algorithm == "BM25Okapi":
+            data = freqs * (self.k1 + 1) / (freqs + self.k1 * length_norm)
+        elif self.algorithm == "BM25L":
+            ctd = freqs / length_norm
+            data = freqs * (self.k1 + 1) * (ctd + self.delta) / (self.k1 + ctd + self.delta)
+        else:
+            data = freqs * (self.k1 + 1) / (self.k1 * length_norm + freqs)
+
+        doc_term_weights = sparse.csr_matrix((data, indices, indptr), shape=(len(live_rows), len(self.vocabulary)))
+        doc_ids: List[str] = [self._row_ids[row] for row in live_rows]  # type: ignore [misc]
+        self._cache = _Weights(
+            idf=self._calc_idf(),
+            doc_term_weights=doc_term_weights,
+            term_doc_weights=doc_term_weights.T.tocsr(),
+            doc_ids=doc_ids,
+            columns={doc_id: column for column, doc_id in enumerate(doc_ids)},
+        )
+        return self._cache
+
+    def get_scores_batch(
+        self,
+        queries_tokens: List[List[str]],
+        doc_ids: Optional[Iterable[str]] = None,
+        all_terms_must_match: bool = False,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Score the indexed documents against a batch of tokenized queries with one sparse matrix product.
+
+        :param queries_tokens: The tokens of each query.
+        :param doc_ids: Restrict scoring to these documents, for example the ones matching a filter. The cost of
+                        scoring is then proportional to the size of these documents rather than to the size of the
+                        index. Ids that aren't indexed are ignored. By default, all indexed documents are scored.
+        :param all_terms_must_match: Whether a document must contain all the terms of a query to match it. The
+                                     documents that don't are given a score of `-inf`.
+        :return: A tuple of the document ids and a (number of queries x number of documents) array of their BM25
+                 scores, with the columns in the same order as the ids.
+        """
+        weights = self._get_weights()
+        if doc_ids is None:
+            columns = None
+            scored_ids = weights.doc_ids
+        else:
+            # Keep the column order so that ties are broken the same way as when scoring all documents
+            columns = np.sort(
+                np.fromiter(
+                    (weights.columns[doc_id] for doc_id in doc_ids if doc_id in weights.columns), dtype=np.int64
+                )
+            )
+            scored_ids = [weights.doc_ids[column] for column in columns]
+        if not queries_tokens or not scored_ids:
+            return scored_ids, np.zeros((len(queries_tokens), len(scored_ids)), dtype=np.float64)
+
+        # Queries become a sparse (queries x terms) matrix of IDF-weighted query term counts
+        query_rows: List[int] = []
+        query_cols: List[int] = []
+        for i, tokens in enumerate(queries_tokens):
+            for token in tokens:
+                term_id = self.vocabulary.get(token)
+                if term_id is not None:
+                    query_rows.append(i)
+                    query_cols.append(term_id)
+        query_matrix = sparse.csr_matrix(
+            (weights.idf[query_cols], (query_rows, query_cols)), shape=(len(queries_tokens), len(self.vocabulary))
+        )
+
+        if columns is None:
+            scores = (query_matrix @ weights.term_doc_weights).toarray()
+        else:
+            # Row slicing only touches the candidate documents
+            scores = (weights.doc_term_weights[columns] @ query_matrix.T).T.toarray()
+        if self.algorithm == "BM25Plus":
+            # BM25Plus gives every document a non-zero contribution for each known query term
+            scores += self.delta * np.asarray(query_matrix.sum(axis=1))
+
+        if all_terms_must_match:
+            for i, tokens in enumerate(queries_tokens):
+                matching_columns = self._get_matching_columns(tokens)
+                if matching_columns is None:
+                    continue
+                if columns is not None:
+                    matching_columns = np.isin(columns, matching_columns).nonzero()[0]
+                mask = np.ones(len(scored_ids), dtype=bool)
+                mask[matching_columns] = False
+                scores[i, mask] = -np.inf
+        return scored_ids, scores
+
+    def _get_matching_columns(self, tokens: List[str]) -> Optional[np.ndarray]:
+        """
+        Returns the columns of the documents containing all the tokens by intersecting their posting lists, or None
+        if there are no tokens.
+        """
+        if not tokens:
+            return None
+        term_doc_weights = self._get_weights().term_doc_weights
+        postings = []
+        for token in set(tokens):
+            term_id = self.vocabulary.get(token)
+            if term_id is None:
+                return np.zeros(0, dtype=np.int64)
+            postings.append(
+                term_doc_weights.indices[term_doc_weights.indptr[term_id] : term_doc_weights.indptr[term_id + 1]]
+            )
+        postings.sort(key=len)
+        matching_columns = postings[0]
+        for posting in postings[1:]:
+            matching_columns = np.intersect1d(matching_columns, posting, assume_unique=True)
+        return matching_columns
+
+    def get_scores(
+        self, query_tokens: List[str], doc_ids: Optional[Iterable[str]] = None, all_terms_must_match: bool = False
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Score the indexed documents against a tokenized query. See `get_scores_batch()` for the parameters.
+
+        :return: A tuple of the document ids and their BM25 scores, in the same order.
+        """
+        doc_ids, scores = self.get_scores_batch(
+            [query_tokens], doc_ids=doc_ids, all_terms_must_match=all_terms_must_match
+        )
+        return doc_ids, scores[0]
+
+
+class _Weights(NamedTuple):
+    idf: np.ndarray
+    # (documents x terms), to score a subset of the documents
+    doc_term_weights: sparse.csr_matrix
+    # (terms x documents), to score all documents touching only the postings of the query terms
+    term_doc_weights: sparse.csr_matrix
+    doc_ids: List[str]
+    columns: Dict[str, int]
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Returns the indices of the `top_k` highest values along the last axis of `scores`, sorted in descending order of
+    the scores. Uses `np.argpartition` so only the top_k candidates are sorted.
+    """
+    num_candidates = scores.shape[-1]
+    if top_k <= 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.int64)
+    if top_k >= num_candidates:
+        return np.argsort(-scores, axis=-1, kind="stable")
+    partition = np.argpartition(-scores, top_k - 1, axis=-1)[..., :top_k]
+    order = np.argsort(-np.take_along_axis(scores, partition, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(partition, order, axis=-1)
@@ -0,0 +1,117 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import logging
+
+import numpy as np
+
+from haystack.errors import DocumentStoreError
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingMatrix:
+    """
+    Contiguous float32 matrix of document embeddings used by the InMemoryDocumentStore for vector similarity search.
+
+    The matrix is preallocated and grows geometrically, so writing documents doesn't copy the existing embeddings.
+    Removing a document moves the last row into the freed slot, which keeps the live rows contiguous and lets a query
+    without filters score the whole matrix with a single matrix product. The L2 norms of the rows are stored alongside
+    the embeddings so that cosine similarity doesn't need to re-normalize the documents for each query.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._embeddings: Optional[np.ndarray] = None
+        self._norms = np.zeros(0, dtype=np.float32)
+
+    @property
+    def embedding_dim(self) -> Optional[int]:
+        return None if self._embeddings is None else self._embeddings.shape[1]
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """
+        View on the embeddings of all documents, in the order of `ids`.
+        """
+        if self._embeddings is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._embeddings[: len(self.ids)]
+
+    @property
+    def norms(self) -> np.ndarray:
+        return self._norms[: len(self.ids)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._id_to_row
+
+    def check_dimensions(self, embeddings: Iterable[Tuple[str, Any]]):
+        """
+        Raise a DocumentStoreError if one of the (document id, embedding) pairs can't be added with `set()` because
+        its dimension differs from the one of the matrix or of the embeddings before it. The matrix isn't changed.
+        """
+        dimension = self._embeddings.shape[1] if self._embeddings is not None else None
+        for doc_id, embedding in embeddings:
+            embedding_dimension = np.asarray(embedding).size
+            if dimension is None:
+                dimension = embedding_dimension
+            elif embedding_dimension != dimension:
+                raise DocumentStoreError(
+                    f"Embedding of document '{doc_id}' has dimension {embedding_dimension}, "
+                    f"but the other documents in the index have dimension {dimension}."
+                )
+
+    def set(self, doc_id: str, embedding: np.ndarray):
+        """
+        Add the embedding of a document or replace it if the document is already part of the matrix.
+        """
+        embedding = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self._embeddings is None:
+            self._embeddings = np.zeros((16, embedding.shape[0]), dtype=np.float32)
+            self._norms = np.zeros(16, dtype=np.float32)
+        else:
+            self.check_dimensions([(doc_id, embedding)])
+
+        row = self._id_to_row.get(doc_id)
+        if row is None:
+            row = len(self.ids)
+            if row == self._embeddings.shape[0]:
+                self._grow()
+            self.ids.append(doc_id)
+            self._id_to_row[doc_id] = row
+        self._embeddings[row] = embedding
+        self._norms[row] = np.linalg.norm(embedding)
+
+    def remove(self, doc_id: str):
+        """
+        Remove the embedding of a document. Unknown ids are ignored.
+        """
+        row = self._id_to_row.pop(doc_id, None)
+        if row is None:
+            return
+        last_row = len(self.ids) - 1
+        last_id = self.ids.pop()
+        if row != last_row:
+            self._embeddings[row] = self._embeddings[last_row]  # type: ignore [index]
+            self._norms[row] = self._norms[last_row]
+            self.ids[row] = last_id
+            self._id_to_row[last_id] = row
+
+    def rows(self, doc_ids: Iterable[str]) -> np.ndarray:
+        """
+        Returns the rows of the given documents. Documents without an embedding are skipped.
+        """
+        return np.fromiter((self._id_to_row[doc_id] for doc_id in doc_ids if doc_id in self._id_to_row), dtype=np.int64)
+
+    def _grow(self):
+        capacity = 2 * self._embeddings.shape[0]  # type: ignore [union-attr]
+        embeddings = np.zeros((capacity, self._embeddings.shape[1]), dtype=np.float32)  # type: ignore [union-attr]
+        embeddings[: len(self.ids)] = self.embeddings
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: len(self.ids)] = self.norms
+        self._embeddings = embeddings
+        self._norms = norms
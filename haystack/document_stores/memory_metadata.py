@@ -0,0 +1,217 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import math
+import logging
+from bisect import bisect_left, bisect_right
+
+from haystack.document_stores.filter_utils import (
+    LogicalFilterClause,
+    ComparisonOperation,
+    AndOperation,
+    OrOperation,
+    EqOperation,
+    InOperation,
+    GtOperation,
+    GteOperation,
+    LtOperation,
+    LteOperation,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class _FieldIndex:
+    """
+    Secondary index over the values of a single metadata field: a hash index from values to document ids, plus
+    sorted arrays of the distinct numeric and string values for range lookups. The sorted arrays are rebuilt lazily
+    when the set of distinct values changed.
+    """
+
+    def __init__(self):
+        self.values: Dict[Any, Set[str]] = {}
+        # Ids of documents whose value can't be used as a dictionary key (lists, dicts, ...)
+        self.unhashable: Set[str] = set()
+        # Ids of documents per value category, to know which documents a range lookup can't reason about
+        self.categories: Dict[str, Set[str]] = {"number": set(), "string": set(), "other": set()}
+        self._sorted: Optional[Dict[str, List[Any]]] = None
+
+    @staticmethod
+    def category(value: Any) -> str:
+        if isinstance(value, (int, float)) and not (isinstance(value, float) and math.isnan(value)):
+            return "number"
+        if isinstance(value, str):
+            return "string"
+        return "other"
+
+    def add(self, doc_id: str, value: Any):
+        try:
+            ids = self.values.get(value)
+        except TypeError:
+            self.unhashable.add(doc_id)
+            return
+        if ids is None:
+            ids = self.values[value] = set()
+            self._sorted = None
+        ids.add(doc_id)
+        self.categories[self.category(value)].add(doc_id)
+
+    def remove(self, doc_id: str, value: Any):
+        try:
+            ids = self.values.get(value)
+        except TypeError:
+            self.unhashable.discard(doc_id)
+            return
+        if ids is None:
+            return
+        ids.discard(doc_id)
+        self.categories[self.category(value)].discard(doc_id)
+        if not ids:
+            del self.values[value]
+            self._sorted = None
+
+    def lookup(self, values: Iterable[Any]) -> Optional[Set[str]]:
+        """
+        Returns the ids of the documents whose value is equal to one of `values`, plus the ones that can't be looked
+        up by value. Returns None if one of the values isn't hashable.
+        """
+        candidates = set(self.unhashable)
+        for value in values:
+            try:
+                candidates.update(self.values.get(value, ()))
+            except TypeError:
+                return None
+        return candidates
+
+    def lookup_range(self, lower: Any = None, upper: Any = None, lower_inclusive=True, upper_inclusive=True):
+        """
+        Returns the ids of the documents whose value lies in the given range, plus the ones whose value isn't
+        comparable with the bounds. Returns None if the bounds can't be used for a range lookup.
+        """
+        bound = lower if lower is not None else upper
+        category = self.category(bound)
+        if category == "other" or (lower is not None and upper is not None and self.category(upper) != category):
+            return None
+
+        if self._sorted is None:
+            self._sorted = {
+                category: sorted(value for value in self.values if self.category(value) == category)
+                for category in ("number", "string")
+            }
+        sorted_values = self._sorted[category]
+        start = 0
+        end = len(sorted_values)
+        if lower is not None:
+            start = bisect_left(sorted_values, lower) if lower_inclusive else bisect_right(sorted_values, lower)
+        if upper is not None:
+            end = bisect_right(sorted_values, upper) if upper_inclusive else bisect_left(sorted_values, upper)
+
+        candidates = set(self.unhashable)
+        for other_category, ids in self.categories.items():
+            if other_category != category:
+                candidates.update(ids)
+        for value in sorted_values[start:end]:
+            candidates.update(self.values[value])
+        return candidates
+
+
+class MetadataIndex:
+    """
+    Secondary indexes over selected metadata fields, used by the InMemoryDocumentStore to narrow down the documents
+    that a filter needs to be evaluated on.
+
+    `find_candidates()` resolves the `$eq`, `$in`, `$gt`, `$gte`, `$lt` and `$lte` conditions on indexed fields
+    with hash lookups and binary searches over sorted values and combines them with set intersections (`$and`) and
+    unions (`$or`). The result is a superset of the matching documents: conditions that can't be resolved with an
+    index (for example `$ne`, `$not` or conditions on fields that aren't indexed) don't narrow down the candidates,
+    so the filter still needs to be evaluated on each candidate.
+    """
+
+    def __init__(self, fields: List[str]):
+        """
+        :param fields: The metadata fields to index.
+        """
+        self.fields = fields
+        self._field_indexes: Dict[str, _FieldIndex] = {field: _FieldIndex() for field in fields}
+        # id -> (insertion position, {field: indexed value})
+        self._documents: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._next_position = 0
+
+    def add(self, doc_id: str, meta: Dict[str, Any]):
+        """
+        Index the metadata of a document. If the document is already indexed, its previous values are replaced but
+        it keeps its position.
+        """
+        previous = self._documents.get(doc_id)
+        if previous is None:
+            position = self._next_position
+            self._next_position += 1
+        else:
+            position = previous[0]
+            self.remove(doc_id)
+
+        indexed_values = {field: meta[field] for field in self.fields if field in meta}
+        for field, value in indexed_values.items():
+            self._field_indexes[field].add(doc_id, value)
+        self._documents[doc_id] = (position, indexed_values)
+
+    def remove(self, doc_id: str):
+        """
+        Remove a document from the indexes. Unknown ids are ignored.
+        """
+        previous = self._documents.pop(doc_id, None)
+        if previous is None:
+            return
+        for field, value in previous[1].items():
+            self._field_indexes[field].remove(doc_id, value)
+
+    def sort(self, doc_ids: Iterable[str]) -> List[str]:
+        """
+        Sorts document ids in the order in which the documents were first indexed.
+        """
+        return sorted(doc_ids, key=lambda doc_id: self._documents[doc_id][0])
+
+    def find_candidates(self, filter_clause: Union[LogicalFilterClause, ComparisonOperation]) -> Optional[Set[str]]:
+        """
+        Returns the ids of the documents that can match the parsed filter, or None if the indexes can't narrow down
+        the documents.
+
+        :param filter_clause: A filter parsed with `LogicalFilterClause.parse()`.
+        """
+        if isinstance(filter_clause, AndOperation):
+            candidates: Optional[Set[str]] = None
+            # Intersect the smallest sets first
+            condition_candidates = [self.find_candidates(condition) for condition in filter_clause.conditions]
+            for ids in sorted((ids for ids in condition_candidates if ids is not None), key=len):
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    break
+            return candidates
+
+        if isinstance(filter_clause, OrOperation):
+            candidates = set()
+            for condition in filter_clause.conditions:
+                ids = self.find_candidates(condition)
+                if ids is None:
+                    return None
+                candidates |= ids
+            return candidates
+
+        if not isinstance(filter_clause, ComparisonOperation) or filter_clause.field_name not in self._field_indexes:
+            return None
+
+        field_index = self._field_indexes[filter_clause.field_name]
+        value = filter_clause.comparison_value
+        if isinstance(filter_clause, EqOperation):
+            return field_index.lookup([value])
+        if isinstance(filter_clause, InOperation):
+            return field_index.lookup(value) if isinstance(value, list) else None
+        if isinstance(filter_clause, GtOperation):
+            return field_index.lookup_range(lower=value, lower_inclusive=False)
+        if isinstance(filter_clause, GteOperation):
+            return field_index.lookup_range(lower=value)
+        if isinstance(filter_clause, LtOperation):
+            return field_index.lookup_range(upper=value, upper_inclusive=False)
+        if isinstance(filter_clause, LteOperation):
+            return field_index.lookup_range(upper=value)
+        return None
@@ -1,11 +1,16 @@
 # pylint: disable=too-many-public-methods
 
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
-from typing import List, Optional, Union, Dict, Any, Generator
+from pathlib import Path
+from typing import Deque, Iterable, List, Optional, Set, TypeVar, Union, Dict, Any, Generator
 from abc import abstractmethod
 import json
 import logging
+import queue
+import threading
 import time
 from string import Template
 
@@ -24,6 +29,8 @@ from haystack.utils.scipy_utils import expit
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def prepare_hosts(host, port):
     """
@@ -42,6 +49,48 @@ def prepare_hosts(host, port):
     return hosts
 
 
+def _prefetch(items: Iterable[T], max_prefetch: int) -> Generator[T, None, None]:
+    """
+    Yields `items` while a background thread already fetches up to `max_prefetch` of the next ones.
+    Exceptions raised while fetching are re-raised in the consumer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_prefetch)
+    done = object()
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except Exception as e:
+            put((done, e))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        # Unblocks the producer if the consumer stops early
+        stopped.set()
+
+
 class SearchEngineDocumentStore(KeywordDocumentStore):
     """
     Base class implementing the common logic for Elasticsearch and Opensearch
@@ -523,6 +572,34 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         body = {"doc": meta}
         self.client.update(index=index, id=id, **body, refresh=self.refresh_type, headers=headers)
 
+    def get_document_fingerprints(
+        self,
+        fingerprint_field: str = "fingerprint",
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Returns the value of the metadata field `fingerprint_field` of all documents that have one, by document ID.
+        Only the fingerprint field of the documents is fetched.
+
+        :param fingerprint_field: Name of the metadata field holding the fingerprints.
+        :param index: Name of the index to get the fingerprints from. If None, the DocumentStore's default index
+                      (self.index) will be used.
+        :param batch_size: Number of documents to fetch per scroll request.
+        :param headers: Custom HTTP headers to pass to the client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
+                Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        """
+        index = index or self.index
+        body = {
+            "query": {"bool": {"filter": [{"exists": {"field": fingerprint_field}}]}},
+            "_source": [fingerprint_field],
+        }
+        result = self._do_scan(
+            self.client, query=body, index=index, size=batch_size, scroll=self.scroll, headers=headers
+        )
+        return {hit["_id"]: hit["_source"][fingerprint_field] for hit in result}
+
     def get_document_count(
         self,
         filters: Optional[FilterType] = None,
@@ -1325,6 +1402,8 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         update_existing_embeddings: bool = True,
         batch_size: int = 10_000,
         headers: Optional[Dict[str, str]] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        max_pending_batches: int = 2,
     ):
         """
         Updates the embeddings in the the document store using the encoding model specified in the retriever.
@@ -1365,6 +1444,13 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         :param batch_size: When working with large number of documents, batching can help reduce memory footprint.
         :param headers: Custom HTTP headers to pass to the client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
                 Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        :param checkpoint_path: Optional path of a file that records the IDs of the documents whose embeddings were
+                                written. If an update is interrupted, calling this method again with the same path
+                                skips these documents instead of embedding them again. The file is deleted once all
+                                embeddings are updated.
+        :param max_pending_batches: How many batches may wait to be embedded and to be written at the same time.
+                                    Higher values smooth out differences in speed between embedding and indexing at
+                                    the cost of keeping more batches in memory.
         :return: None
         """
         if index is None:
@@ -1400,9 +1486,32 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
         logging.getLogger(__name__).setLevel(logging.CRITICAL)
 
-        with tqdm(total=document_count, position=0, unit=" Docs", desc="Updating embeddings") as progress_bar:
-            for result_batch in get_batches_from_generator(result, batch_size):
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        finished_ids: Set[str] = set()
+        if checkpoint is not None and checkpoint.exists():
+            finished_ids = set(checkpoint.read_text(encoding="utf-8").split())
+
+        def write_batch(doc_updates: List[Dict[str, Any]]):
+            self._bulk(documents=doc_updates, request_timeout=300, refresh=self.refresh_type, headers=headers)
+            if checkpoint is not None:
+                with open(checkpoint, "a", encoding="utf-8") as checkpoint_file:
+                    checkpoint_file.writelines(f"{update['_id']}\n" for update in doc_updates)
+            progress_bar.update(len(doc_updates))
+
+        # Scrolling, embedding and writing overlap: the next batches are fetched in the background while the current
+        # one is embedded, and bulk writes run on a separate thread. Up to `max_pending_batches` batches wait in each
+        # stage before the previous stage blocks, so memory stays bounded when one of them is slower.
+        with tqdm(
+            total=document_count, position=0, unit=" Docs", desc="Updating embeddings"
+        ) as progress_bar, ThreadPoolExecutor(max_workers=1) as writer:
+            pending_writes: Deque[Future] = deque()
+            for result_batch in _prefetch(get_batches_from_generator(result, batch_size), max_pending_batches):
                 document_batch = [self._convert_es_hit_to_document(hit) for hit in result_batch]
+                if finished_ids:
+                    progress_bar.update(sum(doc.id in finished_ids for doc in document_batch))
+                    document_batch = [doc for doc in document_batch if doc.id not in finished_ids]
+                    if not document_batch:
+                        continue
                 embeddings = self._embed_documents(document_batch, retriever)
 
                 doc_updates = []
@@ -1415,8 +1524,15 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
                     }
                     doc_updates.append(update)
 
-                self._bulk(documents=doc_updates, request_timeout=300, refresh=self.refresh_type, headers=headers)
-                progress_bar.update(batch_size)
+                pending_writes.append(writer.submit(write_batch, doc_updates))
+                while len(pending_writes) > max_pending_batches:
+                    pending_writes.popleft().result()
+
+            while pending_writes:
+                pending_writes.popleft().result()
+
+        if checkpoint is not None and checkpoint.exists():
+            checkpoint.unlink()
 
     def _embed_documents(self, documents: List[Document], retriever: DenseRetriever) -> np.ndarray:
         """
@@ -222,9 +222,47 @@ class SQLDocumentStore(BaseDocumentStore):
             for row in query.all():
                 documents.append(self._convert_sql_row_to_document(row))
 
-        sorted_documents = sorted(documents, key=lambda doc: vector_ids.index(doc.meta["vector_id"]))
+        positions = {vector_id: position for position, vector_id in enumerate(vector_ids)}
+        sorted_documents = sorted(documents, key=lambda doc: positions[doc.meta["vector_id"]])
         return sorted_documents
 
+    def _get_vector_ids(self, filters: Optional[FilterType] = None, index: Optional[str] = None) -> List[str]:
+        """
+        Returns the vector ids of the documents that match the filters and have an embedding.
+
+        :param filters: Optional filters to select the documents. If None, the vector ids of all documents are
+                        returned.
+        :param index: Name of the index to get the vector ids from. If None, the DocumentStore's default index
+                      (self.index) will be used.
+        """
+        index = index or self.index
+        vector_ids_query = self.session.query(DocumentORM.vector_id).filter(
+            DocumentORM.index == index, DocumentORM.vector_id.isnot(None)
+        )
+        if filters:
+            parsed_filter = LogicalFilterClause.parse(filters)
+            select_ids = parsed_filter.convert_to_sql(MetaDocumentORM)
+            vector_ids_query = vector_ids_query.filter(DocumentORM.id.in_(select_ids))
+        return [row.vector_id for row in vector_ids_query]
+
+    def _get_vector_ids_by_document_id(
+        self, ids: List[str], index: Optional[str] = None, batch_size: int = 10_000
+    ) -> Dict[str, str]:
+        """
+        Returns a mapping of document ids to vector ids for the given documents that have an embedding.
+        """
+        index = index or self.index
+        vector_ids = {}
+        for i in range(0, len(ids), batch_size):
+            query = self.session.query(DocumentORM.id, DocumentORM.vector_id).filter(
+                DocumentORM.id.in_(ids[i : i + batch_size]),
+                DocumentORM.index == index,
+                DocumentORM.vector_id.isnot(None),
+            )
+            for row in query:
+                vector_ids[row.id] = row.vector_id
+        return vector_ids
+
     def get_all_documents(
         self,
         index: Optional[str] = None,
@@ -543,6 +581,34 @@ class SQLDocumentStore(BaseDocumentStore):
             self.session.add(m)
         self.session.commit()
 
+    def get_document_fingerprints(
+        self,
+        fingerprint_field: str = "fingerprint",
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Returns the value of the metadata field `fingerprint_field` of all documents that have one, by document ID.
+        Only reads the metadata table.
+
+        :param fingerprint_field: Name of the metadata field holding the fingerprints.
+        :param index: Name of the index to get the fingerprints from. If None, the DocumentStore's default index
+                      (self.index) will be used.
+        :param batch_size: Number of rows to fetch at a time.
+        :param headers: Not supported by SQLDocumentStore.
+        """
+        if headers:
+            raise NotImplementedError("SQLDocumentStore does not support headers.")
+
+        index = index or self.index
+        query = (
+            self.session.query(MetaDocumentORM.document_id, MetaDocumentORM.value)
+            .filter(MetaDocumentORM.name == fingerprint_field, MetaDocumentORM.document_index == index)
+            .yield_per(batch_size)
+        )
+        return {document_id: value for document_id, value in query if value is not None}
+
     def get_document_count(
         self,
         filters: Optional[FilterType] = None,
@@ -14,6 +14,8 @@ from haystack import __version__
 HAYSTACK_REMOTE_API_BACKOFF_SEC = "HAYSTACK_REMOTE_API_BACKOFF_SEC"
 HAYSTACK_REMOTE_API_MAX_RETRIES = "HAYSTACK_REMOTE_API_MAX_RETRIES"
 HAYSTACK_REMOTE_API_TIMEOUT_SEC = "HAYSTACK_REMOTE_API_TIMEOUT_SEC"
+HAYSTACK_REMOTE_API_POOL_SIZE = "HAYSTACK_REMOTE_API_POOL_SIZE"
+HAYSTACK_REMOTE_API_MAX_CONCURRENCY = "HAYSTACK_REMOTE_API_MAX_CONCURRENCY"
 HAYSTACK_PROMPT_TEMPLATE_ALLOWED_FUNCTIONS = "HAYSTACK_PROMPT_TEMPLATE_ALLOWED_FUNCTIONS"
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,7 @@ from transformers import PreTrainedTokenizer, AutoTokenizer
 
 from haystack.errors import HaystackError
 from haystack.modeling.model.feature_extraction import (
+    DocumentTokenizationCache,
     tokenize_batch_question_answering,
     tokenize_with_metadata,
     truncate_sequences,
@@ -382,6 +383,7 @@ class SquadProcessor(Processor):
         max_query_length: int = 64,
         proxies: Optional[dict] = None,
         max_answers: int = 6,
+        document_cache_size: int = 0,
         **kwargs,
     ):
         """
@@ -404,6 +406,9 @@ class SquadProcessor(Processor):
         :param proxies: proxy configuration to allow downloads of remote datasets.
                         Format as in  "requests" library: https://2.python-requests.org//en/latest/user/advanced/#proxies
         :param max_answers: number of answers to be converted. QA dev or train sets can contain multi-way annotations, which are converted to arrays of max_answer length
+        :param document_cache_size: number of tokenized documents to keep between calls of `dataset_from_dicts()`, so
+                                    that documents that are passed again, e.g. for another query, aren't tokenized again.
+                                    0 disables the cache.
         :param kwargs: placeholder for passing generic parameters
         """
         self.ph_output_type = "per_token_squad"
@@ -425,6 +430,8 @@ class SquadProcessor(Processor):
         self.doc_stride = doc_stride
         self.max_query_length = max_query_length
         self.max_answers = max_answers
+        self.document_cache_size = document_cache_size
+        self._document_cache: Optional[DocumentTokenizationCache] = None
         super(SquadProcessor, self).__init__(
             tokenizer=tokenizer,
             max_seq_len=max_seq_len,
@@ -464,7 +471,9 @@ class SquadProcessor(Processor):
         pre_baskets = [self.convert_qa_input_dict(x) for x in dicts]  # TODO move to input object conversion
 
         # Tokenize documents and questions
-        baskets = tokenize_batch_question_answering(pre_baskets, self.tokenizer, indices)
+        baskets = tokenize_batch_question_answering(
+            pre_baskets, self.tokenizer, indices, document_cache=self._get_document_cache()
+        )
 
         # Split documents into smaller passages to fit max_seq_len
         baskets = self._split_docs_into_passages(baskets)
@@ -490,6 +499,17 @@ class SquadProcessor(Processor):
         else:
             return dataset, tensor_names, self.problematic_sample_ids
 
+    def _get_document_cache(self) -> Optional[DocumentTokenizationCache]:
+        """
+        Returns the cache for tokenized documents, or None if it's disabled. The cache is recreated when the cache size
+        changed.
+        """
+        if self.document_cache_size <= 0:
+            self._document_cache = None
+        elif self._document_cache is None or self._document_cache.max_size != self.document_cache_size:
+            self._document_cache = DocumentTokenizationCache(max_size=self.document_cache_size)
+        return self._document_cache
+
     def file_to_dicts(self, file: str) -> List[dict]:
         nested_dicts = _read_squad_file(filename=file)
         dicts = [y for x in nested_dicts for y in x["paragraphs"]]
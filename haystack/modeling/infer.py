@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Union, Set, Any
+from typing import List, Optional, Dict, Union, Set, Any, Tuple
 
 import os
 import logging
@@ -39,6 +39,7 @@ class Inferencer:
         num_processes: Optional[int] = None,
         disable_tqdm: bool = False,
         devices: Optional[List[Union[str, torch.device]]] = None,
+        dynamic_padding: bool = False,
     ):
         """
         Initializes Inferencer from an AdaptiveModel and a Processor instance.
@@ -70,6 +71,12 @@ class Inferencer:
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param dynamic_padding: Whether to sort the samples by their length and to trim the padding of each batch to
+                                its longest sample. This saves most of the computation spent on padding when the
+                                samples are shorter than `max_seq_len`. The predictions are returned in the original
+                                order. Note that padding tokens no longer take part in the softmax over all tokens, so
+                                QA confidence scores can change slightly, and that token level outputs (for example,
+                                `extraction_strategy="per_token"`) are only as long as the longest sample of their batch.
         :return: An instance of the Inferencer.
 
         """
@@ -89,6 +96,7 @@ class Inferencer:
         self.language = self.model.get_language()
         self.task_type = task_type
         self.disable_tqdm = disable_tqdm
+        self.dynamic_padding = dynamic_padding
         self.problematic_sample_ids: Set[List[int]] = set()  # type ignore
 
         if task_type == "embeddings":
@@ -132,6 +140,7 @@ class Inferencer:
         use_auth_token: Optional[Union[bool, str]] = None,
         devices: Optional[List[Union[str, torch.device]]] = None,
         max_query_length: int = 64,
+        dynamic_padding: bool = False,
         **kwargs,
     ):
         """
@@ -181,6 +190,8 @@ class Inferencer:
                                Additional information can be found here
                                https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
         :param max_query_length: Only QA: Maximum length of the question in number of tokens.
+        :param dynamic_padding: Whether to sort the samples by their length and to trim the padding of each batch to
+                                its longest sample. See `Inferencer.__init__()`.
         :return: An instance of the Inferencer.
         """
         if tokenizer_args is None:
@@ -259,6 +270,7 @@ class Inferencer:
             num_processes=num_processes,
             disable_tqdm=disable_tqdm,
             devices=devices,
+            dynamic_padding=dynamic_padding,
         )
 
     def save(self, path: str):
@@ -360,13 +372,14 @@ class Inferencer:
         """
         samples = [s for b in baskets for s in b.samples]
 
-        data_loader = NamedDataLoader(
-            dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names  # type: ignore [arg-type]
-        )  # type ignore
+        data_loader, order = self._get_data_loader(dataset, tensor_names)
+        if order is not None:
+            samples = [samples[i] for i in order]
         preds_all = []
         for i, batch in enumerate(
             tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=self.disable_tqdm)
         ):
+            batch = self._trim_padding(batch)
             batch = {key: batch[key].to(self.devices[0]) for key in batch}
             batch_samples = samples[i * self.batch_size : (i + 1) * self.batch_size]
 
@@ -377,6 +390,9 @@ class Inferencer:
                     logits=logits, samples=batch_samples, padding_mask=batch.get("padding_mask", None)
                 )
                 preds_all += preds
+
+        if order is not None and len(preds_all) == len(order):
+            preds_all = self._restore_order(preds_all, order)
         return preds_all
 
     def _get_predictions_and_aggregate(self, dataset: Dataset, tensor_names: List, baskets: List[SampleBasket]):
@@ -394,14 +410,13 @@ class Inferencer:
                         Example: QA - input string to convert the predicted answer from indices back to string space
         :return: list of predictions
         """
-        data_loader = NamedDataLoader(
-            dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names  # type: ignore [arg-type]
-        )  # type ignore
+        data_loader, order = self._get_data_loader(dataset, tensor_names)
         # TODO Sometimes this is the preds of one head, sometimes of two. We need a more advanced stacking operation
         # TODO so that preds of the right shape are passed in to formatted_preds
         unaggregated_preds_all = []
 
         for batch in tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=self.disable_tqdm):
+            batch = self._trim_padding(batch)
             batch = {key: batch[key].to(self.devices[0]) for key in batch}
 
             # get logits
@@ -419,6 +434,16 @@ class Inferencer:
                 preds = self.model.logits_to_preds(logits, **batch)
                 unaggregated_preds_all.append(preds)
 
+        if order is not None and unaggregated_preds_all:
+            # Put the preds of all batches back into the order of the baskets, as if they came from a single batch
+            n_heads = len(unaggregated_preds_all[0])
+            unaggregated_preds_all = [
+                [
+                    self._restore_order([pred for preds in unaggregated_preds_all for pred in preds[head]], order)
+                    for head in range(n_heads)
+                ]
+            ]
+
         # In some use cases we want to aggregate the individual predictions.
         # This is mostly useful, if the input text is longer than the max_seq_len that the model can process.
         # In QA we can use this to get answers from long input texts by first getting predictions for smaller passages
@@ -435,6 +460,49 @@ class Inferencer:
         )  # type ignore
         return preds_all
 
+    def _get_data_loader(self, dataset: Dataset, tensor_names: List) -> Tuple[NamedDataLoader, Optional[List[int]]]:
+        """
+        Returns the data loader for inference, and the order in which it returns the samples if they are sorted by
+        length for dynamic padding (None otherwise).
+        """
+        order = None
+        sampler: Any = SequentialSampler(dataset)
+        if self.dynamic_padding and "padding_mask" in tensor_names and hasattr(dataset, "tensors"):
+            lengths = dataset.tensors[tensor_names.index("padding_mask")].sum(dim=1).tolist()
+            # Longest samples first, so that running out of memory happens in the first batch
+            order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+            sampler = order
+        data_loader = NamedDataLoader(
+            dataset=dataset, sampler=sampler, batch_size=self.batch_size, tensor_names=tensor_names
+        )
+        return data_loader, order
+
+    def _trim_padding(self, batch: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """
+        Trims the token level tensors of a batch to the length of its longest sample if dynamic padding is enabled.
+        """
+        padding_mask = batch.get("padding_mask")
+        if not self.dynamic_padding or padding_mask is None or padding_mask.dim() != 2:
+            return batch
+        seq_len = padding_mask.shape[1]
+        max_len = max(int(padding_mask.sum(dim=1).max()), 1)
+        if max_len == seq_len:
+            return batch
+        return {
+            key: tensor[:, :max_len] if tensor.dim() == 2 and tensor.shape[1] == seq_len else tensor
+            for key, tensor in batch.items()
+        }
+
+    @staticmethod
+    def _restore_order(items: List, order: List[int]) -> List:
+        """
+        Puts items that are sorted by `order` back into their original order.
+        """
+        restored: List = [None] * len(order)
+        for item, i in zip(items, order):
+            restored[i] = item
+        return restored
+
     def extract_vectors(
         self, dicts: List[Dict], extraction_strategy: Optional[str] = "cls_token", extraction_layer: Optional[int] = -1
     ):
@@ -18,7 +18,9 @@ from typing import Dict, Any, Union, Tuple, Optional, List
 import re
 import os
 import json
+import hashlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
@@ -140,20 +142,111 @@ class FeatureExtractor:
         return self.feature_extractor(**params)
 
 
+class DocumentTokenizationCache:
+    """
+    LRU cache for the tokenized documents of question answering inputs. The same documents are often passed to a
+    reader for many queries, so their tokens, offsets and start of word flags are only computed once.
+
+    Documents are keyed by the identity of the tokenizer and a hash of their content, so a cache can be shared by
+    readers with different tokenizers. The cached values are immutable: tuples and read-only arrays.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: The maximum number of documents to keep. The least recently used documents are dropped first.
+        """
+        self.max_size = max_size
+        self._documents: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def key(tokenizer: PreTrainedTokenizer, text: str) -> Tuple[Any, ...]:
+        tokenizer_key = (type(tokenizer).__name__, tokenizer.name_or_path, len(tokenizer))
+        return tokenizer_key + (hashlib.sha256(text.encode("utf-8")).hexdigest(),)
+
+    def get(self, tokenizer: PreTrainedTokenizer, text: str) -> Optional[Dict[str, Any]]:
+        key = self.key(tokenizer, text)
+        tokenized = self._documents.get(key)
+        if tokenized is not None:
+            self._documents.move_to_end(key)
+        return tokenized
+
+    def add(self, tokenizer: PreTrainedTokenizer, text: str, tokenized: Dict[str, Any]):
+        key = self.key(tokenizer, text)
+        self._documents[key] = tokenized
+        self._documents.move_to_end(key)
+        while len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+
+    def __len__(self):
+        return len(self._documents)
+
+
+def _tokenize_documents_question_answering(
+    texts: List[str], tokenizer: PreTrainedTokenizer, cache: Optional[DocumentTokenizationCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    Tokenizes the documents of question answering inputs in batch mode. Documents found in the cache aren't tokenized
+    again, and the documents that were tokenized are added to the cache.
+
+    :return: one dict per text with the token ids, character offsets, start of word flags and token strings. The
+             values are immutable, as they can be shared with other calls through the cache.
+    """
+    tokenized_docs: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+    texts_to_tokenize: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        tokenized = cache.get(tokenizer, text) if cache is not None else None
+        if tokenized is not None:
+            tokenized_docs[i] = tokenized
+        else:
+            texts_to_tokenize.setdefault(text, []).append(i)
+
+    if texts_to_tokenize:
+        tokenized_docs_batch = tokenizer(
+            text=list(texts_to_tokenize.keys()),
+            return_offsets_mapping=True,
+            return_special_tokens_mask=True,
+            add_special_tokens=False,
+            verbose=False,
+        )
+        for i_batch, (text, positions) in enumerate(texts_to_tokenize.items()):
+            encoding = tokenized_docs_batch.encodings[i_batch]
+            offsets = np.asarray([x[0] for x in tokenized_docs_batch["offset_mapping"][i_batch]], dtype=np.int32)
+            offsets.flags.writeable = False
+            tokenized = {
+                "tokens": tuple(tokenized_docs_batch["input_ids"][i_batch]),
+                "offsets": offsets,
+                "start_of_word": tuple(_get_start_of_word_QA(encoding.word_ids)),
+                "tokens_strings": tuple(encoding.tokens),
+            }
+            if cache is not None:
+                cache.add(tokenizer, text, tokenized)
+            for i in positions:
+                tokenized_docs[i] = tokenized
+    return tokenized_docs  # type: ignore [return-value]
+
+
 def tokenize_batch_question_answering(
-    pre_baskets: List[Dict[str, Any]], tokenizer: PreTrainedTokenizer, indices: List[Any]
+    pre_baskets: List[Dict[str, Any]],
+    tokenizer: PreTrainedTokenizer,
+    indices: List[Any],
+    document_cache: Optional[DocumentTokenizationCache] = None,
 ) -> List[SampleBasket]:
     """
     Tokenizes text data for question answering tasks. Tokenization means splitting words into subwords, depending on the
     tokenizer's vocabulary.
 
     - We first tokenize all documents in batch mode. (When using FastTokenizers Rust multithreading can be enabled by TODO add how to enable rust mt)
-    - Then we tokenize each question individually
+    - Then we tokenize each distinct question individually
     - We construct dicts with question and corresponding document text + tokens + offsets + ids
 
+    Each basket gets its own token lists. The offsets array of a document is shared by all baskets it appears in and
+    is read-only.
+
     :param pre_baskets: input dicts with QA info #TODO change to input objects
     :param tokenizer: tokenizer to be used
     :param indices: indices used during multiprocessing so that IDs assigned to our baskets are unique
+    :param document_cache: cache for the tokenized documents, so that documents seen in earlier calls aren't
+                           tokenized again.
     :return: baskets, list containing question and corresponding document information
     """
     if not len(indices) == len(pre_baskets):
@@ -167,55 +260,53 @@ def tokenize_batch_question_answering(
 
     baskets = []
     # # Tokenize texts in batch mode
-    texts = [d["context"] for d in pre_baskets]
-    tokenized_docs_batch = tokenizer(
-        text=texts,
-        return_offsets_mapping=True,
-        return_special_tokens_mask=True,
-        add_special_tokens=False,
-        verbose=False,
+    tokenized_docs = _tokenize_documents_question_answering(
+        [d["context"] for d in pre_baskets], tokenizer=tokenizer, cache=document_cache
     )
 
-    # Extract relevant data
-    tokenids_batch = tokenized_docs_batch["input_ids"]
-    offsets_batch = []
-    for o in tokenized_docs_batch["offset_mapping"]:
-        offsets_batch.append(np.asarray([x[0] for x in o], dtype=np.int32))
-    start_of_words_batch = []
-    for e in tokenized_docs_batch.encodings:
-        start_of_words_batch.append(_get_start_of_word_QA(e.word_ids))
-
+    # A query is usually asked on many documents, so each distinct question is tokenized once
+    tokenized_questions: Dict[str, Dict[str, Any]] = {}
     for i_doc, d in enumerate(pre_baskets):
         document_text = d["context"]
+        tokenized_doc = tokenized_docs[i_doc]
         # # Tokenize questions one by one
         for i_q, q in enumerate(d["qas"]):
             question_text = q["question"]
-            tokenized_q = tokenizer(
-                question_text, return_offsets_mapping=True, return_special_tokens_mask=True, add_special_tokens=False
-            )
+            tokenized_question = tokenized_questions.get(question_text)
+            if tokenized_question is None:
+                tokenized_q = tokenizer(
+                    question_text,
+                    return_offsets_mapping=True,
+                    return_special_tokens_mask=True,
+                    add_special_tokens=False,
+                )
 
-            # Extract relevant data
-            question_tokenids = tokenized_q["input_ids"]
-            question_offsets = [x[0] for x in tokenized_q["offset_mapping"]]
-            question_sow = _get_start_of_word_QA(tokenized_q.encodings[0].word_ids)
+                # Extract relevant data
+                tokenized_question = {
+                    "tokens": tuple(tokenized_q["input_ids"]),
+                    "offsets": tuple(x[0] for x in tokenized_q["offset_mapping"]),
+                    "start_of_word": tuple(_get_start_of_word_QA(tokenized_q.encodings[0].word_ids)),
+                    "tokens_strings": tuple(tokenized_q.encodings[0].tokens),
+                }
+                tokenized_questions[question_text] = tokenized_question
 
             external_id = q["id"]
             # The internal_id depends on unique ids created for each process before forking
             internal_id = f"{indices[i_doc]}-{i_q}"
             raw = {
                 "document_text": document_text,
-                "document_tokens": tokenids_batch[i_doc],
-                "document_offsets": offsets_batch[i_doc],
-                "document_start_of_word": start_of_words_batch[i_doc],
+                "document_tokens": list(tokenized_doc["tokens"]),
+                "document_offsets": tokenized_doc["offsets"],
+                "document_start_of_word": list(tokenized_doc["start_of_word"]),
                 "question_text": question_text,
-                "question_tokens": question_tokenids,
-                "question_offsets": question_offsets,
-                "question_start_of_word": question_sow,
+                "question_tokens": list(tokenized_question["tokens"]),
+                "question_offsets": list(tokenized_question["offsets"]),
+                "question_start_of_word": list(tokenized_question["start_of_word"]),
                 "answers": q["answers"],
             }
             # TODO add only during debug mode (need to create debug mode)
-            raw["document_tokens_strings"] = tokenized_docs_batch.encodings[i_doc].tokens
-            raw["question_tokens_strings"] = tokenized_q.encodings[0].tokens
+            raw["document_tokens_strings"] = list(tokenized_doc["tokens_strings"])
+            raw["question_tokens_strings"] = list(tokenized_question["tokens_strings"])
 
             baskets.append(SampleBasket(raw=raw, id_internal=internal_id, id_external=external_id, samples=None))
     return baskets
@@ -19,6 +19,10 @@ from haystack.utils.scipy_utils import expit
 
 logger = logging.getLogger(__name__)
 
+# Number of candidate spans per requested answer that QuestionAnsweringHead.logits_to_preds() takes from each sample
+# before filtering out duplicates
+TOP_CANDIDATES_PER_ANSWER = 20
+
 
 class PredictionHead(nn.Module):
     """
@@ -485,41 +489,80 @@ class QuestionAnsweringHead(PredictionHead):
         span_mask_end = span_mask.unsqueeze(1).expand(-1, max_seq_len, -1)
         span_mask_2d = span_mask_start + span_mask_end
         # disqualify spans where either start or end is on an invalid token
-        invalid_indices = torch.nonzero((span_mask_2d != 2), as_tuple=True)
-        start_end_matrix[invalid_indices[0][:], invalid_indices[1][:], invalid_indices[2][:]] = -999
+        start_end_matrix.masked_fill_(span_mask_2d != 2, -999)
+
+        # The confidence of a candidate is based on the softmax over all start and end logits of its sample
+        start_probs = torch.softmax(start_logits, dim=-1).cpu().numpy()
+        end_probs = torch.softmax(end_logits, dim=-1).cpu().numpy()
+        no_answer_scores = start_end_matrix[:, 0, 0].cpu().numpy()
 
-        # Sort the candidate answers by their score. Sorting happens on the flattened matrix.
-        # flat_sorted_indices.shape: (batch_size, max_seq_len^2, 1)
+        # Only the best candidates of each sample are needed, so instead of sorting all max_seq_len^2 candidates, take
+        # the top ones of all samples at once. Samples for which too many of them were disqualified as duplicates or
+        # no_answer fetch more candidates.
         flat_scores = start_end_matrix.view(batch_size, -1)
-        flat_sorted_indices_2d = flat_scores.sort(descending=True)[1]
-        flat_sorted_indices = flat_sorted_indices_2d.unsqueeze(2)
-
-        # The returned indices are then converted back to the original dimensionality of the matrix.
-        # sorted_candidates.shape : (batch_size, max_seq_len^2, 2)
-        start_indices = torch.div(flat_sorted_indices, max_seq_len, rounding_mode="trunc")
-        end_indices = flat_sorted_indices % max_seq_len
-        sorted_candidates = torch.cat((start_indices, end_indices), dim=2)
-
-        # Get the n_best candidate answers for each sample
-        sorted_candidates = sorted_candidates.cpu().numpy()
-        start_end_matrix = start_end_matrix.cpu().numpy()
+        n_flat = flat_scores.shape[1]
+        n_candidates = min(n_flat, TOP_CANDIDATES_PER_ANSWER * (self.n_best_per_sample + 1))
+        top_scores, top_indices = self._top_candidates(flat_scores, n_candidates, max_seq_len)
+
         for sample_idx in range(batch_size):
-            sample_top_n = self.get_top_candidates(
-                sorted_candidates[sample_idx],
-                start_end_matrix[sample_idx],
-                sample_idx,
-                start_matrix=start_matrix[sample_idx],
-                end_matrix=end_matrix[sample_idx],
-            )
+            sample_n_candidates = n_candidates
+            sample_scores, sample_indices = top_scores[sample_idx], top_indices[sample_idx]
+            while True:
+                sample_top_n = self.get_top_candidates(
+                    sorted_candidates=sample_indices,
+                    candidate_scores=sample_scores,
+                    no_answer_score=no_answer_scores[sample_idx],
+                    start_probs=start_probs[sample_idx],
+                    end_probs=end_probs[sample_idx],
+                    sample_idx=sample_idx,
+                )
+                # The last candidate is the no_answer
+                if len(sample_top_n) > self.n_best_per_sample or sample_n_candidates == n_flat:
+                    break
+                sample_n_candidates = min(n_flat, 2 * sample_n_candidates)
+                sample_scores, sample_indices = self._top_candidates(
+                    flat_scores[sample_idx : sample_idx + 1], sample_n_candidates, max_seq_len
+                )
+                sample_scores, sample_indices = sample_scores[0], sample_indices[0]
             all_top_n.append(sample_top_n)
 
         return all_top_n
 
-    def get_top_candidates(self, sorted_candidates, start_end_matrix, sample_idx: int, start_matrix, end_matrix):
+    @staticmethod
+    def _top_candidates(
+        flat_scores: torch.Tensor, n_candidates: int, max_seq_len: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Returns top candidate answers as a list of Span objects. Operates on a matrix of summed start and end logits.
-        This matrix corresponds to a single sample (includes special tokens, question tokens, passage tokens).
-        This method always returns a list of len n_best + 1 (it is comprised of the n_best positive answers along with the one no_answer)
+        Returns the scores and the (start, end) token indices of the best `n_candidates` candidates of each sample,
+        sorted by score. Shapes: (batch_size, n_candidates) and (batch_size, n_candidates, 2).
+        """
+        scores, flat_indices = torch.topk(flat_scores, k=n_candidates, dim=1)
+        start_indices = torch.div(flat_indices, max_seq_len, rounding_mode="trunc")
+        end_indices = flat_indices % max_seq_len
+        candidates = torch.stack((start_indices, end_indices), dim=2)
+        return scores.cpu().numpy(), candidates.cpu().numpy()
+
+    def get_top_candidates(
+        self,
+        sorted_candidates: np.ndarray,
+        candidate_scores: np.ndarray,
+        no_answer_score: float,
+        start_probs: np.ndarray,
+        end_probs: np.ndarray,
+        sample_idx: int,
+    ):
+        """
+        Returns top candidate answers as a list of Span objects. Operates on the best candidates of a single sample
+        (its tokens include special tokens, question tokens and passage tokens), sorted by their summed start and end
+        logits. This method returns a list of at most n_best + 1 candidates (the n_best positive answers along with
+        the one no_answer). It returns fewer if there aren't enough candidates after filtering.
+
+        :param sorted_candidates: (start, end) token indices of the candidates, sorted by score.
+        :param candidate_scores: summed start and end logits of the candidates.
+        :param no_answer_score: summed start and end logits of the first token.
+        :param start_probs: softmax over the start logits of the sample.
+        :param end_probs: softmax over the end logits of the sample.
+        :param sample_idx: index of the sample in the batch.
         """
         # Initialize some variables
         top_candidates: List[QACandidate] = []
@@ -527,8 +570,6 @@ class QuestionAnsweringHead(PredictionHead):
         start_idx_candidates = set()
         end_idx_candidates = set()
 
-        start_matrix_softmax_start = torch.softmax(start_matrix[:, 0], dim=-1).cpu().numpy()
-        end_matrix_softmax_end = torch.softmax(end_matrix[0, :], dim=-1).cpu().numpy()
         # Iterate over all candidates and break when we have all our n_best candidates
         for candidate_idx in range(n_candidates):
             # Retrieve candidate's indices
@@ -539,9 +580,9 @@ class QuestionAnsweringHead(PredictionHead):
                 continue
             if self.duplicate_filtering > -1 and (start_idx in start_idx_candidates or end_idx in end_idx_candidates):
                 continue
-            score = start_end_matrix[start_idx, end_idx]
+            score = candidate_scores[candidate_idx]
             confidence = (
-                (start_matrix_softmax_start[start_idx] + end_matrix_softmax_end[end_idx]) / 2
+                (start_probs[start_idx] + end_probs[end_idx]) / 2
                 if score > -500
                 else np.exp(score / 10)  # disqualify answers according to scores in logits_to_preds()
             )
@@ -568,8 +609,7 @@ class QuestionAnsweringHead(PredictionHead):
             if len(top_candidates) == self.n_best_per_sample:
                 break
 
-        no_answer_score = start_end_matrix[0, 0]
-        no_answer_confidence = (start_matrix_softmax_start[0] + end_matrix_softmax_end[0]) / 2
+        no_answer_confidence = (start_probs[0] + end_probs[0]) / 2
         top_candidates.append(
             QACandidate(
                 offset_answer_start=0,
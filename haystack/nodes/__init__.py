@@ -23,7 +23,15 @@ from haystack.nodes.file_converter import (
 )
 from haystack.nodes.image_to_text import TransformersImageToText
 from haystack.nodes.label_generator import PseudoLabelGenerator
-from haystack.nodes.other import Docs2Answers, JoinDocuments, RouteDocuments, JoinAnswers, DocumentMerger, Shaper
+from haystack.nodes.other import (
+    Docs2Answers,
+    JoinDocuments,
+    RouteDocuments,
+    JoinAnswers,
+    DocumentMerger,
+    Shaper,
+    SkipUnchangedDocuments,
+)
 from haystack.nodes.preprocessor import BasePreProcessor, PreProcessor
 from haystack.nodes.prompt import PromptNode, PromptTemplate, PromptModel, BaseOutputParser, AnswerParser
 from haystack.nodes.prompt.invocation_layer import PromptModelInvocationLayer
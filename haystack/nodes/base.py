@@ -3,7 +3,9 @@ from typing import Any, Optional, Dict, List, Tuple, Union, Callable, Type
 
 from copy import deepcopy
 from abc import ABC, abstractmethod
-from functools import wraps
+from functools import lru_cache, partial, wraps
+import os
+import asyncio
 import inspect
 import logging
 
@@ -14,6 +16,10 @@ from haystack.utils import args_to_kwargs
 
 logger = logging.getLogger(__name__)
 
+# Safe mode: give every node a deep copy of its inputs, like nodes that set `mutates_inputs`. Useful to find out
+# whether a custom node that modifies its inputs in place is missing the flag.
+COPY_NODE_INPUTS = os.environ.get("HAYSTACK_COPY_NODE_INPUTS", "false").lower() in ("1", "true")
+
 
 def exportable_to_yaml(init_func):
     """
@@ -48,12 +54,35 @@ def exportable_to_yaml(init_func):
     return wrapper_exportable_to_yaml
 
 
+@lru_cache(maxsize=1024)
+def _get_method_args(function: Callable) -> Tuple[str, ...]:
+    """
+    Returns the names of the arguments of a method, without `self`.
+    """
+    return tuple(inspect.signature(function).parameters.keys())[1:]
+
+
+def _get_run_signature_args(run_method: Callable) -> Tuple[str, ...]:
+    """
+    Returns the names of the arguments run_method accepts. The signatures of bound methods are inspected once per
+    class rather than on every call.
+    """
+    function = getattr(run_method, "__func__", None)
+    if function is None:
+        return tuple(inspect.signature(run_method).parameters.keys())
+    return _get_method_args(function)
+
+
 class BaseComponent(ABC):
     """
     A base class for implementing nodes in a Pipeline.
     """
 
     outgoing_edges: int
+    # Nodes receive their inputs by reference, so the Documents, Answers and other objects they get are shared with
+    # the preceding nodes, the other branches of the Pipeline, and the caller. Nodes that modify their inputs in place
+    # (for example, the scores or the metadata of the Documents) must set this to True to work on a copy instead.
+    mutates_inputs: bool = False
     _subclasses: dict = {}
     _component_config: dict = {}
 
@@ -216,10 +245,45 @@ class BaseComponent(ABC):
           - collate `_debug` information if present
           - merge component output with the preceding output and pass it on to the subsequent Component in the Pipeline
         """
-        arguments = deepcopy(kwargs)
-        params = arguments.get("params") or {}
+        arguments, run_inputs, run_params = self._prepare_run_arguments(run_method, kwargs)
+        output, stream = run_method(**run_inputs, **run_params)
+        return self._collect_run_output(output, stream, arguments, run_inputs, run_params)
+
+    async def _dispatch_run_async(self, **kwargs) -> Tuple[Dict, str]:
+        """
+        The Pipelines call this method when run_async() is executed.
 
-        run_signature_args = inspect.signature(run_method).parameters.keys()
+        Components can implement an optional `async_run()` coroutine method taking the same arguments as `run()`,
+        for example to await network requests instead of blocking a thread. If they do, it's awaited on the event
+        loop. Otherwise, `run()` is executed in the default executor of the event loop so that it doesn't block it.
+        """
+        async_run = getattr(self, "async_run", None)
+        if async_run is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(self._dispatch_run, **kwargs))
+
+        arguments, run_inputs, run_params = self._prepare_run_arguments(async_run, kwargs)
+        output, stream = await async_run(**run_inputs, **run_params)
+        return self._collect_run_output(output, stream, arguments, run_inputs, run_params)
+
+    def _prepare_run_arguments(
+        self, run_method: Callable, kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Splits the node input into the inputs and params that run_method accepts.
+
+        The inputs are passed by reference. They're only deep-copied if the node mutates its inputs, if its debug
+        output is enabled (so that the debug input reflects what the node received), or in safe mode (see
+        `COPY_NODE_INPUTS`). The params are always copied, as they are small and modified here.
+
+        :return: A tuple of the node input, the inputs and the params for run_method.
+        """
+        arguments = dict(kwargs)
+        params = deepcopy(arguments.get("params")) or {}
+        if arguments.get("params"):
+            arguments["params"] = params
+
+        run_signature_args = _get_run_signature_args(run_method)
 
         run_params: Dict[str, Any] = {}
         for key, value in params.items():
@@ -237,13 +301,28 @@ class BaseComponent(ABC):
             elif key in run_signature_args:  # global params
                 run_params[key] = value
 
+        if self.mutates_inputs or COPY_NODE_INPUTS or getattr(self, "debug", None):
+            # The params are already a copy
+            arguments = deepcopy(arguments, {id(params): params})
+
         run_inputs = {}
         for key, value in arguments.items():
             if key in run_signature_args:
                 run_inputs[key] = value
 
-        output, stream = run_method(**run_inputs, **run_params)
+        return arguments, run_inputs, run_params
 
+    def _collect_run_output(
+        self,
+        output: Dict[str, Any],
+        stream: str,
+        arguments: Dict[str, Any],
+        run_inputs: Dict[str, Any],
+        run_params: Dict[str, Any],
+    ) -> Tuple[Dict, str]:
+        """
+        Adds the debug information and the unused node input to the output of run_method.
+        """
         # Collect debug information
         debug_info = {}
         if getattr(self, "debug", None):
@@ -259,7 +338,7 @@ class BaseComponent(ABC):
             debug_info["runtime"] = custom_debug
 
         # append _debug information from nodes
-        all_debug = arguments.get("_debug", {})
+        all_debug = dict(arguments.get("_debug", {}))
         if debug_info:
             all_debug[self.name] = debug_info
         if all_debug:
@@ -270,7 +349,7 @@ class BaseComponent(ABC):
             if k not in output.keys() and k != "inputs":
                 output[k] = v
 
-        output["params"] = params
+        output["params"] = arguments.get("params") or {}
         return output, stream
 
 
@@ -16,6 +16,7 @@ class BaseDocumentLanguageClassifier(BaseComponent):
     """
 
     outgoing_edges = len(DEFAULT_LANGUAGES)
+    mutates_inputs = True
 
     @classmethod
     def _calculate_outgoing_edges(cls, component_params: Dict[str, Any]) -> int:
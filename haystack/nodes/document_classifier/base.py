@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 class BaseDocumentClassifier(BaseComponent):
     outgoing_edges = 1
+    mutates_inputs = True
     query_count = 0
     query_time = 0
 
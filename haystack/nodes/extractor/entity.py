@@ -100,6 +100,7 @@ class EntityExtractor(BaseComponent):
     """
 
     outgoing_edges = 1
+    mutates_inputs = True
 
     def __init__(
         self,
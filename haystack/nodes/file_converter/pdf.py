@@ -1,12 +1,12 @@
 import logging
+import math
 import os
 import warnings
-from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
-
-from more_itertools import divide
+from typing import Any, Deque, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 try:
     import fitz
@@ -20,6 +20,40 @@ from haystack.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# PDFs with up to this many pages are read by a single worker task, larger ones are split into tasks of at most
+# this many pages. With OCR, every page is a task of its own.
+PAGES_PER_TASK = 16
+
+
+def _iter_pages_text(
+    doc: "fitz.Document",
+    page_numbers: Iterator[int],
+    sort_by_position: bool,
+    ocr: Optional[Literal["auto", "full"]],
+    ocr_language: str,
+) -> Iterator[str]:
+    for i in page_numbers:
+        page = doc[i]
+        partial_tp = None
+        if ocr is not None:
+            full = ocr == "full"
+            partial_tp = page.get_textpage_ocr(flags=0, full=full, dpi=300, language=ocr_language)
+        yield page.get_text("text", textpage=partial_tp, sort=sort_by_position)
+
+
+def _extract_pages_text(
+    file_path: Path,
+    page_numbers: List[int],
+    sort_by_position: bool,
+    ocr: Optional[Literal["auto", "full"]],
+    ocr_language: str,
+) -> List[str]:
+    """
+    Extracts the text of some pages of a PDF. Runs in the worker processes of PDFToTextConverter.
+    """
+    with fitz.open(file_path) as doc:
+        return list(_iter_pages_text(doc, iter(page_numbers), sort_by_position, ocr, ocr_language))
+
 
 class PDFToTextConverter(BaseConverter):
     def __init__(
@@ -62,6 +96,9 @@ class PDFToTextConverter(BaseConverter):
                 You can combine multiple languages by passing a string with the language codes separated by `+`. For example, to use English and German, pass `eng+deu`.
         :param multiprocessing: We use multiprocessing to speed up PyMuPDF conversion, you can disable it by setting it to False.
                                 If set to True (the default value), the total number of cores is used. To specify the number of cores to use, set it to an integer.
+                                The worker processes are started on first use and reused for all files until `close()`
+                                is called. Large PDFs are split into pages across the workers, while `run()` hands out
+                                small PDFs to the workers as a whole ahead of converting them.
         """
         super().__init__(
             remove_numeric_tables=remove_numeric_tables, valid_languages=valid_languages, id_hash_keys=id_hash_keys
@@ -71,6 +108,10 @@ class PDFToTextConverter(BaseConverter):
         self.multiprocessing = multiprocessing
         self.ocr = ocr
         self.ocr_language = ocr_language
+        self._worker_pool: Optional[ProcessPoolExecutor] = None
+        self._worker_pool_size = 0
+        self._upcoming_files: Deque[Path] = deque()
+        self._read_ahead: Dict[Tuple, Future] = {}
 
         if ocr is not None:
             if ocr not in ["auto", "full"]:
@@ -168,7 +209,7 @@ class PDFToTextConverter(BaseConverter):
                 raise ValueError("The ocr parameter must be either 'auto' or 'full'.")
             self._check_tessdata()
 
-        pages = self._read_pdf(
+        pages = self._iter_pages(
             file_path,
             sort_by_position=sort_by_position,
             start_page=start_page,
@@ -227,21 +268,149 @@ class PDFToTextConverter(BaseConverter):
                 """
             )
 
-    def _get_text_parallel(self, page_mp):
-        idx, filename, parts, sort_by_position, ocr, ocr_language = page_mp
+    def run(  # type: ignore
+        self,
+        file_paths: Union[Path, List[Path]],
+        meta: Optional[Union[Dict[str, str], List[Optional[Dict[str, str]]]]] = None,
+        remove_numeric_tables: Optional[bool] = None,
+        known_ligatures: Optional[Dict[str, str]] = None,
+        valid_languages: Optional[List[str]] = None,
+        encoding: Optional[str] = "UTF-8",
+        id_hash_keys: Optional[List[str]] = None,
+    ):
+        """
+        Extract text from PDF files. See `BaseConverter.run()` for the parameters.
+
+        With multiprocessing, small PDFs are read by the worker processes ahead of time while the ones before them are
+        being converted.
+        """
+        if isinstance(file_paths, list) and len(file_paths) > 1 and self._num_workers(self.multiprocessing) > 1:
+            self._upcoming_files.extend(file_paths)
+            self._schedule_read_ahead()
+        try:
+            return super().run(
+                file_paths=file_paths,
+                meta=meta,
+                remove_numeric_tables=remove_numeric_tables,
+                known_ligatures=known_ligatures,
+                valid_languages=valid_languages,
+                encoding=encoding,
+                id_hash_keys=id_hash_keys,
+            )
+        finally:
+            self._upcoming_files.clear()
+            self._read_ahead.clear()
+
+    def close(self):
+        """
+        Shuts down the worker processes used for multiprocessing. They're started again if needed.
+        """
+        worker_pool = getattr(self, "_worker_pool", None)
+        if worker_pool is not None:
+            self._worker_pool = None
+            self._worker_pool_size = 0
+            worker_pool.shutdown(wait=False)
+
+    def __del__(self):
+        self.close()
+
+    @staticmethod
+    def _num_workers(multiprocessing: Union[bool, int]) -> int:
+        if not multiprocessing:
+            return 0
+        return cpu_count() if isinstance(multiprocessing, bool) else multiprocessing
+
+    def _get_worker_pool(self, num_workers: int) -> ProcessPoolExecutor:
+        if self._worker_pool is None or self._worker_pool_size < num_workers:
+            self.close()
+            self._worker_pool = ProcessPoolExecutor(max_workers=num_workers)
+            self._worker_pool_size = num_workers
+        return self._worker_pool
 
-        doc = fitz.open(filename)
+    def _schedule_read_ahead(self):
+        """
+        Hands out whole small files from the ones `run()` is about to convert to the worker pool, keeping a few of
+        them in progress per worker. Large files are left to `_iter_pages`, which splits them into pages.
+        """
+        num_workers = self._num_workers(self.multiprocessing)
+        max_pages = 1 if self.ocr else PAGES_PER_TASK
+        while self._upcoming_files and len(self._read_ahead) < 4 * num_workers:
+            file_path = self._upcoming_files.popleft()
+            try:
+                with fitz.open(file_path) as doc:
+                    page_count = int(doc.page_count)
+            except Exception:
+                # convert() reports the error when it gets to this file
+                continue
+            if page_count > max_pages:
+                continue
+            key = (str(file_path), self.sort_by_position, None, None, self.ocr, self.ocr_language)
+            self._read_ahead[key] = self._get_worker_pool(num_workers).submit(
+                _extract_pages_text,
+                file_path,
+                list(range(page_count)),
+                self.sort_by_position,
+                self.ocr,
+                self.ocr_language,
+            )
+
+    def _iter_pages(
+        self,
+        file_path: Path,
+        ocr_language: str,
+        sort_by_position: bool = False,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        ocr: Optional[Literal["auto", "full"]] = None,
+        multiprocessing: Optional[Union[bool, int]] = None,
+    ) -> Iterator[str]:
+        """
+        Yields the text of the pages of the pdf file at file_path in order, as soon as it's extracted.
+        Pages before start_page are yielded as empty strings to keep the page numbering.
+        See `_read_pdf` for the parameters.
+        """
+        read_ahead = self._read_ahead.pop(
+            (str(file_path), sort_by_position, start_page, end_page, ocr, ocr_language), None
+        )
+        self._schedule_read_ahead()
+        if read_ahead is not None:
+            yield from read_ahead.result()
+            return
 
-        text = ""
-        for i in parts[idx]:
-            page = doc[i]
-            partial_tp = None
-            if ocr is not None:
-                full = ocr == "full"
-                partial_tp = page.get_textpage_ocr(flags=0, full=full, dpi=300, language=ocr_language)
-            text += page.get_text("text", textpage=partial_tp, sort=sort_by_position) + "\f"
+        if start_page is None:
+            start_page = 0
+        else:
+            start_page = start_page - 1
 
-        return text
+        with fitz.open(file_path) as doc:
+            page_count = int(doc.page_count)
+
+            if end_page is None or (end_page is not None and end_page > page_count):
+                end_page = page_count
+
+            # tracking skipped pages for correct page numbering
+            yield from [""] * start_page
+
+            page_numbers = range(start_page, end_page)
+            num_workers = self._num_workers(multiprocessing)
+            max_pages = 1 if ocr else PAGES_PER_TASK
+            if num_workers < 2 or len(page_numbers) <= max_pages:
+                yield from _iter_pages_text(doc, iter(page_numbers), sort_by_position, ocr, ocr_language)
+                return
+
+        pages_per_task = 1 if ocr else min(PAGES_PER_TASK, math.ceil(len(page_numbers) / num_workers))
+        worker_pool = self._get_worker_pool(num_workers)
+        pending: Deque[Future] = deque()
+        for i in range(0, len(page_numbers), pages_per_task):
+            task_pages = list(page_numbers[i : i + pages_per_task])
+            pending.append(
+                worker_pool.submit(_extract_pages_text, file_path, task_pages, sort_by_position, ocr, ocr_language)
+            )
+            # Yield the pages done so far while keeping every worker busy
+            while len(pending) > 2 * num_workers or (pending and pending[0].done()):
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
     def _read_pdf(
         self,
@@ -268,41 +437,14 @@ class PDFToTextConverter(BaseConverter):
                                 If set to None (the default value), the value defined in the class initialization is used.
                                 If set to True, the total number of cores is used. To specify the number of cores to use, set it to an integer.
         """
-        if start_page is None:
-            start_page = 0
-        else:
-            start_page = start_page - 1
-
-        doc = fitz.open(file_path)
-        page_count = int(doc.page_count)
-
-        if end_page is None or (end_page is not None and end_page > page_count):
-            end_page = page_count
-
-        document = ""
-
-        if not multiprocessing:
-            for i in range(start_page, end_page):
-                page = doc[i]
-                partial_tp = None
-                if ocr is not None:
-                    full = ocr == "full"
-                    partial_tp = page.get_textpage_ocr(flags=0, full=full, dpi=300, language=ocr_language)
-                document += page.get_text("text", textpage=partial_tp, sort=sort_by_position) + "\f"
-        else:
-            cpu = cpu_count() if isinstance(multiprocessing, bool) else multiprocessing
-            page_list = [i for i in range(start_page, end_page)]
-            cpu = cpu if len(page_list) > cpu else len(page_list)
-            parts = divide(cpu, page_list)
-            pages_mp = [(i, file_path, parts, sort_by_position, ocr, ocr_language) for i in range(cpu)]
-
-            with ProcessPoolExecutor(max_workers=cpu) as pool:
-                results = pool.map(self._get_text_parallel, pages_mp)
-                for page in results:
-                    document += page
-
-        document = "\f" * start_page + document  # tracking skipped pages for correct page numbering
-        pages = document.split("\f")
-        pages = pages[:-1]  # the last page in the split is always empty.
-
-        return pages
+        return list(
+            self._iter_pages(
+                file_path,
+                ocr_language=ocr_language,
+                sort_by_position=sort_by_position,
+                start_page=start_page,
+                end_page=end_page,
+                ocr=ocr,
+                multiprocessing=multiprocessing,
+            )
+        )
@@ -5,3 +5,4 @@ from haystack.nodes.other.join_answers import JoinAnswers
 from haystack.nodes.other.join import JoinNode
 from haystack.nodes.other.document_merger import DocumentMerger
 from haystack.nodes.other.shaper import Shaper
+from haystack.nodes.other.skip_unchanged_documents import SkipUnchangedDocuments
@@ -17,6 +17,7 @@ class Docs2Answers(BaseComponent):
     """
 
     outgoing_edges = 1
+    mutates_inputs = True
 
     def __init__(self, progress_bar: bool = True):
         super().__init__()
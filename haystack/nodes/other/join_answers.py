@@ -9,6 +9,8 @@ class JoinAnswers(JoinNode):
     A node to join `Answer`s produced by multiple `Reader` nodes.
     """
 
+    mutates_inputs = True
+
     def __init__(
         self,
         join_mode: str = "concatenate",
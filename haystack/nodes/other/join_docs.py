@@ -23,6 +23,7 @@ class JoinDocuments(JoinNode):
     """
 
     outgoing_edges = 1
+    mutates_inputs = True
 
     def __init__(
         self,
@@ -730,7 +730,8 @@ class Shaper(BaseComponent):
         meta: Optional[dict] = None,
         invocation_context: Optional[Dict[str, Any]] = None,
     ) -> Tuple[Dict, str]:
-        invocation_context = invocation_context or {}
+        # Copy the invocation context, as nodes of other branches can get the same one
+        invocation_context = dict(invocation_context or {})
         if query and "query" not in invocation_context.keys():
             invocation_context["query"] = query
 
@@ -0,0 +1,152 @@
+import json
+import logging
+from copy import copy
+from typing import Dict, List, Optional, Set, Union
+
+import mmh3
+import pandas as pd
+
+from haystack.document_stores.base import BaseDocumentStore
+from haystack.nodes.base import BaseComponent
+from haystack.schema import Document
+
+logger = logging.getLogger(__name__)
+
+
+class SkipUnchangedDocuments(BaseComponent):
+    """
+    A node for incremental indexing that drops the Documents the DocumentStore already holds in the same version.
+
+    Put it right after the converter in an indexing pipeline. It stores a fingerprint of each incoming Document, hashed
+    from its content and metadata, in the metadata field `fingerprint_field`. The PreProcessor copies it to every split,
+    so the DocumentStore ends up with the fingerprint of the source every stored Document was created from. When you
+    run the pipeline again, Documents whose fingerprint is already in the DocumentStore are dropped, so they skip
+    preprocessing, embedding, and writing.
+
+    The fingerprints are loaded from the DocumentStore on every run rather than cached in the node. This way, if a
+    later node of the pipeline fails, the Documents of that run aren't skipped when you run it again.
+    """
+
+    outgoing_edges = 1
+
+    def __init__(
+        self,
+        document_store: BaseDocumentStore,
+        fingerprint_field: str = "fingerprint",
+        index: Optional[str] = None,
+        delete_outdated_documents: bool = False,
+        source_field: str = "name",
+    ):
+        """
+        :param document_store: The DocumentStore the indexing pipeline writes to.
+        :param fingerprint_field: The metadata field to store the fingerprints in.
+        :param index: The index of the DocumentStore to compare with. If None, the DocumentStore's default index is used.
+        :param delete_outdated_documents: Whether to delete the Documents created from an earlier version of a changed
+            Document from the DocumentStore. The versions of a Document are recognized by having the same value in
+            the metadata field `source_field`. Note that the outdated Documents are deleted before the new ones are
+            written.
+        :param source_field: The metadata field that identifies the source of a Document, for example, its file name.
+            Only used if `delete_outdated_documents` is True.
+        """
+        super().__init__()
+        self.document_store = document_store
+        self.fingerprint_field = fingerprint_field
+        self.index = index
+        self.delete_outdated_documents = delete_outdated_documents
+        self.source_field = source_field
+
+    def fingerprint(self, document: Document) -> str:
+        """
+        Returns the fingerprint of a Document, a hash of its content, content type, and metadata.
+        The metadata field `fingerprint_field` isn't part of the hash.
+        """
+        content = document.content
+        if isinstance(content, pd.DataFrame):
+            content = content.to_json()
+        meta = {key: value for key, value in document.meta.items() if key != self.fingerprint_field}
+        data = json.dumps(
+            {"content": content, "content_type": document.content_type, "meta": meta}, sort_keys=True, default=str
+        )
+        return "{:02x}".format(mmh3.hash128(data, signed=False))
+
+    def _get_stored_fingerprints(self, index: str, headers: Optional[Dict[str, str]] = None) -> Set[str]:
+        fingerprints = self.document_store.get_document_fingerprints(
+            fingerprint_field=self.fingerprint_field, index=index, headers=headers
+        )
+        return set(fingerprints.values())
+
+    def skip_unchanged(
+        self, documents: List[Document], index: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+    ) -> List[Document]:
+        """
+        Returns copies of the Documents that aren't in the DocumentStore yet, with their fingerprint added to the
+        metadata.
+
+        :param documents: The Documents to check.
+        :param index: The index of the DocumentStore to compare with. Overrides the index set at initialization.
+        :param headers: Custom HTTP headers to pass to the DocumentStore.
+        """
+        index = index or self.index or self.document_store.index
+        known_fingerprints = self._get_stored_fingerprints(index=index, headers=headers)
+        return self._skip_known(
+            documents=documents, known_fingerprints=known_fingerprints, index=index, headers=headers
+        )
+
+    def _skip_known(
+        self,
+        documents: List[Document],
+        known_fingerprints: Set[str],
+        index: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Document]:
+        """
+        Returns copies of the Documents whose fingerprint isn't in `known_fingerprints` and adds their fingerprints
+        to it, so that duplicates within the same run are let through only once.
+        """
+        changed_documents = []
+        for document in documents:
+            fingerprint = self.fingerprint(document)
+            if fingerprint in known_fingerprints:
+                continue
+            known_fingerprints.add(fingerprint)
+            # Copy the Document so that the Document passed in stays as it was
+            changed_document = copy(document)
+            changed_document.meta = {**document.meta, self.fingerprint_field: fingerprint}
+            changed_documents.append(changed_document)
+
+        logger.info(
+            "%s of %s Documents are unchanged and skipped.", len(documents) - len(changed_documents), len(documents)
+        )
+
+        if self.delete_outdated_documents:
+            sources = list({doc.meta[self.source_field] for doc in changed_documents if self.source_field in doc.meta})
+            if sources:
+                # None of the Documents in the DocumentStore has the new fingerprints, so all the Documents with these
+                # sources are outdated
+                self.document_store.delete_documents(index=index, filters={self.source_field: sources}, headers=headers)
+
+        return changed_documents
+
+    def run(  # type: ignore
+        self, documents: List[Document], index: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+    ):
+        return {"documents": self.skip_unchanged(documents=documents, index=index, headers=headers)}, "output_1"
+
+    def run_batch(  # type: ignore
+        self,
+        documents: Union[List[Document], List[List[Document]]],
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        if documents and isinstance(documents[0], Document):
+            flat_docs = [doc for doc in documents if isinstance(doc, Document)]
+            return {"documents": self.skip_unchanged(documents=flat_docs, index=index, headers=headers)}, "output_1"
+
+        index = index or self.index or self.document_store.index
+        known_fingerprints = self._get_stored_fingerprints(index=index, headers=headers)
+        nested_docs = [
+            self._skip_known(documents=docs, known_fingerprints=known_fingerprints, index=index, headers=headers)
+            for docs in documents
+            if isinstance(docs, list)
+        ]
+        return {"documents": nested_docs}, "output_1"
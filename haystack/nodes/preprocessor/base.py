@@ -13,6 +13,7 @@ from haystack.schema import Document
 
 class BasePreProcessor(BaseComponent):
     outgoing_edges = 1
+    mutates_inputs = True
 
     @abstractmethod
     def process(
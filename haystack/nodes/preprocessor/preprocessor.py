@@ -1,10 +1,9 @@
-from typing import List, Optional, Generator, Set, Union, Tuple, Dict, Literal
+from typing import Any, List, Optional, Set, Union, Tuple, Dict, Literal
 
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from functools import partial, reduce
-from itertools import chain
 import warnings
 from pathlib import Path
 from pickle import UnpicklingError
@@ -52,6 +51,83 @@ iso639_to_nltk = {
     "ml": "malayalam",
 }
 
+DIGITS_PATTERN = re.compile(r"\d+")
+
+
+def _run_lengths_contained_in(reference: List[int], sequence: List[int]) -> List[int]:
+    """
+    For each position in `reference`, returns the length of the longest run of tokens ending at that position
+    which also appears somewhere in `sequence`.
+
+    Builds a suffix automaton of `sequence` and walks `reference` through it, so it takes linear time.
+    """
+    # Suffix automaton: every state stands for a set of substrings of `sequence` sharing the same end positions
+    link = [-1]
+    length = [0]
+    transitions: List[Dict[int, int]] = [{}]
+    last = 0
+    for token in sequence:
+        current = len(length)
+        length.append(length[last] + 1)
+        link.append(0)
+        transitions.append({})
+        state = last
+        while state != -1 and token not in transitions[state]:
+            transitions[state][token] = current
+            state = link[state]
+        if state != -1:
+            next_state = transitions[state][token]
+            if length[state] + 1 == length[next_state]:
+                link[current] = next_state
+            else:
+                clone = len(length)
+                length.append(length[state] + 1)
+                link.append(link[next_state])
+                transitions.append(dict(transitions[next_state]))
+                while state != -1 and transitions[state].get(token) == next_state:
+                    transitions[state][token] = clone
+                    state = link[state]
+                link[next_state] = clone
+                link[current] = clone
+        last = current
+
+    run_lengths = []
+    state = 0
+    run_length = 0
+    for token in reference:
+        while state and token not in transitions[state]:
+            state = link[state]
+            run_length = length[state]
+        if token in transitions[state]:
+            state = transitions[state][token]
+            run_length += 1
+        else:
+            run_length = 0
+        run_lengths.append(run_length)
+    return run_lengths
+
+
+def _init_preprocessor_worker(preprocessor: "PreProcessor"):
+    """
+    Runs once in each worker process of a PreProcessor pool. NLTK caches loaded models,
+    so loading the sentence tokenizer here spares every task the unpickling.
+    """
+    if nltk:
+        try:
+            preprocessor._load_sentence_tokenizer(iso639_to_nltk.get(preprocessor.language))
+        except LookupError:
+            # Raised again, with the full context, as soon as a task needs the tokenizer
+            pass
+
+
+def _process_documents_in_worker(
+    preprocessor: "PreProcessor",
+    documents: List[Union[dict, Document]],
+    id_hash_keys: Optional[List[str]],
+    kwargs: Dict,
+) -> List[List[Document]]:
+    return [preprocessor._process_single(document, id_hash_keys=id_hash_keys, **kwargs) for document in documents]
+
 
 class PreProcessor(BasePreProcessor):
     def __init__(
@@ -70,12 +146,14 @@ class PreProcessor(BasePreProcessor):
         progress_bar: bool = True,
         add_page_number: bool = False,
         max_chars_check: int = 10_000,
+        num_workers: int = 0,
+        header_footer_ignore_digits: bool = False,
     ):
         """
         :param clean_header_footer: Use heuristic to remove footers and headers across different pages by searching
                                      for the longest common string. This heuristic uses exact matches and therefore
                                      works well for footers like "Copyright 2019 by XXX", but won't detect "Page 3 of 4"
-                                     or similar.
+                                     or similar unless `header_footer_ignore_digits` is set.
         :param clean_whitespace: Strip whitespaces before or after each line in the text.
         :param clean_empty_lines: Remove more than two empty lines in the text.
         :param remove_substrings: Remove specified substrings from the text. If no value is provided an empty list is created by default.
@@ -104,6 +182,13 @@ class PreProcessor(BasePreProcessor):
                                 in between pages by `PDFToTextConverter`, `TikaConverter`, `ParsrConverter` and
                                 `AzureConverter`.
         :param max_chars_check: the maximum length a document is expected to have. Each document that is longer than max_chars_check in characters after pre-processing will raise a warning.
+        :param num_workers: Number of worker processes used to preprocess a list of documents. The documents are split
+                            into chunks of similar size in characters, and the output keeps the order of the input.
+                            The worker processes are started on first use and kept until `close()` is called.
+                            Set to 0 or 1 to preprocess in the current process.
+        :param header_footer_ignore_digits: Whether the header and footer detection treats strings that only differ in
+                                            their digits as equal, so that headers and footers with page numbers like
+                                            "Page 3 of 4" are removed as well.
         """
         if remove_substrings is None:
             remove_substrings = []
@@ -134,6 +219,27 @@ class PreProcessor(BasePreProcessor):
         self.progress_bar = progress_bar
         self.add_page_number = add_page_number
         self.max_chars_check = max_chars_check
+        self.num_workers = num_workers
+        self.header_footer_ignore_digits = header_footer_ignore_digits
+        self._worker_pool: Optional[ProcessPoolExecutor] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pool can't be sent to the worker processes, they only need the configuration
+        state = self.__dict__.copy()
+        state["_worker_pool"] = None
+        return state
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker processes started for `num_workers`. They're started again if needed.
+        """
+        worker_pool = getattr(self, "_worker_pool", None)
+        if worker_pool is not None:
+            self._worker_pool = None
+            worker_pool.shutdown(wait=False)
 
     def process(
         self,
@@ -257,12 +363,56 @@ class PreProcessor(BasePreProcessor):
     def _process_batch(
         self, documents: List[Union[dict, Document]], id_hash_keys: Optional[List[str]] = None, **kwargs
     ) -> List[Document]:
-        nested_docs = [
-            self._process_single(d, id_hash_keys=id_hash_keys, **kwargs)
-            for d in tqdm(documents, disable=not self.progress_bar, desc="Preprocessing", unit="docs")
-        ]
+        if self.num_workers > 1 and len(documents) > 1:
+            nested_docs = self._process_batch_in_workers(documents, id_hash_keys=id_hash_keys, **kwargs)
+        else:
+            nested_docs = [
+                self._process_single(d, id_hash_keys=id_hash_keys, **kwargs)
+                for d in tqdm(documents, disable=not self.progress_bar, desc="Preprocessing", unit="docs")
+            ]
         return [d for x in nested_docs for d in x]
 
+    def _process_batch_in_workers(
+        self, documents: List[Union[dict, Document]], id_hash_keys: Optional[List[str]] = None, **kwargs
+    ) -> List[List[Document]]:
+        if self._worker_pool is None:
+            self._worker_pool = ProcessPoolExecutor(
+                max_workers=self.num_workers, initializer=_init_preprocessor_worker, initargs=(self,)
+            )
+        # A few chunks per worker balance the load when document sizes vary a lot. Each task gets the current
+        # configuration of this PreProcessor, so changes made after the pool started are respected.
+        chunks = self._chunk_by_size(documents, num_chunks=self.num_workers * 4)
+        futures = [
+            self._worker_pool.submit(_process_documents_in_worker, self, chunk, id_hash_keys, kwargs)
+            for chunk in chunks
+        ]
+        nested_docs: List[List[Document]] = []
+        with tqdm(total=len(documents), disable=not self.progress_bar, desc="Preprocessing", unit="docs") as pbar:
+            for chunk, future in zip(chunks, futures):
+                nested_docs.extend(future.result())
+                pbar.update(len(chunk))
+        return nested_docs
+
+    @staticmethod
+    def _chunk_by_size(documents: List[Union[dict, Document]], num_chunks: int) -> List[List[Union[dict, Document]]]:
+        """
+        Splits the documents into at most `num_chunks` consecutive chunks with a similar number of characters.
+        """
+        sizes = [
+            len((document.get("content") if isinstance(document, dict) else document.content) or "") + 1
+            for document in documents
+        ]
+        target_size = sum(sizes) / num_chunks
+        chunks: List[List[Union[dict, Document]]] = [[]]
+        offset = 0
+        for document, size in zip(documents, sizes):
+            # a document starts a new chunk once the characters before it fill up the chunks so far
+            if chunks[-1] and offset >= len(chunks) * target_size:
+                chunks.append([])
+            chunks[-1].append(document)
+            offset += size
+        return chunks
+
     def clean(
         self,
         document: Union[dict, Document],
@@ -702,7 +852,7 @@ class PreProcessor(BasePreProcessor):
         Heuristic to find footers and headers across different pages by searching for the longest common string.
         For headers we only search in the first n_chars characters (for footer: last n_chars).
         Note: This heuristic uses exact matches and therefore works well for footers like "Copyright 2019 by XXX",
-         but won't detect "Page 3 of 4" or similar.
+         but won't detect "Page 3 of 4" or similar unless `header_footer_ignore_digits` is set.
 
         :param n_chars: number of first/last characters where the header/footer shall be searched in
         :param n_first_pages_to_ignore: number of first pages to ignore (e.g. TOCs often don't contain footer/header)
@@ -711,71 +861,93 @@ class PreProcessor(BasePreProcessor):
         """
 
         pages = text.split("\f")
+        ignore_digits = self.header_footer_ignore_digits
 
         # header
         start_of_pages = [p[:n_chars] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
-        found_header = self._find_longest_common_ngram(start_of_pages)
+        found_header = self._find_longest_common_ngram(start_of_pages, ignore_digits=ignore_digits)
         if found_header:
-            pages = [page.replace(found_header, "") for page in pages]
+            pages = self._remove_from_pages(pages, found_header, ignore_digits=ignore_digits)
 
         # footer
         end_of_pages = [p[-n_chars:] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
-        found_footer = self._find_longest_common_ngram(end_of_pages)
+        found_footer = self._find_longest_common_ngram(end_of_pages, ignore_digits=ignore_digits)
         if found_footer:
-            pages = [page.replace(found_footer, "") for page in pages]
+            pages = self._remove_from_pages(pages, found_footer, ignore_digits=ignore_digits)
         logger.debug("Removed header '%s' and footer '%s' in document", found_header, found_footer)
         text = "\f".join(pages)
         return text
 
-    def _ngram(self, seq: str, n: int) -> Generator[str, None, None]:
+    @staticmethod
+    def _remove_from_pages(pages: List[str], substring: str, ignore_digits: bool) -> List[str]:
+        if not ignore_digits:
+            return [page.replace(substring, "") for page in pages]
+        # Any number may stand where the substring has one
+        pattern = re.compile(r"\d+".join(re.escape(part) for part in DIGITS_PATTERN.split(substring)))
+        return [pattern.sub("", page) for page in pages]
+
+    @staticmethod
+    def _ngram_tokens(seq: str) -> List[str]:
         """
-        Return ngram (of tokens - currently split by whitespace)
-        :param seq: str, string from which the ngram shall be created
-        :param n: int, n of ngram
-        :return: str, ngram as string
+        Split a string into the tokens n-grams are built from (currently split by whitespace)
         """
-
         # In order to maintain the original whitespace, but still consider \n and \t for n-gram tokenization,
-        # we add a space here and remove it after creation of the ngrams again (see below)
-        seq = seq.replace("\n", " \n")
-        seq = seq.replace("\t", " \t")
-
-        words = seq.split(" ")
-        ngrams = (
-            " ".join(words[i : i + n]).replace(" \n", "\n").replace(" \t", "\t") for i in range(0, len(words) - n + 1)
-        )
-
-        return ngrams
+        # we add a space here and remove it after joining the tokens again (see _join_ngram_tokens)
+        return seq.replace("\n", " \n").replace("\t", " \t").split(" ")
 
-    def _allngram(self, seq: str, min_ngram: int, max_ngram: int) -> Set[str]:
-        lengths = range(min_ngram, max_ngram) if max_ngram else range(min_ngram, len(seq))
-        ngrams = map(partial(self._ngram, seq), lengths)
-        res = set(chain.from_iterable(ngrams))
-        return res
+    @staticmethod
+    def _join_ngram_tokens(tokens: List[str]) -> str:
+        return " ".join(tokens).replace(" \n", "\n").replace(" \t", "\t")
 
     def _find_longest_common_ngram(
-        self, sequences: List[str], max_ngram: int = 30, min_ngram: int = 3
+        self, sequences: List[str], max_ngram: int = 30, min_ngram: int = 3, ignore_digits: bool = False
     ) -> Optional[str]:
         """
         Find the longest common ngram across different text sequences (e.g. start of pages).
         Considering all ngrams between the specified range. Helpful for finding footers, headers etc.
 
+        Runs in linear time in the total number of tokens: for every token of the shortest sequence, it computes
+        the longest run of tokens ending there that all other sequences contain too, using a suffix automaton of
+        each of them.
+
         :param sequences: list[str], list of strings that shall be searched for common n_grams
-        :param max_ngram: int, maximum length of ngram to consider
+        :param max_ngram: int, maximum length of ngram to consider (exclusive)
         :param min_ngram: minimum length of ngram to consider
-        :return: str, common string of all sections
+        :param ignore_digits: whether tokens that only differ in their digits count as equal, e.g. "3" and "4"
+        :return: str, common string of all sections, taken from the shortest sequence
         """
         sequences = [s for s in sequences if s]  # filter empty sequences
         if not sequences:
             return None
-        seqs_ngrams = map(partial(self._allngram, min_ngram=min_ngram, max_ngram=max_ngram), sequences)
-        intersection = reduce(set.intersection, seqs_ngrams)
 
-        try:
-            longest = max(intersection, key=len)
-        except ValueError:
-            # no common sequence found
-            longest = ""
+        tokenized = [self._ngram_tokens(s) for s in sequences]
+        token_ids: Dict[str, int] = {}
+        encoded = [
+            [token_ids.setdefault(DIGITS_PATTERN.sub("0", t) if ignore_digits else t, len(token_ids)) for t in tokens]
+            for tokens in tokenized
+        ]
+        reference_idx = min(range(len(encoded)), key=lambda idx: len(encoded[idx]))
+        reference = encoded[reference_idx]
+
+        common_run_lengths = list(range(1, len(reference) + 1))
+        for idx, sequence in enumerate(encoded):
+            if idx == reference_idx:
+                continue
+            run_lengths = _run_lengths_contained_in(reference, sequence)
+            common_run_lengths = [min(common, run) for common, run in zip(common_run_lengths, run_lengths)]
+            if max(common_run_lengths) < min_ngram:
+                return None
+
+        # Adding a token never makes an ngram shorter, so the longest candidate ending at a token uses as many
+        # tokens as allowed
+        max_tokens = max_ngram - 1 if max_ngram else len(reference)
+        longest = ""
+        for end, run_length in enumerate(common_run_lengths, start=1):
+            n = min(run_length, max_tokens)
+            if n >= min_ngram:
+                candidate = self._join_ngram_tokens(tokenized[reference_idx][end - n : end])
+                if len(candidate) > len(longest):
+                    longest = candidate
         return longest if longest.strip() else None
 
     def _split_sentences(self, text: str) -> List[str]:
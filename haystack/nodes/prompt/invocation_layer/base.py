@@ -12,6 +12,10 @@ class PromptModelInvocationLayer:
 
     invocation_layer_providers: List[Type["PromptModelInvocationLayer"]] = []
 
+    # Whether `invoke` may be called from several threads at once. Remote API layers set this to True so that
+    # PromptNode.run_batch can send the prompts of a batch concurrently instead of one after the other.
+    supports_concurrent_invocation: bool = False
+
     def __init__(self, model_name_or_path: str, **kwargs):
         """
         Creates a new PromptModelInvocationLayer instance.
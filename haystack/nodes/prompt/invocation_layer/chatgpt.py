@@ -46,7 +46,8 @@ class ChatGPTInvocationLayer(OpenAIInvocationLayer):
                 f"For more details, see this [GitHub discussion](https://github.com/openai/openai-python/blob/main/chatml.md)."
             )
 
-        kwargs_with_defaults = self.model_input_kwargs
+        # copy so that concurrent invocations never see each other's per-call kwargs
+        kwargs_with_defaults = dict(self.model_input_kwargs)
         if kwargs:
             # we use keyword stop_words but OpenAI uses stop
             if "stop_words" in kwargs:
@@ -33,6 +33,8 @@ class HFInferenceEndpointInvocationLayer(PromptModelInvocationLayer):
 
     """
 
+    supports_concurrent_invocation = True
+
     def __init__(self, api_key: str, model_name_or_path: str, max_length: Optional[int] = 100, **kwargs):
         """
          Creates an instance of HFInferenceEndpointInvocationLayer
@@ -104,7 +106,8 @@ class HFInferenceEndpointInvocationLayer(PromptModelInvocationLayer):
             )
         stop_words = kwargs.pop("stop_words", None)
 
-        kwargs_with_defaults = self.model_input_kwargs
+        # copy so that concurrent invocations never see each other's per-call kwargs
+        kwargs_with_defaults = dict(self.model_input_kwargs)
         if "max_new_tokens" not in kwargs_with_defaults:
             kwargs_with_defaults["max_new_tokens"] = self.max_length
 
@@ -90,6 +90,11 @@ class OpenAIInvocationLayer(PromptModelInvocationLayer):
     def url(self) -> str:
         return "https://api.openai.com/v1/completions"
 
+    @property
+    def supports_concurrent_invocation(self) -> bool:  # type: ignore[override]
+        # Streamed tokens of concurrent invocations would interleave in the stream handler
+        return not (self.model_input_kwargs.get("stream") or self.model_input_kwargs.get("stream_handler"))
+
     @property
     def headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
@@ -110,7 +115,8 @@ class OpenAIInvocationLayer(PromptModelInvocationLayer):
                 f"Make sure to provide prompt in kwargs."
             )
 
-        kwargs_with_defaults = self.model_input_kwargs
+        # copy so that concurrent invocations never see each other's per-call kwargs
+        kwargs_with_defaults = dict(self.model_input_kwargs)
         if kwargs:
             # we use keyword stop_words but OpenAI uses stop
             if "stop_words" in kwargs:
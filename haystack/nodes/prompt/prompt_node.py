@@ -11,6 +11,7 @@ from haystack.nodes.base import BaseComponent
 
 from haystack.schema import Document, MultiLabel
 from haystack.telemetry import send_event
+from haystack.utils.requests import concurrent_map
 from haystack.nodes.prompt.shapers import BaseOutputParser
 from haystack.nodes.prompt.prompt_model import PromptModel
 from haystack.nodes.prompt.prompt_template import PromptTemplate, get_predefined_prompt_templates
@@ -339,7 +340,8 @@ class PromptNode(BaseComponent):
         # so that they can be returned by `run()` as part of the pipeline's debug output.
         prompt_collector: List[str] = []
 
-        invocation_context = invocation_context or {}
+        # Copy the invocation context, as nodes of other branches can get the same one
+        invocation_context = dict(invocation_context or {})
         if query and "query" not in invocation_context.keys():
             invocation_context["query"] = query
 
@@ -405,15 +407,26 @@ class PromptNode(BaseComponent):
                 - prompt text: Uses a copy of the default prompt template with the given prompt text.
         """
         inputs = PromptNode._flatten_inputs(queries, documents, invocation_contexts, prompt_templates)
-        all_results: Dict[str, List] = defaultdict(list)
-        for query, docs, invocation_context, prompt_template in zip(
-            inputs["queries"], inputs["documents"], inputs["invocation_contexts"], inputs["prompt_templates"]
-        ):
-            prompt_template = self.get_prompt_template(self.default_prompt_template)
-            output_variable = self.output_variable or prompt_template.output_variable or "results"
-            results = self.run(
+        prompt_template = self.get_prompt_template(self.default_prompt_template)
+        output_variable = self.output_variable or prompt_template.output_variable or "results"
+
+        def run_single(run_inputs: Tuple[Any, Any, Any, Any]) -> Dict[str, Any]:
+            query, docs, invocation_context, _ = run_inputs
+            return self.run(
                 query=query, documents=docs, invocation_context=invocation_context, prompt_template=prompt_template
             )[0]
+
+        # Remote invocation layers get the inputs concurrently, local models one after the other
+        invocation_layer = self.prompt_model.model_invocation_layer
+        max_concurrency = None if getattr(invocation_layer, "supports_concurrent_invocation", False) is True else 1
+        all_runs = concurrent_map(
+            run_single,
+            zip(inputs["queries"], inputs["documents"], inputs["invocation_contexts"], inputs["prompt_templates"]),
+            max_concurrency=max_concurrency,
+        )
+
+        all_results: Dict[str, List] = defaultdict(list)
+        for results in all_runs:
             all_results[output_variable].append(results[output_variable])
             all_results["invocation_contexts"].append(results["invocation_context"])
             if self.debug:
@@ -39,6 +39,8 @@ class SentenceTransformersRanker(BaseRanker):
     ```
     """
 
+    mutates_inputs = True
+
     def __init__(
         self,
         model_name_or_path: Union[str, Path],
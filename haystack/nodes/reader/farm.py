@@ -70,6 +70,8 @@ class FARMReader(BaseReader):
         force_download=False,
         use_auth_token: Optional[Union[str, bool]] = None,
         max_query_length: int = 64,
+        tokenization_cache_size: int = 1000,
+        dynamic_padding: bool = False,
     ):
         """
         :param model_name_or_path: Directory of a saved model or the name of a public model e.g. 'bert-base-cased',
@@ -130,6 +132,13 @@ class FARMReader(BaseReader):
                                Additional information can be found here
                                https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
         :param max_query_length: Maximum length of the question in number of tokens.
+        :param tokenization_cache_size: Number of tokenized documents to keep in memory, so that documents that the
+                                        reader gets again for another query aren't tokenized again. Set to 0 to
+                                        disable the cache.
+        :param dynamic_padding: Whether to group passages of similar length into batches and to trim the padding of
+                                each batch to its longest passage. This speeds up inference when the documents are
+                                shorter than `max_seq_len`, especially on CPU. Confidence scores can change slightly as
+                                padding tokens no longer take part in their softmax.
         """
         super().__init__()
 
@@ -154,6 +163,7 @@ class FARMReader(BaseReader):
             devices=self.devices,  # type: ignore [arg-type]
             use_auth_token=use_auth_token,
             max_query_length=max_query_length,
+            dynamic_padding=dynamic_padding,
         )
         self.inferencer.model.prediction_heads[0].context_window_size = context_window_size
         self.inferencer.model.prediction_heads[0].no_ans_boost = no_ans_boost
@@ -161,6 +171,7 @@ class FARMReader(BaseReader):
         self.inferencer.model.prediction_heads[0].n_best_per_sample = top_k_per_sample
         self.inferencer.model.prediction_heads[0].duplicate_filtering = duplicate_filtering
         self.inferencer.model.prediction_heads[0].use_confidence_scores_for_ranking = use_confidence_scores
+        self.inferencer.processor.document_cache_size = tokenization_cache_size
         self.max_seq_len = max_seq_len
         self.doc_stride = doc_stride
         self.max_query_length = max_query_length
@@ -1191,6 +1202,12 @@ class FARMReader(BaseReader):
                 if self._check_no_answer(ans):
                     pass
                 else:
+                    if ans.score > best_score_answer:
+                        best_score_answer = ans.score
+                    # Only take n best candidates. Answers coming back from FARM are sorted with decreasing relevance
+                    if len(answers_per_document) == self.top_k_per_candidate:
+                        continue
+
                     cur = Answer(
                         answer=ans.answer,
                         type="extractive",
@@ -1208,11 +1225,7 @@ class FARMReader(BaseReader):
 
                     answers_per_document.append(cur)
 
-                    if ans.score > best_score_answer:
-                        best_score_answer = ans.score
-
-            # Only take n best candidates. Answers coming back from FARM are sorted with decreasing relevance
-            answers += answers_per_document[: self.top_k_per_candidate]
+            answers += answers_per_document
 
         # calculate the score for predicting 'no answer', relative to our best positive answer score
         no_ans_prediction, max_no_ans_gap = self._calc_no_answer(
@@ -11,7 +11,6 @@ except ImportError:
     from typing_extensions import Literal  # type: ignore
 
 import numpy as np
-import requests
 import torch
 from sentence_transformers import InputExample
 from torch.utils.data import DataLoader
@@ -32,6 +31,7 @@ from haystack.nodes.retriever._losses import _TRAINING_LOSSES
 from haystack.nodes.retriever._openai_encoder import _OpenAIEmbeddingEncoder
 from haystack.schema import Document
 from haystack.telemetry import send_event
+from haystack.utils.requests import concurrent_map, get_session
 
 from ._base_embedding_encoder import _BaseEmbeddingEncoder
 
@@ -388,7 +388,9 @@ class _CohereEmbeddingEncoder(_BaseEmbeddingEncoder):
     def embed(self, model: str, text: List[str]) -> np.ndarray:
         payload = {"model": model, "texts": text, "truncate": "END"}
         headers = {"Authorization": f"BEARER {self.api_key}", "Content-Type": "application/json"}
-        response = requests.request("POST", self.url, headers=headers, data=json.dumps(payload), timeout=COHERE_TIMEOUT)
+        response = get_session().request(
+            "POST", self.url, headers=headers, data=json.dumps(payload), timeout=COHERE_TIMEOUT
+        )
         res = json.loads(response.text)
         if response.status_code == 401:
             raise CohereUnauthorizedError(f"Invalid Cohere API key. {response.text}")
@@ -398,13 +400,15 @@ class _CohereEmbeddingEncoder(_BaseEmbeddingEncoder):
         return np.array(generated_embeddings)
 
     def embed_batch(self, text: List[str]) -> np.ndarray:
-        all_embeddings = []
-        for i in tqdm(
-            range(0, len(text), self.batch_size), disable=not self.progress_bar, desc="Calculating embeddings"
-        ):
-            batch = text[i : i + self.batch_size]
-            generated_embeddings = self.embed(self.model, batch)
-            all_embeddings.append(generated_embeddings)
+        batches = [text[i : i + self.batch_size] for i in range(0, len(text), self.batch_size)]
+        with tqdm(total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings") as progress_bar:
+
+            def embed_single_batch(batch: List[str]) -> np.ndarray:
+                generated_embeddings = self.embed(self.model, batch)
+                progress_bar.update(1)
+                return generated_embeddings
+
+            all_embeddings = concurrent_map(embed_single_batch, batches)
         return np.concatenate(all_embeddings)
 
     def embed_queries(self, queries: List[str]) -> np.ndarray:
@@ -1,9 +1,7 @@
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import cpu_count
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import numpy as np
 from tqdm.auto import tqdm
@@ -12,6 +10,7 @@ from haystack.environment import HAYSTACK_REMOTE_API_TIMEOUT_SEC
 from haystack.nodes.retriever._base_embedding_encoder import _BaseEmbeddingEncoder
 from haystack.schema import Document
 from haystack.utils.openai_utils import USE_TIKTOKEN, count_openai_tokens, load_openai_tokenizer, openai_request
+from haystack.utils.requests import concurrent_map
 from haystack.telemetry import send_event
 
 if TYPE_CHECKING:
@@ -106,16 +105,13 @@ class _OpenAIEmbeddingEncoder(_BaseEmbeddingEncoder):
         headers: Dict[str, str] = {"Content-Type": "application/json"}
 
         def azure_get_embedding(input: str):
-            headers["api-key"] = str(self.api_key)
             azure_payload: Dict[str, str] = {"input": input}
             res = openai_request(url=self.url, headers=headers, payload=azure_payload, timeout=OPENAI_TIMEOUT)
             return res["data"][0]["embedding"]
 
         if self.using_azure:
-            thread_count = cpu_count() if len(text) > cpu_count() else len(text)
-            with ThreadPoolExecutor(max_workers=thread_count) as executor:
-                results: Iterator[Dict[str, Any]] = executor.map(azure_get_embedding, text)
-                generated_embeddings.extend(results)
+            headers["api-key"] = str(self.api_key)
+            generated_embeddings = concurrent_map(azure_get_embedding, text)
         else:
             payload: Dict[str, Union[List[str], str]] = {"model": model, "input": text}
             headers["Authorization"] = f"Bearer {self.api_key}"
@@ -130,14 +126,17 @@ class _OpenAIEmbeddingEncoder(_BaseEmbeddingEncoder):
         return np.array(generated_embeddings)
 
     def embed_batch(self, model: str, text: List[str]) -> np.ndarray:
-        all_embeddings = []
-        for i in tqdm(
-            range(0, len(text), self.batch_size), disable=not self.progress_bar, desc="Calculating embeddings"
-        ):
-            batch = text[i : i + self.batch_size]
-            batch_limited = [self._ensure_text_limit(content) for content in batch]
-            generated_embeddings = self.embed(model, batch_limited)
-            all_embeddings.append(generated_embeddings)
+        # Truncate up front: the tokenizer isn't safe to share between the threads that send the batches
+        text_limited = [self._ensure_text_limit(content) for content in text]
+        batches = [text_limited[i : i + self.batch_size] for i in range(0, len(text_limited), self.batch_size)]
+        with tqdm(total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings") as progress_bar:
+
+            def embed_single_batch(batch: List[str]) -> np.ndarray:
+                generated_embeddings = self.embed(model, batch)
+                progress_bar.update(1)
+                return generated_embeddings
+
+            all_embeddings = concurrent_map(embed_single_batch, batches)
         return np.concatenate(all_embeddings)
 
     def embed_queries(self, queries: List[str]) -> np.ndarray:
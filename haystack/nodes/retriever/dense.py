@@ -54,6 +54,8 @@ class DenseRetriever(BaseRetriever):
     Base class for all dense retrievers.
     """
 
+    mutates_inputs = True
+
     @abstractmethod
     def embed_queries(self, queries: List[str]) -> np.ndarray:
         """
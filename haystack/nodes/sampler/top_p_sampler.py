@@ -44,6 +44,8 @@ class TopPSampler(BaseSampler):
     ```
     """
 
+    mutates_inputs = True
+
     def __init__(
         self,
         model_name_or_path: Union[str, Path] = "cross-encoder/ms-marco-MiniLM-L-6-v2",
@@ -50,6 +50,8 @@ class TransformersSummarizer(BaseSummarizer):
     ```
     """
 
+    mutates_inputs = True
+
     def __init__(
         self,
         model_name_or_path: str = "google/pegasus-xsum",
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from functools import partial
 from hashlib import md5
 from time import time
-from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Set, Tuple, Union
 
 try:
     from typing import Literal
@@ -18,6 +20,7 @@ import json
 import inspect
 import logging
 import tempfile
+import threading
 from pathlib import Path
 
 import yaml
@@ -62,6 +65,36 @@ CODE_GEN_DEFAULT_COMMENT = "This code has been generated."
 TRACKING_TOOL_TO_HEAD = {"mlflow": MLflowTrackingHead}
 
 
+class _ExecutionPlan:
+    """
+    Lookup tables that the Pipeline uses to schedule its nodes, computed once per graph by `Pipeline.compile()`.
+    """
+
+    def __init__(self, graph: DiGraph, valid_global_params: Set[str]):
+        """
+        :param graph: The graph of the Pipeline.
+        :param valid_global_params: The params that can be passed to `run()` without a node name.
+        """
+        self.graph = graph
+        self.valid_global_params: FrozenSet[str] = frozenset(valid_global_params)
+        self.ancestors: Dict[str, FrozenSet[str]] = {}
+        # node_id -> successors in edge order, and node_id -> {edge label -> successors in edge order}
+        self.successors: Dict[str, List[str]] = {}
+        self.routes: Dict[str, Dict[str, List[str]]] = {}
+        for node_id in graph.nodes:
+            self.ancestors[node_id] = frozenset(nx.ancestors(graph, node_id))
+            self.successors[node_id] = []
+            self.routes[node_id] = {}
+            for _, next_node, data in graph.edges(node_id, data=True):
+                self.successors[node_id].append(next_node)
+                self.routes[node_id].setdefault(data["label"], []).append(next_node)
+
+    def next_nodes(self, node_id: str, stream_id: str) -> List[str]:
+        if not stream_id or stream_id == "output_all":
+            return self.successors[node_id]
+        return self.routes[node_id].get(stream_id, [])
+
+
 class Pipeline:
     """
     Pipeline brings together building blocks to build a complex search pipeline with Haystack and user-defined components.
@@ -69,10 +102,55 @@ class Pipeline:
     Under the hood, a Pipeline is represented as a directed acyclic graph of component nodes. You can use it for custom query flows with the option to branch queries (for example, extractive question answering and keyword match query), merge candidate documents for a Reader from multiple Retrievers, or re-ranking of candidate documents.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        :param max_workers: The number of threads used to run independent branches of the pipeline concurrently,
+                            for example two Retrievers feeding a JoinDocuments node. Nodes only run concurrently once
+                            all their inputs are available, and the results are the same as when running the nodes
+                            one at a time. By default (`None`), nodes run one at a time in the calling thread.
+                            The threads are shared by all runs of the pipeline, including concurrent ones, and are
+                            stopped by `close()`. Nodes of independent branches must be thread-safe, and a node
+                            object used in several branches may be run by two threads at the same time.
+        """
         self.graph = DiGraph()
         self.config_hash = None
         self.last_config_hash = None
+        self.max_workers = max_workers
+        self._execution_plan: Optional[_ExecutionPlan] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def close(self):
+        """
+        Stops the threads used to run branches concurrently (see `max_workers`). They're started again when needed,
+        so the pipeline can still be run afterwards.
+        """
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    def __del__(self):
+        self.close()
+
+    def __getstate__(self):
+        # Threads and locks can't be copied or pickled, a copy starts its own threads when needed
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state.pop("_executor_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="haystack-pipeline"
+                )
+            return self._executor
 
     @property
     def root_node(self) -> Optional[str]:
@@ -433,6 +511,8 @@ class Pipeline:
         Used for telemetry. Hashes the config, except for the node names, to send an event only when the pipeline changes.
         See haystack/telemetry.py::send_pipeline_event
         """
+        # The graph changed, so the execution plan needs to be compiled again
+        self._execution_plan = None
         try:
             config_to_hash = copy.copy(self.get_config())
             for comp in config_to_hash["components"]:
@@ -462,10 +542,34 @@ class Pipeline:
         :param component: The component object to be set at the node.
         """
         self.graph.nodes[name]["component"] = component
+        self._execution_plan = None
+
+    def compile(self):
+        """
+        Computes the tables that the Pipeline uses to schedule its nodes: the ancestors of each node, the successors
+        of each node per output edge, and the params that can be passed to all nodes. `run()` and `run_batch()`
+        compile the Pipeline when it changed, so you only need to call this to take the work out of the first run.
+        """
+        # "debug" will be picked up by _dispatch_run, see its code
+        # "add_isolated_node_eval" is set by pipeline.eval / pipeline.eval_batch
+        valid_global_params = {"debug", "add_isolated_node_eval"}
+        for node_id in self.graph.nodes:
+            valid_global_params |= set(self._get_run_node_signature(node_id))
+        self._execution_plan = _ExecutionPlan(graph=self.graph, valid_global_params=valid_global_params)
+
+    def _get_execution_plan(self) -> _ExecutionPlan:
+        execution_plan = getattr(self, "_execution_plan", None)
+        if execution_plan is None or execution_plan.graph is not self.graph:
+            self.compile()
+            execution_plan = self._execution_plan
+        return execution_plan  # type: ignore [return-value]
 
     def _run_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
         return self.graph.nodes[node_id]["component"]._dispatch_run(**node_input)
 
+    async def _run_node_async(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+        return await self.graph.nodes[node_id]["component"]._dispatch_run_async(**node_input)
+
     def run(  # type: ignore
         self,
         query: Optional[str] = None,
@@ -477,7 +581,8 @@ class Pipeline:
         debug: Optional[bool] = None,
     ):
         """
-        Runs the Pipeline, one node at a time.
+        Runs the Pipeline. Nodes run one at a time, unless the Pipeline was created with `max_workers`, in which
+        case independent branches run concurrently.
 
         :param query: The search query (for query pipelines only).
         :param file_paths: The files to index (for indexing pipelines only).
@@ -510,98 +615,129 @@ class Pipeline:
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
-        node_output = None
-        queue: Dict[str, Any] = {
-            root_node: {"root_node": root_node, "params": params}
-        }  # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        root_input, join_input = self._get_run_inputs(
+            root_node=root_node,
+            params=params,
+            query=query,
+            file_paths=file_paths,
+            labels=labels,
+            documents=documents,
+            meta=meta,
+        )
+
+        def run_node(node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+            start = time()
+            node_output, stream_id = self._run_node(node_id, node_input)
+            if "_debug" in node_output and node_id in node_output["_debug"]:
+                node_output["_debug"][node_id]["exec_time_ms"] = round((time() - start) * 1000, 2)
+            return node_output, stream_id
+
+        return self._run_graph(
+            root_input=root_input, params=params, debug=debug, run_node=run_node, join_input=join_input
+        )
+
+    async def run_async(
+        self,
+        query: Optional[str] = None,
+        file_paths: Optional[List[str]] = None,
+        labels: Optional[MultiLabel] = None,
+        documents: Optional[List[Document]] = None,
+        meta: Optional[Union[dict, List[dict]]] = None,
+        params: Optional[dict] = None,
+        debug: Optional[bool] = None,
+    ):
+        """
+        Runs the Pipeline on the running asyncio event loop. Takes the same parameters and returns the same output as
+        `run()`.
+
+        Nodes that implement the optional `async_run()` coroutine method are awaited on the event loop, so that
+        network-bound nodes don't hold a thread while waiting for a response. All other nodes run in the default
+        executor of the event loop. Nodes whose predecessors all ran are executed concurrently.
+
+        :param query: The search query (for query pipelines only).
+        :param file_paths: The files to index (for indexing pipelines only).
+        :param labels: Ground-truth labels that you can use to perform an isolated evaluation of pipelines. These labels are input to nodes in the pipeline.
+        :param documents: A list of Document objects to be processed by the Pipeline Nodes.
+        :param meta: Files' metadata. Used in indexing pipelines in combination with `file_paths`.
+        :param params: A dictionary of parameters that you want to pass to the nodes.
+                       To pass a parameter to all Nodes, use: `{"top_k": 10}`.
+                       To pass a parameter to targeted Nodes, run:
+                        `{"Retriever": {"top_k": 10}, "Reader": {"top_k": 3, "debug": True}}`
+        :param debug: Specifies whether the Pipeline should instruct Nodes to collect debug information
+                      about their execution. By default, this information includes the input parameters
+                      the Nodes received and the output they generated. You can then find all debug information in the dictionary returned by this method under the key `_debug`.
+        """
+        send_pipeline_event(
+            pipeline=self,
+            query=query,
+            file_paths=file_paths,
+            labels=labels,
+            documents=documents,
+            meta=meta,
+            params=params,
+            debug=debug,
+        )
+
+        # validate the node names
+        self._validate_node_names_in_params(params=params)
+
+        root_node = self.root_node
+        if not root_node:
+            raise PipelineError("Cannot run a pipeline with no nodes.")
+
+        root_input, join_input = self._get_run_inputs(
+            root_node=root_node,
+            params=params,
+            query=query,
+            file_paths=file_paths,
+            labels=labels,
+            documents=documents,
+            meta=meta,
+        )
+        return await self._run_graph_async(root_input=root_input, params=params, debug=debug, join_input=join_input)
+
+    def _get_run_inputs(
+        self,
+        root_node: str,
+        params: Optional[dict],
+        query: Optional[str] = None,
+        file_paths: Optional[List[str]] = None,
+        labels: Optional[MultiLabel] = None,
+        documents: Optional[List[Document]] = None,
+        meta: Optional[Union[dict, List[dict]]] = None,
+    ) -> Tuple[Dict[str, Any], Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Returns the input of the root node and the function building the input of join nodes for `run()`.
+        """
+        root_input: Dict[str, Any] = {"root_node": root_node, "params": params}
         if query is not None:
-            queue[root_node]["query"] = query
+            root_input["query"] = query
         if file_paths:
-            queue[root_node]["file_paths"] = file_paths
+            root_input["file_paths"] = file_paths
         if labels:
-            queue[root_node]["labels"] = labels
+            root_input["labels"] = labels
         if documents:
-            queue[root_node]["documents"] = documents
+            root_input["documents"] = documents
         if meta:
-            queue[root_node]["meta"] = meta
-
-        i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
-        while queue:
-            node_id = list(queue.keys())[i]
-            node_input = queue[node_id]
-            node_input["node_id"] = node_id
-
-            # Apply debug attributes to the node input params
-            # NOTE: global debug attributes will override the value specified
-            # in each node's params dictionary.
-            if debug is None and node_input:
-                if node_input.get("params", {}):
-                    debug = params.get("debug", None)  # type: ignore
-            if debug is not None:
-                if not node_input.get("params", None):
-                    node_input["params"] = {}
-                if node_id not in node_input["params"].keys():
-                    node_input["params"][node_id] = {}
-                node_input["params"][node_id]["debug"] = debug
-
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
-                try:
-                    logger.debug("Running node '%s` with input: %s", node_id, node_input)
-                    start = time()
-                    node_output, stream_id = self._run_node(node_id, node_input)
-                    if "_debug" in node_output and node_id in node_output["_debug"]:
-                        node_output["_debug"][node_id]["exec_time_ms"] = round((time() - start) * 1000, 2)
-                except Exception as e:
-                    # The input might be a really large object with thousands of embeddings.
-                    # If you really want to see it, raise the log level.
-                    logger.debug("Exception while running node '%s' with input %s", node_id, node_input)
-                    raise Exception(
-                        f"Exception while running node '{node_id}': {e}\nEnable debug logging to see the data that was passed when the pipeline failed."
-                    ) from e
-                queue.pop(node_id)
-                #
-                if stream_id == "split":
-                    for stream_id in [key for key in node_output.keys() if key.startswith("output_")]:
-                        current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
-                        current_docs = node_output.pop(stream_id)
-                        current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
-                        for n in next_nodes:
-                            queue[n] = current_node_output
-                else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
-                    for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
-                        if queue.get(n):  # concatenate inputs if it's a join node
-                            existing_input = queue[n]
-                            if "inputs" not in existing_input.keys():
-                                updated_input: dict = {"inputs": [existing_input, node_output], "params": params}
-                                if "_debug" in existing_input.keys() or "_debug" in node_output.keys():
-                                    updated_input["_debug"] = {
-                                        **existing_input.get("_debug", {}),
-                                        **node_output.get("_debug", {}),
-                                    }
-                                if query:
-                                    updated_input["query"] = query
-                                if file_paths:
-                                    updated_input["file_paths"] = file_paths
-                                if labels:
-                                    updated_input["labels"] = labels
-                                if documents:
-                                    updated_input["documents"] = documents
-                                if meta:
-                                    updated_input["meta"] = meta
-                            else:
-                                existing_input["inputs"].append(node_output)
-                                updated_input = existing_input
-                            queue[n] = updated_input
-                        else:
-                            queue[n] = node_output
-                i = 0
-            else:
-                i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
-
-        return node_output
+            root_input["meta"] = meta
+
+        def join_input(existing_input: Dict[str, Any], node_output: Dict[str, Any]) -> Dict[str, Any]:
+            updated_input: dict = {"inputs": [existing_input, node_output], "params": params}
+            if "_debug" in existing_input.keys() or "_debug" in node_output.keys():
+                updated_input["_debug"] = {**existing_input.get("_debug", {}), **node_output.get("_debug", {})}
+            if query:
+                updated_input["query"] = query
+            if file_paths:
+                updated_input["file_paths"] = file_paths
+            if labels:
+                updated_input["labels"] = labels
+            if documents:
+                updated_input["documents"] = documents
+            if meta:
+                updated_input["meta"] = meta
+            return updated_input
+
+        return root_input, join_input
 
     def run_batch(  # type: ignore
         self,
@@ -680,87 +816,263 @@ class Pipeline:
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
-        node_output = None
-        queue: Dict[str, Any] = {
-            root_node: {"root_node": root_node, "params": params}
-        }  # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        root_input: Dict[str, Any] = {"root_node": root_node, "params": params}
         if queries:
-            queue[root_node]["queries"] = queries
+            root_input["queries"] = queries
         if file_paths:
-            queue[root_node]["file_paths"] = file_paths
+            root_input["file_paths"] = file_paths
         if labels:
-            queue[root_node]["labels"] = labels
+            root_input["labels"] = labels
         if documents:
-            queue[root_node]["documents"] = documents
+            root_input["documents"] = documents
         if meta:
-            queue[root_node]["meta"] = meta
-
-        i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
-        while queue:
-            node_id = list(queue.keys())[i]
-            node_input = queue[node_id]
-            node_input["node_id"] = node_id
-
-            # Apply debug attributes to the node input params
-            # NOTE: global debug attributes will override the value specified in each node's params dictionary.
-            if debug is None and node_input:
-                if node_input.get("params", {}):
-                    debug = params.get("debug", None)  # type: ignore
-            if debug is not None:
-                if not node_input.get("params", None):
-                    node_input["params"] = {}
-                if node_id not in node_input["params"].keys():
-                    node_input["params"][node_id] = {}
-                node_input["params"][node_id]["debug"] = debug
-
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
-                try:
-                    logger.debug("Running node '%s` with input: %s", node_id, node_input)
-                    node_output, stream_id = self.graph.nodes[node_id]["component"]._dispatch_run_batch(**node_input)
-                except Exception as e:
-                    # The input might be a really large object with thousands of embeddings.
-                    # If you really want to see it, raise the log level.
-                    logger.debug("Exception while running node '%s' with input %s", node_id, node_input)
-                    raise Exception(
-                        f"Exception while running node '{node_id}': {e}\nEnable debug logging to see the data that was passed when the pipeline failed."
-                    ) from e
-                queue.pop(node_id)
-
-                if stream_id == "split":
-                    for stream_id in [key for key in node_output.keys() if key.startswith("output_")]:
-                        current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
-                        current_docs = node_output.pop(stream_id)
-                        current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
-                        for n in next_nodes:
-                            queue[n] = current_node_output
-                else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
-                    for n in next_nodes:
-                        if queue.get(n):  # concatenate inputs if it's a join node
-                            existing_input = queue[n]
-                            if "inputs" not in existing_input.keys():
-                                updated_input: Dict = {"inputs": [existing_input, node_output], "params": params}
-                                if queries:
-                                    updated_input["queries"] = queries
-                                if file_paths:
-                                    updated_input["file_paths"] = file_paths
-                                if labels:
-                                    updated_input["labels"] = labels
-                                if documents:
-                                    updated_input["documents"] = documents
-                                if meta:
-                                    updated_input["meta"] = meta
-                            else:
-                                existing_input["inputs"].append(node_output)
-                                updated_input = existing_input
-                            queue[n] = updated_input
+            root_input["meta"] = meta
+
+        def run_node(node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+            return self.graph.nodes[node_id]["component"]._dispatch_run_batch(**node_input)
+
+        def join_input(existing_input: Dict[str, Any], node_output: Dict[str, Any]) -> Dict[str, Any]:
+            updated_input: Dict = {"inputs": [existing_input, node_output], "params": params}
+            if queries:
+                updated_input["queries"] = queries
+            if file_paths:
+                updated_input["file_paths"] = file_paths
+            if labels:
+                updated_input["labels"] = labels
+            if documents:
+                updated_input["documents"] = documents
+            if meta:
+                updated_input["meta"] = meta
+            return updated_input
+
+        return self._run_graph(
+            root_input=root_input, params=params, debug=debug, run_node=run_node, join_input=join_input
+        )
+
+    def _run_graph(
+        self,
+        root_input: Dict[str, Any],
+        params: Optional[dict],
+        debug: Optional[bool],
+        run_node: Callable[[str, Dict[str, Any]], Tuple[Dict, str]],
+        join_input: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+    ) -> Optional[Dict]:
+        """
+        Executes the nodes of the graph, starting with the root node, and returns the output of the last node.
+
+        Nodes are picked from a FIFO queue and run once all their predecessors ran. The outputs of multiple
+        predecessors are merged into the input of "join" nodes in the order in which the predecessors ran.
+        If `max_workers` is set, every queued node whose predecessors all ran is started right away in a thread
+        pool. The queue is still processed in the same order as when running the nodes one at a time, so the
+        outputs are the same in both modes.
+
+        :param root_input: The input of the root node.
+        :param params: The params passed to `run()`.
+        :param debug: The debug flag passed to `run()`.
+        :param run_node: Runs a node on its input and returns its output and stream id.
+        :param join_input: Builds the input of a join node from the outputs of its first two predecessors.
+        """
+        root_node = root_input["root_node"]
+        node_output = None
+        # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        queue: Dict[str, Any] = {root_node: root_input}
+
+        executor = self._get_executor() if self.max_workers else None
+        futures: Dict[str, Future] = {}
+        try:
+            i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
+            while queue:
+                node_id = next(itertools.islice(queue, i, None))
+                node_input = queue[node_id]
+                node_input["node_id"] = node_id
+                debug = self._apply_debug(node_id=node_id, node_input=node_input, params=params, debug=debug)
+
+                if not self._has_queued_predecessors(node_id, queue):  # only execute if predecessor nodes are executed
+                    try:
+                        logger.debug("Running node '%s` with input: %s", node_id, node_input)
+                        if executor is not None:
+                            self._start_ready_nodes(
+                                queue=queue,
+                                started=futures,
+                                start_node=partial(executor.submit, run_node),
+                                params=params,
+                                debug=debug,
+                            )
+                            node_output, stream_id = futures.pop(node_id).result()
                         else:
-                            queue[n] = node_output
-                i = 0
-            else:
-                i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
+                            node_output, stream_id = run_node(node_id, node_input)
+                    except Exception as e:
+                        # The input might be a really large object with thousands of embeddings.
+                        # If you really want to see it, raise the log level.
+                        logger.debug("Exception while running node '%s' with input %s", node_id, node_input)
+                        raise Exception(
+                            f"Exception while running node '{node_id}': {e}\nEnable debug logging to see the data that was passed when the pipeline failed."
+                        ) from e
+                    queue.pop(node_id)
+                    self._enqueue_next_nodes(
+                        queue=queue,
+                        node_id=node_id,
+                        node_output=node_output,
+                        stream_id=stream_id,
+                        join_input=join_input,
+                    )
+                    i = 0
+                else:
+                    i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
+        finally:
+            # Wait for the nodes that are still running after a failure, so that they don't outlive this run
+            for future in futures.values():
+                future.cancel()
+            if futures:
+                wait(futures.values())
+
+        return node_output
+
+    @staticmethod
+    def _apply_debug(
+        node_id: str, node_input: Dict[str, Any], params: Optional[dict], debug: Optional[bool]
+    ) -> Optional[bool]:
+        """
+        Applies the debug attributes to the node input params and returns the (possibly updated) global debug flag.
+        NOTE: global debug attributes will override the value specified in each node's params dictionary.
+        """
+        if debug is None and node_input:
+            if node_input.get("params", {}):
+                debug = params.get("debug", None)  # type: ignore
+        if debug is not None:
+            if not node_input.get("params", None):
+                node_input["params"] = {}
+            if node_id not in node_input["params"].keys():
+                node_input["params"][node_id] = {}
+            node_input["params"][node_id]["debug"] = debug
+        return debug
+
+    def _has_queued_predecessors(self, node_id: str, queue: Dict[str, Any]) -> bool:
+        return not self._get_execution_plan().ancestors[node_id].isdisjoint(queue)
+
+    def _start_ready_nodes(
+        self,
+        queue: Dict[str, Any],
+        started: Dict[str, Any],
+        start_node: Callable[[str, Dict[str, Any]], Any],
+        params: Optional[dict],
+        debug: Optional[bool],
+    ):
+        """
+        Starts all queued nodes that don't have queued predecessors and were not started yet. The input of such a
+        node can't change anymore, as only its predecessors add to it.
+
+        Each node gets its own copy of the input dictionary and params, as the queue shares them between nodes and
+        keeps updating them while the nodes are running.
+
+        :param started: Mapping of the ids of the started nodes to the future or task returned by `start_node`.
+        :param start_node: Starts running a node on its input and returns a future or task.
+        """
+        for node_id, node_input in queue.items():
+            if node_id in started or self._has_queued_predecessors(node_id, queue):
+                continue
+            node_input = {**node_input, "node_id": node_id}
+            node_input["params"] = copy.deepcopy(node_input.get("params"))
+            self._apply_debug(node_id=node_id, node_input=node_input, params=params, debug=debug)
+            started[node_id] = start_node(node_id, node_input)
+
+    def _enqueue_next_nodes(
+        self,
+        queue: Dict[str, Any],
+        node_id: str,
+        node_output: Dict[str, Any],
+        stream_id: str,
+        join_input: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+    ):
+        """
+        Adds the successors of a node that ran to the queue, with its output as their input.
+        """
+        execution_plan = self._get_execution_plan()
+        if stream_id == "split":
+            for stream_id in [key for key in node_output.keys() if key.startswith("output_")]:
+                current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
+                current_docs = node_output.pop(stream_id)
+                current_node_output["documents"] = current_docs
+                next_nodes = execution_plan.next_nodes(node_id, stream_id)
+                for n in next_nodes:
+                    queue[n] = current_node_output
+        else:
+            next_nodes = execution_plan.next_nodes(node_id, stream_id)
+            for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
+                if queue.get(n):  # concatenate inputs if it's a join node
+                    existing_input = queue[n]
+                    if "inputs" not in existing_input.keys():
+                        updated_input = join_input(existing_input, node_output)
+                    else:
+                        existing_input["inputs"].append(node_output)
+                        updated_input = existing_input
+                    queue[n] = updated_input
+                else:
+                    queue[n] = node_output
+
+    async def _run_graph_async(
+        self,
+        root_input: Dict[str, Any],
+        params: Optional[dict],
+        debug: Optional[bool],
+        join_input: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+    ) -> Optional[Dict]:
+        """
+        Asynchronous counterpart of `_run_graph()`. Every queued node whose predecessors all ran is started as an
+        asyncio task, and the queue is processed in the same order as in `_run_graph()`.
+        """
+        root_node = root_input["root_node"]
+        node_output = None
+        # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        queue: Dict[str, Any] = {root_node: root_input}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_node(node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+            start = time()
+            node_output, stream_id = await self._run_node_async(node_id, node_input)
+            if "_debug" in node_output and node_id in node_output["_debug"]:
+                node_output["_debug"][node_id]["exec_time_ms"] = round((time() - start) * 1000, 2)
+            return node_output, stream_id
+
+        def start_node(node_id: str, node_input: Dict[str, Any]) -> asyncio.Task:
+            return asyncio.ensure_future(run_node(node_id, node_input))
+
+        try:
+            i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
+            while queue:
+                node_id = next(itertools.islice(queue, i, None))
+                node_input = queue[node_id]
+                node_input["node_id"] = node_id
+                debug = self._apply_debug(node_id=node_id, node_input=node_input, params=params, debug=debug)
+
+                if not self._has_queued_predecessors(node_id, queue):  # only execute if predecessor nodes are executed
+                    try:
+                        logger.debug("Running node '%s` with input: %s", node_id, node_input)
+                        self._start_ready_nodes(
+                            queue=queue, started=tasks, start_node=start_node, params=params, debug=debug
+                        )
+                        node_output, stream_id = await tasks.pop(node_id)
+                    except Exception as e:
+                        # The input might be a really large object with thousands of embeddings.
+                        # If you really want to see it, raise the log level.
+                        logger.debug("Exception while running node '%s' with input %s", node_id, node_input)
+                        raise Exception(
+                            f"Exception while running node '{node_id}': {e}\nEnable debug logging to see the data that was passed when the pipeline failed."
+                        ) from e
+                    queue.pop(node_id)
+                    self._enqueue_next_nodes(
+                        queue=queue,
+                        node_id=node_id,
+                        node_output=node_output,
+                        stream_id=stream_id,
+                        join_input=join_input,
+                    )
+                    i = 0
+                else:
+                    i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
+        finally:
+            for task in tasks.values():
+                task.cancel()
 
         return node_output
 
@@ -1882,13 +2194,7 @@ class Pipeline:
         return pd.concat(partial_dfs, ignore_index=True).reset_index()
 
     def get_next_nodes(self, node_id: str, stream_id: str):
-        current_node_edges = self.graph.edges(node_id, data=True)
-        next_nodes = [
-            next_node
-            for _, next_node, data in current_node_edges
-            if not stream_id or data["label"] == stream_id or stream_id == "output_all"
-        ]
-        return next_nodes
+        return list(self._get_execution_plan().next_nodes(node_id, stream_id))
 
     def get_nodes_by_class(self, class_type) -> List[Any]:
         """
@@ -2253,12 +2559,7 @@ class Pipeline:
             if not all(node_id in self.graph.nodes for node_id in params.keys()):
                 # Might be a non-targeted param. Verify that too
                 not_a_node = set(params.keys()) - set(self.graph.nodes)
-                # "debug" will be picked up by _dispatch_run, see its code
-                # "add_isolated_node_eval" is set by pipeline.eval / pipeline.eval_batch
-                valid_global_params = {"debug", "add_isolated_node_eval"}
-                for node_id in self.graph.nodes:
-                    run_signature_args = self._get_run_node_signature(node_id)
-                    valid_global_params |= set(run_signature_args)
+                valid_global_params = self._get_execution_plan().valid_global_params
                 invalid_keys = [key for key in not_a_node if key not in valid_global_params]
 
                 if invalid_keys:
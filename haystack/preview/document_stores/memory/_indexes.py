@@ -0,0 +1,230 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import math
+from bisect import bisect_left, bisect_right
+
+from haystack.preview.document_stores.memory._filters import RESERVED_KEYS, _conditions_as_list
+
+
+class FieldIndex:
+    """
+    Secondary index over the values of a single metadata field: a hash index from values to document ids, plus
+    sorted lists of the distinct numeric and string values for range lookups. The sorted lists are rebuilt lazily
+    when the set of distinct values changed.
+    """
+
+    def __init__(self):
+        self.values: Dict[Any, Set[str]] = {}
+        # Ids of documents whose value can't be used as a dictionary key (lists, dicts, ...)
+        self.unhashable: Set[str] = set()
+        # Ids of documents per value category, to know which documents a range lookup can't reason about
+        self.categories: Dict[str, Set[str]] = {"number": set(), "string": set(), "other": set()}
+        self._sorted: Optional[Dict[str, List[Any]]] = None
+
+    @staticmethod
+    def category(value: Any) -> str:
+        if isinstance(value, (int, float)) and not (isinstance(value, float) and math.isnan(value)):
+            return "number"
+        if isinstance(value, str):
+            return "string"
+        return "other"
+
+    def add(self, doc_id: str, value: Any):
+        try:
+            ids = self.values.get(value)
+        except TypeError:
+            self.unhashable.add(doc_id)
+            return
+        if ids is None:
+            ids = self.values[value] = set()
+            self._sorted = None
+        ids.add(doc_id)
+        self.categories[self.category(value)].add(doc_id)
+
+    def remove(self, doc_id: str, value: Any):
+        try:
+            ids = self.values.get(value)
+        except TypeError:
+            self.unhashable.discard(doc_id)
+            return
+        if ids is None:
+            return
+        ids.discard(doc_id)
+        self.categories[self.category(value)].discard(doc_id)
+        if not ids:
+            del self.values[value]
+            self._sorted = None
+
+    def lookup(self, values: Iterable[Any]) -> Optional[Set[str]]:
+        """
+        Returns the ids of the documents whose value is equal to one of `values`, plus the ones that can't be looked
+        up by value. Returns None if one of the values isn't hashable.
+        """
+        candidates = set(self.unhashable)
+        for value in values:
+            try:
+                candidates.update(self.values.get(value, ()))
+            except TypeError:
+                return None
+        return candidates
+
+    def lookup_range(self, operator: str, value: Any) -> Optional[Set[str]]:
+        """
+        Returns the ids of the documents whose value satisfies the comparison, plus the ones whose value isn't
+        comparable with the given value. Returns None if the value can't be used for a range lookup.
+        """
+        category = self.category(value)
+        if category == "other":
+            return None
+
+        if self._sorted is None:
+            self._sorted = {
+                category: sorted(value for value in self.values if self.category(value) == category)
+                for category in ("number", "string")
+            }
+        sorted_values = self._sorted[category]
+        if operator == "$gt":
+            matching_values = sorted_values[bisect_right(sorted_values, value) :]
+        elif operator == "$gte":
+            matching_values = sorted_values[bisect_left(sorted_values, value) :]
+        elif operator == "$lt":
+            matching_values = sorted_values[: bisect_left(sorted_values, value)]
+        else:
+            matching_values = sorted_values[: bisect_right(sorted_values, value)]
+
+        candidates = set(self.unhashable)
+        for other_category, ids in self.categories.items():
+            if other_category != category:
+                candidates.update(ids)
+        for matching_value in matching_values:
+            candidates.update(self.values[matching_value])
+        return candidates
+
+
+class MetadataIndex:
+    """
+    Secondary indexes over selected metadata fields, used to narrow down the documents a filter needs to be matched
+    against.
+
+    `find_candidates()` follows the same filter syntax as `match()`. It resolves `$eq`, `$in`, `$gt`, `$gte`, `$lt`
+    and `$lte` conditions on indexed fields with the indexes and combines them with set intersections (`$and`) and
+    unions (`$or`). The result is a superset of the matching documents, so the filters still need to be matched
+    against each candidate: conditions that can't be resolved with an index (`$ne`, `$nin`, `$not`, fields that are
+    not indexed) don't narrow down the candidates.
+    """
+
+    def __init__(self, fields: List[str]):
+        """
+        :param fields: the metadata fields to index.
+        """
+        self.fields = fields
+        self.field_indexes = {field: FieldIndex() for field in fields}
+        # id -> (insertion position, {field: indexed value})
+        self.indexed_values: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._next_position = 0
+
+    def add(self, doc_id: str, metadata: Dict[str, Any]):
+        """
+        Indexes the metadata of a document. If the document was already indexed, its previous values are replaced
+        but it keeps its position.
+        """
+        if doc_id in self.indexed_values:
+            position = self.indexed_values[doc_id][0]
+            self.remove(doc_id)
+        else:
+            position = self._next_position
+            self._next_position += 1
+        indexed_values = {field: metadata[field] for field in self.fields if field in metadata}
+        for field, value in indexed_values.items():
+            self.field_indexes[field].add(doc_id, value)
+        self.indexed_values[doc_id] = (position, indexed_values)
+
+    def remove(self, doc_id: str):
+        """
+        Removes a document from the indexes. Unknown ids are ignored.
+        """
+        if doc_id not in self.indexed_values:
+            return
+        _, indexed_values = self.indexed_values.pop(doc_id)
+        for field, value in indexed_values.items():
+            self.field_indexes[field].remove(doc_id, value)
+
+    def sort(self, doc_ids: Iterable[str]) -> List[str]:
+        """
+        Sorts document ids in the order in which the documents were first indexed.
+        """
+        return sorted(doc_ids, key=lambda doc_id: self.indexed_values[doc_id][0])
+
+    def find_candidates(self, conditions: Any) -> Optional[Set[str]]:
+        """
+        Returns the ids of the documents that can match the filters, or None if the indexes can't narrow them down.
+
+        :param conditions: the filters dictionary.
+        """
+        if isinstance(conditions, list):
+            return self._find_candidates(conditions=conditions, _current_key="$and")
+        if isinstance(conditions, dict) and conditions:
+            if len(conditions.keys()) > 1:
+                return self._find_candidates(conditions=conditions, _current_key="$and")
+            field_key, field_value = list(conditions.items())[0]
+            return self._find_candidates(conditions=field_value, _current_key=field_key)
+        return None
+
+    def _find_candidates(self, conditions: Any, _current_key: str) -> Optional[Set[str]]:
+        """
+        Recursive implementation of find_candidates(), mirroring the structure of `_match()`.
+        """
+        if isinstance(conditions, list):
+            return self._find_candidates(conditions={"$and": conditions}, _current_key=_current_key)
+
+        if isinstance(conditions, dict):
+            # Malformed filters are left to match() to report
+            if _current_key not in RESERVED_KEYS and any(key not in RESERVED_KEYS for key in conditions.keys()):
+                return None
+            if not conditions:
+                return None
+            if len(conditions.keys()) > 1:
+                return self._and(conditions=_conditions_as_list(conditions), _current_key=_current_key)
+
+            field_key, field_value = list(conditions.items())[0]
+            if field_key == "$and":
+                return self._and(conditions=_conditions_as_list(field_value), _current_key=_current_key)
+            if field_key == "$or":
+                return self._or(conditions=_conditions_as_list(field_value), _current_key=_current_key)
+            if field_key == "$not":
+                return None
+            if field_key in RESERVED_KEYS:
+                return self._compare(operator=field_key, field_name=_current_key, value=field_value)
+            if isinstance(field_value, list):
+                return self._compare(operator="$in", field_name=field_key, value=field_value)
+
+        return self._compare(operator="$eq", field_name=_current_key, value=conditions)
+
+    def _and(self, conditions: List[Any], _current_key: str) -> Optional[Set[str]]:
+        candidates: Optional[Set[str]] = None
+        for condition in conditions:
+            ids = self._find_candidates(conditions=condition, _current_key=_current_key)
+            if ids is not None:
+                candidates = ids if candidates is None else candidates & ids
+        return candidates
+
+    def _or(self, conditions: List[Any], _current_key: str) -> Optional[Set[str]]:
+        candidates: Set[str] = set()
+        for condition in conditions:
+            ids = self._find_candidates(conditions=condition, _current_key=_current_key)
+            if ids is None:
+                return None
+            candidates |= ids
+        return candidates
+
+    def _compare(self, operator: str, field_name: str, value: Any) -> Optional[Set[str]]:
+        if field_name not in self.field_indexes:
+            return None
+        field_index = self.field_indexes[field_name]
+        if operator == "$eq":
+            return field_index.lookup([value])
+        if operator == "$in" and isinstance(value, list):
+            return field_index.lookup(value)
+        if operator in ("$gt", "$gte", "$lt", "$lte"):
+            return field_index.lookup_range(operator=operator, value=value)
+        return None
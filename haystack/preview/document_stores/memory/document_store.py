@@ -4,6 +4,7 @@ import logging
 
 from haystack.preview.dataclasses import Document
 from haystack.preview.document_stores.memory._filters import match
+from haystack.preview.document_stores.memory._indexes import MetadataIndex
 from haystack.preview.document_stores.errors import DuplicateDocumentError, MissingDocumentError
 
 
@@ -16,11 +17,16 @@ class MemoryDocumentStore:
     Stores data in-memory. It's ephemeral and cannot be saved to disk.
     """
 
-    def __init__(self):
+    def __init__(self, metadata_index_fields: Optional[List[str]] = None):
         """
         Initializes the store.
+
+        :param metadata_index_fields: metadata fields to build secondary indexes for. Filters with `"$eq"`, `"$in"`,
+            `"$gt"`, `"$gte"`, `"$lt"` or `"$lte"` conditions on these fields look up the candidate documents in the
+            indexes instead of matching the filters against every document in the store.
         """
         self.storage = {}
+        self.metadata_index = MetadataIndex(fields=metadata_index_fields) if metadata_index_fields else None
 
     def count_documents(self) -> int:
         """
@@ -100,7 +106,12 @@ class MemoryDocumentStore:
         :return: a list of Documents that match the given filters.
         """
         if filters:
-            return [doc for doc in self.storage.values() if match(conditions=filters, document=doc)]
+            candidate_ids = self.metadata_index.find_candidates(filters) if self.metadata_index else None
+            if candidate_ids is not None:
+                candidates = [self.storage[doc_id] for doc_id in self.metadata_index.sort(candidate_ids)]  # type: ignore
+            else:
+                candidates = list(self.storage.values())
+            return [doc for doc in candidates if match(conditions=filters, document=doc)]
         return list(self.storage.values())
 
     def write_documents(self, documents: List[Document], duplicates: DuplicatePolicy = "fail") -> None:
@@ -130,6 +141,8 @@ class MemoryDocumentStore:
                 if duplicates == "skip":
                     logger.warning("ID '%s' already exists", document.id)
             self.storage[document.id] = document
+            if self.metadata_index:
+                self.metadata_index.add(document.id, document.metadata)
 
     def delete_documents(self, document_ids: List[str]) -> None:
         """
@@ -142,3 +155,5 @@ class MemoryDocumentStore:
             if not doc_id in self.storage.keys():
                 raise MissingDocumentError(f"ID '{doc_id}' not found, cannot delete it.")
             del self.storage[doc_id]
+            if self.metadata_index:
+                self.metadata_index.remove(doc_id)
@@ -491,6 +491,15 @@ class DocumentStoreBaseTestAbstract:
         assert doc.meta["year"] == "2099"
         assert doc.meta["month"] == "12"
 
+    @pytest.mark.integration
+    def test_get_document_fingerprints(self, ds, documents):
+        ds.write_documents(documents)
+        assert ds.get_document_fingerprints() == {}
+
+        ds.update_document_meta(documents[0].id, meta={"fingerprint": "abc"})
+        ds.update_document_meta(documents[1].id, meta={"fingerprint": "def"})
+        assert ds.get_document_fingerprints() == {documents[0].id: "abc", documents[1].id: "def"}
+
     @pytest.mark.integration
     def test_labels_with_long_texts(self, ds, documents):
         label = Label(
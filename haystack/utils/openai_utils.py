@@ -5,10 +5,10 @@ import platform
 import sys
 import json
 from typing import Dict, Union, Tuple, Optional, List
-import requests
 from tenacity import retry, retry_if_exception_type, wait_exponential, stop_after_attempt
 from transformers import GPT2TokenizerFast
 
+from haystack.utils.requests import get_session
 from haystack.errors import OpenAIError, OpenAIRateLimitError, OpenAIUnauthorizedError
 from haystack.environment import (
     HAYSTACK_REMOTE_API_BACKOFF_SEC,
@@ -148,7 +148,7 @@ def openai_request(
     :param timeout: The timeout length of the request. The default is 30s.
     :param read_response: Whether to read the response as JSON. The default is True.
     """
-    response = requests.request("POST", url, headers=headers, data=json.dumps(payload), timeout=timeout, **kwargs)
+    response = get_session().request("POST", url, headers=headers, data=json.dumps(payload), timeout=timeout, **kwargs)
     if read_response:
         json_response = json.loads(response.text)
 
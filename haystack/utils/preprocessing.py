@@ -1,7 +1,9 @@
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import re
 import logging
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
 
 from haystack.nodes.file_converter import BaseConverter, DocxToTextConverter, PDFToTextConverter, TextConverter
@@ -32,9 +34,71 @@ def convert_files_to_docs(
             not unique, you can modify the metadata and pass [`"content"`, `"meta"`] to this field.
             If you do this, the Document ID will be generated by using the content and the defined metadata.
     """
+    return list(
+        iter_convert_files_to_docs(
+            dir_path=dir_path,
+            clean_func=clean_func,
+            split_paragraphs=split_paragraphs,
+            encoding=encoding,
+            id_hash_keys=id_hash_keys,
+        )
+    )
+
+
+def iter_convert_files_to_docs(
+    dir_path: str,
+    clean_func: Optional[Callable] = None,
+    split_paragraphs: bool = False,
+    encoding: Optional[str] = None,
+    id_hash_keys: Optional[List[str]] = None,
+    num_workers: int = 0,
+    cache_path: Optional[Union[str, Path]] = None,
+) -> Iterator[Document]:
+    """
+    Convert all files(.txt, .pdf, .docx) in the sub-directories of the given path to Documents and yield them as soon
+    as each file is converted, for example to write them to a Document Store in batches.
+
+    :param dir_path: The path of the directory containing the Files.
+    :param clean_func: A custom cleaning function that gets applied to each Document (input: str, output: str).
+    :param split_paragraphs: Whether to split text by paragraph.
+    :param encoding: Character encoding to use when converting pdf documents.
+    :param id_hash_keys: A list of Document attribute names from which the Document ID should be hashed from.
+            Useful for generating unique IDs even if the Document contents are identical.
+            To ensure you don't have duplicate Documents in your Document Store if texts are
+            not unique, you can modify the metadata and pass [`"content"`, `"meta"`] to this field.
+            If you do this, the Document ID will be generated by using the content and the defined metadata.
+    :param num_workers: Number of processes converting files in parallel. With more than one worker, the Documents of
+            a file are yielded as soon as it's converted, so files can come out in a different order than they were
+            found in. Set to 0 to convert the files one after the other in the current process.
+    :param cache_path: Path of a SQLite file that caches the text extracted from each file, keyed by the file's path,
+            modification time and size. Files that haven't changed since they were cached aren't converted again.
+            The file is created if it doesn't exist.
+    """
+    files = _find_files_to_convert(dir_path)
+    cache = _ConversionCache(cache_path, encoding=encoding) if cache_path else None
+    try:
+        for path, text in _convert_files(files, encoding=encoding, num_workers=num_workers, cache=cache):
+            if clean_func:
+                text = clean_func(text)
+
+            if split_paragraphs:
+                for para in text.split("\n\n"):
+                    if not para.strip():  # skip empty paragraphs
+                        continue
+                    yield Document(content=para, meta={"name": path.name}, id_hash_keys=id_hash_keys)
+            else:
+                yield Document(content=text, meta={"name": path.name}, id_hash_keys=id_hash_keys)
+    finally:
+        if cache:
+            cache.close()
+
+
+def _find_files_to_convert(dir_path: Union[str, Path]) -> List[Tuple[str, Path]]:
+    """
+    Returns (suffix, path) for the files convert_files_to_docs supports, grouped by suffix.
+    """
     file_paths = [p for p in Path(dir_path).glob("**/*")]
     allowed_suffixes = [".pdf", ".txt", ".docx"]
-    suffix2converter: Dict[str, BaseConverter] = {}
 
     suffix2paths: Dict[str, List[Path]] = {}
     for path in file_paths:
@@ -50,38 +114,131 @@ def convert_files_to_docs(
                 path,
                 file_suffix,
             )
+    return [(suffix, path) for suffix, paths in suffix2paths.items() for path in paths]
 
-    # No need to initialize converter if file type not present
-    for file_suffix in suffix2paths.keys():
-        if file_suffix == ".pdf":
-            suffix2converter[file_suffix] = PDFToTextConverter()
-        if file_suffix == ".txt":
-            suffix2converter[file_suffix] = TextConverter()
-        if file_suffix == ".docx":
-            suffix2converter[file_suffix] = DocxToTextConverter()
 
-    documents = []
-    for suffix, paths in suffix2paths.items():
-        for path in paths:
+def _create_converter(file_suffix: str, multiprocessing: bool = True) -> BaseConverter:
+    if file_suffix == ".pdf":
+        return PDFToTextConverter(multiprocessing=multiprocessing)
+    if file_suffix == ".txt":
+        return TextConverter()
+    return DocxToTextConverter()
+
+
+# Converters of the current worker process of iter_convert_files_to_docs, created when first needed
+_worker_converters: Dict[str, BaseConverter] = {}
+
+
+def _convert_file_in_worker(file_suffix: str, path: Path, encoding: Optional[str]) -> str:
+    if file_suffix not in _worker_converters:
+        # The files are already converted in parallel, the pages of a PDF don't need to be
+        _worker_converters[file_suffix] = _create_converter(file_suffix, multiprocessing=False)
+    # PDFToTextConverter, TextConverter, and DocxToTextConverter return a list containing a single Document
+    return _worker_converters[file_suffix].convert(file_path=path, meta=None, encoding=encoding)[0].content
+
+
+def _convert_files(
+    files: List[Tuple[str, Path]], encoding: Optional[str], num_workers: int, cache: Optional["_ConversionCache"]
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Yields (path, text) for every file, taking the text from the cache where possible.
+    """
+    if num_workers < 2:
+        suffix2converter: Dict[str, BaseConverter] = {}
+        for suffix, path in files:
+            # The file state is taken before converting, so that a file changing during conversion isn't cached
+            file_state = cache.file_state(path) if cache else None
+            text = cache.get(file_state) if cache and file_state else None
+            if text is None:
+                logger.info("Converting %s", path)
+                if suffix not in suffix2converter:
+                    suffix2converter[suffix] = _create_converter(suffix)
+                # PDFToTextConverter, TextConverter, and DocxToTextConverter return a list containing a single Document
+                text = suffix2converter[suffix].convert(file_path=path, meta=None, encoding=encoding)[0].content
+                if cache and file_state:
+                    cache.add(file_state, text)
+            yield path, text
+        return
+
+    pool = ProcessPoolExecutor(max_workers=num_workers)
+    pending: Dict[Future, Tuple[Path, Optional[Tuple[str, int, int]]]] = {}
+    try:
+        for suffix, path in files:
+            file_state = cache.file_state(path) if cache else None
+            text = cache.get(file_state) if cache and file_state else None
+            if text is not None:
+                yield path, text
+                continue
             logger.info("Converting %s", path)
-            # PDFToTextConverter, TextConverter, and DocxToTextConverter return a list containing a single Document
-            document = suffix2converter[suffix].convert(
-                file_path=path, meta=None, encoding=encoding, id_hash_keys=id_hash_keys
-            )[0]
-            text = document.content
+            pending[pool.submit(_convert_file_in_worker, suffix, path, encoding)] = (path, file_state)
+            # Only a few files per worker are queued, so that results don't pile up in memory
+            while len(pending) >= 4 * num_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from _converted_file(*pending.pop(future), future, cache)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _converted_file(*pending.pop(future), future, cache)
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
 
-            if clean_func:
-                text = clean_func(text)
 
-            if split_paragraphs:
-                for para in text.split("\n\n"):
-                    if not para.strip():  # skip empty paragraphs
-                        continue
-                    documents.append(Document(content=para, meta={"name": path.name}, id_hash_keys=id_hash_keys))
-            else:
-                documents.append(Document(content=text, meta={"name": path.name}, id_hash_keys=id_hash_keys))
+def _converted_file(
+    path: Path, file_state: Optional[Tuple[str, int, int]], future: Future, cache: Optional["_ConversionCache"]
+) -> Iterator[Tuple[Path, str]]:
+    text = future.result()
+    if cache and file_state:
+        cache.add(file_state, text)
+    yield path, text
 
-    return documents
+
+class _ConversionCache:
+    """
+    SQLite-backed cache of the text converted from files, used by iter_convert_files_to_docs.
+    An entry is only valid while the file keeps the modification time and size it had when it was converted.
+    Entries are looked up and stored by the state returned by `file_state()`, which callers take before converting.
+    """
+
+    def __init__(self, cache_path: Union[str, Path], encoding: Optional[str], commit_every: int = 1000):
+        self.connection = sqlite3.connect(str(cache_path))
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS conversions "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, encoding TEXT, content TEXT)"
+        )
+        self.encoding = encoding or ""
+        self.commit_every = commit_every
+        self._uncommitted = 0
+
+    @staticmethod
+    def file_state(path: Path) -> Tuple[str, int, int]:
+        stat = path.stat()
+        return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+    def get(self, file_state: Tuple[str, int, int]) -> Optional[str]:
+        key, mtime_ns, size = file_state
+        row = self.connection.execute(
+            "SELECT content FROM conversions WHERE path = ? AND mtime_ns = ? AND size = ? AND encoding = ?",
+            (key, mtime_ns, size, self.encoding),
+        ).fetchone()
+        return row[0] if row else None
+
+    def add(self, file_state: Tuple[str, int, int], content: str):
+        key, mtime_ns, size = file_state
+        self.connection.execute(
+            "INSERT OR REPLACE INTO conversions (path, mtime_ns, size, encoding, content) VALUES (?, ?, ?, ?, ?)",
+            (key, mtime_ns, size, self.encoding, content),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.connection.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
 
 
 def tika_convert_files_to_docs(
@@ -1,19 +1,117 @@
-from typing import Optional, List
+from typing import Optional, List, Callable, Iterable, Set, TypeVar
 
+import os
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from tenacity import retry, wait_exponential, retry_if_exception_type, stop_after_attempt, before_log, after_log
 import requests
+from requests.adapters import HTTPAdapter
+
+from haystack.environment import HAYSTACK_REMOTE_API_POOL_SIZE, HAYSTACK_REMOTE_API_MAX_CONCURRENCY
 
 logger = logging.getLogger(__file__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+REMOTE_API_POOL_SIZE = int(os.environ.get(HAYSTACK_REMOTE_API_POOL_SIZE, 16))
+REMOTE_API_MAX_CONCURRENCY = int(os.environ.get(HAYSTACK_REMOTE_API_MAX_CONCURRENCY, 8))
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_owner_pid: Optional[int] = None
+_fan_out_state = threading.local()
+
+
+def _reset_after_fork() -> None:
+    # Sockets and worker threads don't survive a fork, so a child process starts with its own pool.
+    global _session, _executor, _owner_pid
+    if _owner_pid != os.getpid():
+        _session = None
+        _executor = None
+        _owner_pid = os.getpid()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide `requests.Session` shared by all remote API calls.
+
+    The session keeps TCP and TLS connections alive between calls, so consecutive requests to the same host skip the
+    handshake. Its connection pool holds up to `HAYSTACK_REMOTE_API_POOL_SIZE` connections per host (default 16).
+    """
+    global _session
+    with _lock:
+        _reset_after_fork()
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=REMOTE_API_POOL_SIZE, pool_maxsize=REMOTE_API_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        _reset_after_fork()
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=REMOTE_API_MAX_CONCURRENCY, thread_name_prefix="haystack-remote-api"
+            )
+        return _executor
+
+
+def concurrent_map(func: Callable[[T], R], items: Iterable[T], max_concurrency: Optional[int] = None) -> List[R]:
+    """
+    Calls `func` on every item with bounded concurrency and returns the results in input order.
+
+    Meant for fanning out independent remote API calls, such as the prompts of a batch. At most
+    `HAYSTACK_REMOTE_API_MAX_CONCURRENCY` calls (default 8) are in flight at once across the whole process. Any
+    retry and backoff logic inside `func` still applies to each call separately. Calls made from within `func` run
+    sequentially so that nested fan-outs can't exhaust the shared workers.
+
+    :param func: The function to call on each item.
+    :param items: The items to call `func` on.
+    :param max_concurrency: Maximum number of calls in flight for this fan-out. Set it to 1 to call `func`
+        sequentially in the calling thread. Defaults to `HAYSTACK_REMOTE_API_MAX_CONCURRENCY`.
+    :return: The results of `func` in the order of `items`.
+    """
+    items = list(items)
+    if max_concurrency is None:
+        max_concurrency = REMOTE_API_MAX_CONCURRENCY
+    if len(items) < 2 or max_concurrency < 2 or getattr(_fan_out_state, "active", False):
+        return [func(item) for item in items]
+
+    def call(item: T) -> R:
+        _fan_out_state.active = True
+        try:
+            return func(item)
+        finally:
+            _fan_out_state.active = False
+
+    executor = _get_executor()
+    futures: List[Future] = []
+    pending: Set[Future] = set()
+    for item in items:
+        if len(pending) >= max_concurrency:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        future = executor.submit(call, item)
+        futures.append(future)
+        pending.add(future)
+    return [future.result() for future in futures]
+
 
 def request_with_retry(attempts: int = 3, status_codes: Optional[List[int]] = None, **kwargs) -> requests.Response:
     """
     request_with_retry is a simple wrapper function that executes an HTTP request
     with a configurable exponential backoff retry on failures.
 
-    All kwargs will be passed to ``requests.request``, so it accepts the same arguments.
+    All kwargs will be passed to ``requests.Session.request`` of the shared session returned by `get_session`, so it
+    accepts the same arguments as ``requests.request``.
 
     Example Usage:
     --------------
@@ -74,7 +172,7 @@ def request_with_retry(attempts: int = 3, status_codes: Optional[List[int]] = No
     def run():
         # We ignore the missing-timeout Pylint rule as we set a default
         kwargs.setdefault("timeout", 10)
-        res = requests.request(**kwargs)  # pylint: disable=missing-timeout
+        res = get_session().request(**kwargs)  # pylint: disable=missing-timeout
 
         if res.status_code in status_codes:
             # We raise only for the status codes that must trigger a retry
@@ -14,3 +14,9 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 ROOT_PATH = os.getenv("ROOT_PATH", "/")
 
 CONCURRENT_REQUEST_PER_WORKER = int(os.getenv("CONCURRENT_REQUEST_PER_WORKER", "4"))
+
+# Concurrent /query requests are run together with Pipeline.run_batch() when QUERY_BATCH_SIZE is greater than 1.
+# A batch is run once QUERY_BATCH_SIZE queries arrived or after waiting QUERY_BATCH_WAIT_MS milliseconds.
+# As at most CONCURRENT_REQUEST_PER_WORKER requests are processed at a time, it caps the size of the batches.
+QUERY_BATCH_SIZE = int(os.getenv("QUERY_BATCH_SIZE", "1"))
+QUERY_BATCH_WAIT_MS = float(os.getenv("QUERY_BATCH_WAIT_MS", "10"))
@@ -6,6 +6,7 @@ import json
 
 from pydantic import BaseConfig
 from fastapi import FastAPI, APIRouter
+from fastapi.concurrency import run_in_threadpool
 import haystack
 from haystack import Pipeline
 
@@ -25,6 +26,7 @@ router = APIRouter()
 app: FastAPI = get_app()
 query_pipeline: Pipeline = get_pipelines().get("query_pipeline", None)
 concurrency_limiter = get_pipelines().get("concurrency_limiter", None)
+query_batcher = get_pipelines().get("query_batcher", None)
 
 
 @router.get("/initialized")
@@ -48,21 +50,26 @@ def haystack_version():
 
 
 @router.post("/query", response_model=QueryResponse, response_model_exclude_none=True)
-def query(request: QueryRequest):
+async def query(request: QueryRequest):
     """
     This endpoint receives the question as a string and allows the requester to set
     additional parameters that will be passed on to the Haystack pipeline.
     """
     with concurrency_limiter.run():
-        result = _process_request(query_pipeline, request)
+        result = await _process_request(query_pipeline, request)
         return result
 
 
-def _process_request(pipeline, request) -> Dict[str, Any]:
+async def _process_request(pipeline, request) -> Dict[str, Any]:
     start_time = time.time()
 
     params = request.params or {}
-    result = pipeline.run(query=request.query, params=params, debug=request.debug)
+    if query_batcher is not None:
+        # The batcher blocks until the batch with this query ran, so it must not run on the event loop
+        result = await run_in_threadpool(query_batcher.run, query=request.query, params=params, debug=request.debug)
+    else:
+        # Nodes without an async_run() run in the event loop's executor, the event loop itself is never blocked
+        result = await pipeline.run_async(query=request.query, params=params, debug=request.debug)
 
     # Ensure answers and documents exist, even if they're empty lists
     if not "documents" in result:
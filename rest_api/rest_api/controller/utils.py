@@ -1,8 +1,13 @@
-from typing import Type, NewType
+from typing import Any, Dict, List, Optional, Tuple, Type, NewType
 
+import json
+import time
 import inspect
+import logging
+from concurrent.futures import Future
 from contextlib import contextmanager
-from threading import Semaphore
+from queue import Empty, Queue
+from threading import Lock, Semaphore, Thread
 
 from fastapi import Form, HTTPException
 from pydantic import BaseModel
@@ -23,6 +28,97 @@ class RequestLimiter:
             self.semaphore.release()
 
 
+logger = logging.getLogger(__name__)
+
+
+class QueryBatcher:
+    """
+    Coalesces concurrent queries into batches that are run with `Pipeline.run_batch()`.
+
+    A background thread collects the queries submitted with `run()` for up to `max_wait_ms` milliseconds or until
+    `max_batch_size` queries arrived, runs them as one batch, and hands each caller the result for its query.
+    Only queries with the same params can share a batch. Queries with debug enabled are run on their own with
+    `Pipeline.run()`, as the debug information of a batch can't be split per query.
+    """
+
+    # Outputs of run_batch() holding one value per query
+    PER_QUERY_KEYS = ("answers", "documents", "results")
+
+    def __init__(self, pipeline, max_batch_size: int, max_wait_ms: float):
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def run(self, query: str, params: Optional[dict] = None, debug: Optional[bool] = False) -> Dict[str, Any]:
+        """
+        Runs a query as part of the next batch and returns the same output as `Pipeline.run()`.
+        """
+        if debug:
+            return self.pipeline.run(query=query, params=params, debug=debug)
+
+        future: Future = Future()
+        self._start()
+        self._queue.put((query, params or {}, future))
+        return future.result()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._process_batches, name="QueryBatcher", daemon=True)
+                self._thread.start()
+
+    def _process_batches(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except Empty:
+                    break
+
+            # Queries can only share a batch if they share their params
+            groups: Dict[str, List[Tuple[str, dict, Future]]] = {}
+            for item in batch:
+                groups.setdefault(json.dumps(item[1], sort_keys=True, default=str), []).append(item)
+            for group in groups.values():
+                self._run_batch(group)
+
+    def _run_batch(self, batch: List[Tuple[str, dict, Future]]):
+        queries = [query for query, _, _ in batch]
+        params = batch[0][1]
+        try:
+            if len(batch) == 1:
+                results = [self.pipeline.run(query=queries[0], params=params, debug=False)]
+            else:
+                logger.debug("Running a batch of %s queries", len(batch))
+                results = self._split_batch_output(self.pipeline.run_batch(queries=queries, params=params), queries)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _split_batch_output(self, output: Dict[str, Any], queries: List[str]) -> List[Dict[str, Any]]:
+        results = []
+        for i, query in enumerate(queries):
+            result = {key: value for key, value in output.items() if key != "queries"}
+            result["query"] = query
+            for key in self.PER_QUERY_KEYS:
+                if isinstance(output.get(key), list) and len(output[key]) == len(queries):
+                    result[key] = output[key][i]
+            results.append(result)
+        return results
+
+
 StringId = NewType("StringId", str)
 
 
@@ -8,7 +8,7 @@ from haystack.pipelines.base import Pipeline
 from haystack.document_stores import FAISSDocumentStore, InMemoryDocumentStore
 from haystack.errors import PipelineConfigError
 
-from rest_api.controller.utils import RequestLimiter
+from rest_api.controller.utils import QueryBatcher, RequestLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 # Each instance of FAISSDocumentStore creates an in-memory FAISS index,
 # the Indexing & Query Pipelines will end up with different indices for each worker.
 # The same applies for InMemoryDocumentStore.
+# Query pipelines can share a saved FAISS index between workers by loading it with `faiss_index_mmap: true`.
 SINGLE_PROCESS_DOC_STORES = (FAISSDocumentStore, InMemoryDocumentStore)
 
 
@@ -64,6 +65,15 @@ def setup_pipelines() -> Dict[str, Any]:
     logger.info("Concurrent requests per worker: %s", config.CONCURRENT_REQUEST_PER_WORKER)
     pipelines["concurrency_limiter"] = concurrency_limiter
 
+    # Setup query batching
+    query_batcher = None
+    if query_pipeline and config.QUERY_BATCH_SIZE > 1:
+        query_batcher = QueryBatcher(
+            pipeline=query_pipeline, max_batch_size=config.QUERY_BATCH_SIZE, max_wait_ms=config.QUERY_BATCH_WAIT_MS
+        )
+        logger.info("Batching up to %s queries for up to %s ms", config.QUERY_BATCH_SIZE, config.QUERY_BATCH_WAIT_MS)
+    pipelines["query_batcher"] = query_batcher
+
     # Load indexing pipeline
     index_pipeline, _ = _load_pipeline(config.PIPELINE_YAML_PATH, config.INDEXING_PIPELINE_NAME)
     if not index_pipeline:
@@ -1,6 +1,7 @@
 # mypy: disable_error_code = "empty-body, override, union-attr"
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
 from typing import Dict, Generator, List, Optional, Union
@@ -19,6 +20,7 @@ from haystack.errors import PipelineSchemaError
 from haystack.nodes import BaseReader, BaseRetriever
 from haystack.nodes.file_converter import BaseConverter
 from haystack.schema import Answer, Document, FilterType, Label, Pipeline, TableCell
+from rest_api.controller.utils import QueryBatcher
 from rest_api.pipeline import _load_pipeline
 from rest_api.utils import get_app
 
@@ -323,52 +325,79 @@ def test_file_upload_with_wrong_meta(client):
 
 
 def test_query_with_no_filter(client):
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         response = client.post(url="/query", json={"query": TEST_QUERY})
         assert 200 == response.status_code
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+
+
+def test_query_with_query_batcher(client):
+    with mock.patch("rest_api.controller.search.query_batcher") as mocked_batcher:
+        mocked_batcher.run.return_value = {"query": TEST_QUERY}
+        response = client.post(url="/query", json={"query": TEST_QUERY})
+        assert 200 == response.status_code
+        mocked_batcher.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+
+
+def test_query_batcher_runs_concurrent_queries_as_batch():
+    pipeline = MagicMock()
+    pipeline.run_batch.side_effect = lambda queries, params: {
+        "queries": queries,
+        "answers": [[Answer(answer=query)] for query in queries],
+    }
+    batcher = QueryBatcher(pipeline=pipeline, max_batch_size=3, max_wait_ms=10000)
+
+    queries = ["query 1", "query 2", "query 3"]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda query: batcher.run(query=query, params={"top_k": 1}), queries))
+
+    pipeline.run_batch.assert_called_once()
+    pipeline.run.assert_not_called()
+    for query, result in zip(queries, results):
+        assert result["query"] == query
+        assert [answer.answer for answer in result["answers"]] == [query]
 
 
 def test_query_with_one_filter(client):
     params = {"TestRetriever": {"filters": {"test_key": ["test_value"]}}}
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         response = client.post(url="/query", json={"query": TEST_QUERY, "params": params})
         assert 200 == response.status_code
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params=params, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params=params, debug=False)
 
 
 def test_query_with_one_global_filter(client):
     params = {"filters": {"test_key": ["test_value"]}}
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         response = client.post(url="/query", json={"query": TEST_QUERY, "params": params})
         assert 200 == response.status_code
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params=params, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params=params, debug=False)
 
 
 def test_query_with_filter_list(client):
     params = {"TestRetriever": {"filters": {"test_key": ["test_value", "another_value"]}}}
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         response = client.post(url="/query", json={"query": TEST_QUERY, "params": params})
         assert 200 == response.status_code
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params=params, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params=params, debug=False)
 
 
 def test_query_with_no_documents_and_no_answers(client):
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         response = client.post(url="/query", json={"query": TEST_QUERY})
         assert 200 == response.status_code
         response_json = response.json()
@@ -381,9 +410,9 @@ def test_query_with_bool_in_params(client):
     Ensure items of params can be other types than dictionary, see
     https://github.com/deepset-ai/haystack/issues/2656
     """
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {"query": TEST_QUERY}
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {"query": TEST_QUERY}
         request_body = {
             "query": TEST_QUERY,
             "params": {"debug": True, "Retriever": {"top_k": 5}, "Reader": {"top_k": 3}},
@@ -396,9 +425,9 @@ def test_query_with_bool_in_params(client):
 
 
 def test_query_with_embeddings(client):
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {
             "query": TEST_QUERY,
             "documents": [
                 Document(
@@ -416,14 +445,14 @@ def test_query_with_embeddings(client):
         assert response.json()["documents"][0]["content"] == "test"
         assert response.json()["documents"][0]["content_type"] == "text"
         assert response.json()["documents"][0]["embedding"] == [0.1, 0.2, 0.3]
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params={}, debug=False)
 
 
 def test_query_with_dataframe(client):
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {
             "query": TEST_QUERY,
             "documents": [
                 Document(
@@ -454,14 +483,14 @@ def test_query_with_dataframe(client):
         assert response.json()["answers"][0]["context"] == [["col1", "col2"], ["text_1", 1], ["text_2", 2]]
         assert response.json()["answers"][0]["offsets_in_document"] == [{"row": 1, "col": 0}]
         assert response.json()["answers"][0]["offsets_in_context"] == [{"row": 1, "col": 0}]
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params={}, debug=False)
 
 
 def test_query_with_prompt_node(client):
-    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
-        # `run` must return a dictionary containing a `query` key
-        mocked_pipeline.run.return_value = {
+    with mock.patch("rest_api.controller.search.query_pipeline", spec=Pipeline) as mocked_pipeline:
+        # `run_async` must return a dictionary containing a `query` key
+        mocked_pipeline.run_async.return_value = {
             "query": TEST_QUERY,
             "documents": [
                 Document(
@@ -482,8 +511,8 @@ def test_query_with_prompt_node(client):
         assert response.json()["documents"][0]["embedding"] == [0.1, 0.2, 0.3]
         assert len(response.json()["results"]) == 1
         assert response.json()["results"][0] == "test"
-        # Ensure `run` was called with the expected parameters
-        mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
+        # Ensure `run_async` was called with the expected parameters
+        mocked_pipeline.run_async.assert_called_with(query=TEST_QUERY, params={}, debug=False)
 
 
 def test_write_feedback(client, feedback):
@@ -3,6 +3,8 @@ import pytest
 import numpy as np
 
 from haystack.document_stores.faiss import FAISSDocumentStore
+from haystack.errors import DocumentStoreError
+from haystack.schema import Document
 from haystack.testing import DocumentStoreBaseTestAbstract
 
 from haystack.pipelines import Pipeline
@@ -102,6 +104,32 @@ class TestFAISSDocumentStore(DocumentStoreBaseTestAbstract):
         # Check if the init parameters are kept
         assert not new_document_store.progress_bar
 
+    @pytest.mark.integration
+    @pytest.mark.parametrize("index_factory", ["Flat", "IVF1,Flat"])
+    def test_index_load_with_mmap(self, documents_with_embeddings, tmp_path, index_factory):
+        document_store = FAISSDocumentStore(
+            sql_url=f"sqlite:///{tmp_path}/test_faiss_mmap.db",
+            faiss_index_factory_str=index_factory,
+            isolation_level="AUTOCOMMIT",
+            progress_bar=False,
+        )
+        if "ivf" in index_factory.lower():
+            document_store.train_index(documents_with_embeddings)
+        document_store.write_documents(documents_with_embeddings)
+        query_emb = documents_with_embeddings[0].embedding
+        expected = document_store.query_by_embedding(query_emb, top_k=3)
+        document_store.save(tmp_path / "haystack_test_faiss")
+
+        loaded_document_store = FAISSDocumentStore.load(index_path=tmp_path / "haystack_test_faiss", mmap=True)
+
+        assert loaded_document_store.get_embedding_count() == len(documents_with_embeddings)
+        documents = loaded_document_store.query_by_embedding(query_emb, top_k=3)
+        assert [doc.id for doc in documents] == [doc.id for doc in expected]
+        with pytest.raises(DocumentStoreError, match="read-only"):
+            loaded_document_store.write_documents([Document(content="new", embedding=query_emb)])
+        with pytest.raises(DocumentStoreError, match="read-only"):
+            loaded_document_store.delete_documents()
+
     @pytest.mark.integration
     @pytest.mark.parametrize("index_buffer_size", [10_000, 2])
     @pytest.mark.parametrize("index_factory", ["Flat", "HNSW", "IVF1,Flat"])
@@ -204,6 +232,156 @@ class TestFAISSDocumentStore(DocumentStoreBaseTestAbstract):
         assert len(docs_from_index_b) == len(docs_b)
         assert {int(doc.meta["vector_id"]) for doc in docs_from_index_b} == {0, 1, 2, 3}
 
+    @pytest.mark.integration
+    @pytest.mark.parametrize("index_factory", ["Flat", "HNSW"])
+    def test_query_by_embedding_with_filters(self, documents_with_embeddings, tmp_path, index_factory):
+        document_store = FAISSDocumentStore(
+            sql_url=f"sqlite:///{tmp_path}/test_faiss_filters_{index_factory}.db",
+            faiss_index_factory_str=index_factory,
+            isolation_level="AUTOCOMMIT",
+            return_embedding=True,
+            progress_bar=False,
+        )
+        document_store.write_documents(documents_with_embeddings)
+
+        query_emb = documents_with_embeddings[0].embedding
+        documents = document_store.query_by_embedding(query_emb, filters={"year": "2021"}, top_k=10)
+        assert len(documents) == 3
+        assert all(doc.meta["year"] == "2021" for doc in documents)
+
+        documents = document_store.query_by_embedding(query_emb, filters={"year": "2021"}, top_k=2)
+        assert len(documents) == 2
+
+        documents = document_store.query_by_embedding(query_emb, filters={"year": "1999"})
+        assert documents == []
+
+    @pytest.mark.integration
+    def test_query_by_embedding_batch(self, ds, documents_with_embeddings):
+        ds.write_documents(documents_with_embeddings)
+        query_embs = [doc.embedding for doc in documents_with_embeddings[:3]]
+        filters = [None, {"year": "2020"}, {"year": "2021"}]
+
+        results = ds.query_by_embedding_batch(query_embs, filters=filters, top_k=4)
+
+        assert len(results) == 3
+        for query_emb, query_filters, documents in zip(query_embs, filters, results):
+            expected = ds.query_by_embedding(query_emb, filters=query_filters, top_k=4)
+            assert [doc.id for doc in documents] == [doc.id for doc in expected]
+            assert [doc.score for doc in documents] == pytest.approx([doc.score for doc in expected])
+        assert results[0][0].id == documents_with_embeddings[0].id
+
+    @pytest.mark.integration
+    def test_query_by_embedding_batch_without_queries(self, ds, documents_with_embeddings):
+        ds.write_documents(documents_with_embeddings)
+        assert ds.query_by_embedding_batch([]) == []
+        assert ds.query_by_embedding_batch(np.zeros((0, 768), dtype=np.float32)) == []
+
+    @pytest.mark.integration
+    def test_query_by_embedding_filters_see_meta_updates(self, ds, documents_with_embeddings):
+        ds.write_documents(documents_with_embeddings)
+        query_emb = documents_with_embeddings[0].embedding
+        assert len(ds.query_by_embedding(query_emb, filters={"year": "2020"})) == 3
+
+        ds.update_document_meta(documents_with_embeddings[1].id, meta={"year": "2020"})
+        assert len(ds.query_by_embedding(query_emb, filters={"year": "2020"})) == 4
+
+    @pytest.mark.integration
+    def test_overwrite_documents_replaces_vectors(self, ds, documents_with_embeddings):
+        ds.write_documents(documents_with_embeddings)
+        vector_ids = {doc.id: doc.meta["vector_id"] for doc in ds.get_all_documents()}
+
+        overwritten = documents_with_embeddings[0]
+        new_embedding = documents_with_embeddings[1].embedding
+        ds.write_documents(
+            [Document(content=overwritten.content, id=overwritten.id, meta=overwritten.meta, embedding=new_embedding)],
+            duplicate_documents="overwrite",
+        )
+
+        assert ds.get_embedding_count() == len(documents_with_embeddings)
+        assert ds.faiss_indexes[ds.index].ntotal == len(documents_with_embeddings)
+        new_vector_ids = {doc.id: doc.meta["vector_id"] for doc in ds.get_all_documents()}
+        assert new_vector_ids[overwritten.id] != vector_ids[overwritten.id]
+        assert all(new_vector_ids[doc_id] == vector_ids[doc_id] for doc_id in vector_ids if doc_id != overwritten.id)
+        embedding = ds.get_document_by_id(overwritten.id).embedding
+        assert np.allclose(embedding, new_embedding / np.linalg.norm(new_embedding), atol=1e-6)
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("index_factory", ["Flat", "HNSW", "IVF1,Flat"])
+    def test_delete_documents_removes_vectors(self, documents_with_embeddings, tmp_path, index_factory):
+        document_store = FAISSDocumentStore(
+            sql_url=f"sqlite:///{tmp_path}/test_faiss_delete_{index_factory}.db",
+            faiss_index_factory_str=index_factory,
+            isolation_level="AUTOCOMMIT",
+            compaction_threshold=1.0,
+            progress_bar=False,
+        )
+        if "ivf" in index_factory.lower():
+            document_store.train_index(documents_with_embeddings)
+        document_store.write_documents(documents_with_embeddings)
+
+        deleted = documents_with_embeddings[0]
+        document_store.delete_documents(ids=[deleted.id])
+
+        assert document_store.get_embedding_count() == len(documents_with_embeddings) - 1
+        documents = document_store.query_by_embedding(deleted.embedding, top_k=len(documents_with_embeddings))
+        assert len(documents) == len(documents_with_embeddings) - 1
+        assert deleted.id not in {doc.id for doc in documents}
+
+        # Indexes that can't remove vectors right away drop them when compacted
+        document_store.compact()
+        assert document_store.faiss_indexes[document_store.index].ntotal == len(documents_with_embeddings) - 1
+        documents = document_store.query_by_embedding(deleted.embedding, top_k=len(documents_with_embeddings))
+        assert len(documents) == len(documents_with_embeddings) - 1
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("index_type", ["IVF with array direct map", "HNSW"])
+    def test_delete_documents_from_index_without_vector_id_map(self, documents_with_embeddings, tmp_path, index_type):
+        d = 768
+        quantizer = faiss.IndexFlatIP(d)
+        if index_type == "HNSW":
+            faiss_index = faiss.IndexHNSWFlat(d, 32, faiss.METRIC_INNER_PRODUCT)
+        else:
+            faiss_index = faiss.IndexIVFFlat(quantizer, d, 1, faiss.METRIC_INNER_PRODUCT)
+        document_store = FAISSDocumentStore(
+            sql_url=f"sqlite:///{tmp_path}/test_faiss_delete_positional.db",
+            faiss_index=faiss_index,
+            isolation_level="AUTOCOMMIT",
+            progress_bar=False,
+        )
+        if index_type != "HNSW":
+            document_store.train_index(documents_with_embeddings)
+            faiss_index.make_direct_map()
+        document_store.write_documents(documents_with_embeddings)
+
+        # These indexes store vectors by position, so they can't skip or compact away vectors they can't remove
+        with pytest.raises(RuntimeError):
+            document_store.delete_documents(ids=[documents_with_embeddings[0].id])
+        document_store.compact()
+
+        assert document_store.faiss_indexes[document_store.index].ntotal == len(documents_with_embeddings)
+        assert document_store.get_embedding_count() == len(documents_with_embeddings)
+        assert document_store.get_document_count() == len(documents_with_embeddings)
+        query_emb = documents_with_embeddings[0].embedding
+        documents = document_store.query_by_embedding(query_emb, top_k=len(documents_with_embeddings))
+        assert len(documents) == len(documents_with_embeddings)
+
+    @pytest.mark.integration
+    def test_update_existing_embeddings_with_filters(self, ds, documents_with_embeddings):
+        class ConstantRetriever(MockDenseRetriever):
+            def embed_documents(self, documents):
+                return np.ones((len(documents), self.embedding_dim), dtype=np.float32)
+
+        ds.write_documents(documents_with_embeddings)
+        ds.update_embeddings(
+            retriever=ConstantRetriever(document_store=ds), update_existing_embeddings=True, filters={"year": "2021"}
+        )
+
+        assert ds.get_embedding_count() == len(documents_with_embeddings)
+        assert ds.faiss_indexes[ds.index].ntotal == len(documents_with_embeddings)
+        for doc in ds.get_all_documents(return_embedding=True):
+            # Cosine similarity normalizes the embeddings, so all values of the constant embeddings are equal
+            assert np.allclose(doc.embedding, doc.embedding[0]) == (doc.meta["year"] == "2021")
+
     @pytest.mark.integration
     def test_passing_index_from_outside(self, documents_with_embeddings, tmp_path):
         d = 768
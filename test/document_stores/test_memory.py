@@ -1,11 +1,15 @@
 import logging
+from datetime import date
 
 import pandas as pd
 import pytest
-from rank_bm25 import BM25
+from rank_bm25 import BM25Okapi, BM25L, BM25Plus
 import numpy as np
 
 from haystack.document_stores.memory import InMemoryDocumentStore
+from haystack.document_stores.filter_utils import LogicalFilterClause, compile_filter
+from haystack.document_stores.memory_bm25 import BM25Index, top_k_indices
+from haystack.errors import DocumentStoreError, HaystackError
 from haystack.schema import Document
 from haystack.testing import DocumentStoreBaseTestAbstract
 
@@ -69,9 +73,48 @@ class TestInMemoryDocumentStore(DocumentStoreBaseTestAbstract):
     def test_update_bm25(self, ds, documents):
         ds.write_documents(documents)
         bm25_representation = ds.bm25[ds.index]
-        assert isinstance(bm25_representation, BM25)
+        assert isinstance(bm25_representation, BM25Index)
         assert bm25_representation.corpus_size == ds.get_document_count()
 
+    @pytest.mark.integration
+    def test_update_bm25_incrementally(self, ds, documents):
+        ds.write_documents(documents[:3])
+        ds.write_documents(documents[3:])
+        assert ds.bm25[ds.index].corpus_size == len(documents)
+
+        ds.delete_documents(ids=[documents[0].id])
+        assert ds.bm25[ds.index].corpus_size == len(documents) - 1
+        assert documents[0].id not in ds.bm25[ds.index]
+
+        ds.delete_documents()
+        assert ds.bm25[ds.index].corpus_size == 0
+        assert ds.query(query="Foo") == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("algorithm", [BM25Okapi, BM25L, BM25Plus])
+    def test_bm25_index_matches_rank_bm25(self, algorithm):
+        corpus = [
+            "a foo document about foo",
+            "a bar document",
+            "yet another document about nothing",
+            "foo bar baz",
+            "document",
+        ]
+        tokenized_corpus = [text.split() for text in corpus]
+        index = BM25Index(algorithm=algorithm.__name__)
+        # overwrite and delete some documents to check the incremental bookkeeping
+        index.add("0", ["something", "else"])
+        for i, tokens in enumerate(tokenized_corpus):
+            index.add(str(i), tokens)
+        index.add("to_delete", ["foo", "foo", "foo"])
+        index.remove("to_delete")
+
+        query = ["foo", "document", "unknown", "foo"]
+        doc_ids, scores = index.get_scores(query)
+        expected = algorithm(tokenized_corpus).get_scores(query)
+        assert doc_ids == [str(i) for i in range(len(corpus))]
+        assert np.allclose(scores, expected)
+
     @pytest.mark.integration
     def test_update_bm25_table(self, ds):
         table_doc = Document(
@@ -80,7 +123,7 @@ class TestInMemoryDocumentStore(DocumentStoreBaseTestAbstract):
         )
         ds.write_documents([table_doc])
         bm25_representation = ds.bm25[ds.index]
-        assert isinstance(bm25_representation, BM25)
+        assert isinstance(bm25_representation, BM25Index)
         assert bm25_representation.corpus_size == ds.get_document_count()
 
     @pytest.mark.integration
@@ -102,6 +145,101 @@ class TestInMemoryDocumentStore(DocumentStoreBaseTestAbstract):
         assert len(docs[1]) == 5
         assert "A Bar Document" in docs[1][0].content
 
+    @pytest.mark.integration
+    def test_memory_query_batch_matches_query(self, ds, documents):
+        ds.write_documents(documents)
+        query_texts = ["Foo", "Bar", "Document", "unknown"]
+        docs_batch = ds.query_batch(queries=query_texts, top_k=3)
+        for query_text, docs in zip(query_texts, docs_batch):
+            expected = ds.query(query=query_text, top_k=3)
+            assert [doc.score for doc in docs] == pytest.approx([doc.score for doc in expected])
+
+    @pytest.mark.integration
+    def test_memory_query_with_filters(self, ds, documents):
+        ds.write_documents(documents)
+        docs = ds.query(query="Document", filters={"name": "name_1"}, top_k=10)
+        assert len(docs) == 3
+        assert all(doc.meta["name"] == "name_1" for doc in docs)
+
+        # Scores don't depend on the filters
+        all_docs = {doc.id: doc.score for doc in ds.query(query="Document", top_k=10)}
+        assert [doc.score for doc in docs] == pytest.approx([all_docs[doc.id] for doc in docs])
+
+    @pytest.mark.integration
+    def test_memory_query_batch_with_filters(self, ds, documents):
+        ds.write_documents(documents)
+        filters = [{"name": "name_0"}, {"name": "name_2"}, {"name": "name_0"}]
+        docs_batch = ds.query_batch(queries=["Foo", "Bar", "Document"], filters=filters, top_k=10)
+        for docs, query_filters in zip(docs_batch, filters):
+            assert docs
+            assert all(doc.meta["name"] == query_filters["name"] for doc in docs)
+
+        with pytest.raises(HaystackError):
+            ds.query_batch(queries=["Foo", "Bar"], filters=filters)
+
+    @pytest.mark.unit
+    def test_memory_query_all_terms_must_match(self):
+        ds = InMemoryDocumentStore(use_bm25=True)
+        ds.write_documents(
+            [
+                {"content": "The green tea plant contains a range of healthy compounds."},
+                {"content": "Green tea is a drink."},
+                {"content": "Drink more tea."},
+                {"content": "My favorite drink is green juice."},
+            ]
+        )
+        assert len(ds.query(query="drink green tea")) == 4
+        docs = ds.query(query="drink green tea", all_terms_must_match=True)
+        assert [doc.content for doc in docs] == ["Green tea is a drink."]
+        assert ds.query(query="drink green coffee", all_terms_must_match=True) == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"name": "name_1"},
+            {"name": ["name_0", "name_2"], "year": {"$gte": "2021"}},
+            {"$or": {"month": "03", "year": {"$lt": "2021"}}},
+            {"$not": {"name": {"$nin": ["name_0"]}, "month": {"$ne": "01"}}},
+            {"numbers": {"$in": [[2, 4], 1]}},
+        ],
+    )
+    def test_compile_filter(self, documents, filters):
+        compiled_filter = compile_filter(filters)
+        assert compile_filter(filters) is compiled_filter
+        parsed_filter = LogicalFilterClause.parse(filters)
+        for doc in documents:
+            assert compiled_filter(doc.meta) == parsed_filter.evaluate(doc.meta)
+
+    @pytest.mark.unit
+    def test_compile_filter_cache_key(self):
+        compiled_filter = compile_filter({"name": "name_1", "year": {"$gte": "2021"}})
+        assert compile_filter({"year": {"$gte": "2021"}, "name": "name_1"}) is compiled_filter
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "filters,other_filters",
+        [
+            ({"flag": 1}, {"flag": True}),
+            ({"flag": 1}, {"flag": 1.0}),
+            ({"date": date(2021, 1, 1)}, {"date": "2021-01-01"}),
+            ({"number": np.int64(5)}, {"number": "5"}),
+            ({"numbers": {"$in": (1, 2)}}, {"numbers": {"$in": [1, 2]}}),
+        ],
+    )
+    def test_compile_filter_cache_key_keeps_types(self, filters, other_filters):
+        assert compile_filter(filters) is not compile_filter(other_filters)
+        meta = {"flag": True, "date": "2021-01-01", "number": "5", "numbers": 1}
+        for filter_dict in (filters, other_filters):
+            assert compile_filter(filter_dict)(meta) == LogicalFilterClause.parse(filter_dict).evaluate(meta)
+
+    @pytest.mark.unit
+    def test_top_k_indices(self):
+        scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.3, 0.2, 0.1]])
+        assert top_k_indices(scores, 2).tolist() == [[1, 3], [0, 1]]
+        assert top_k_indices(scores, 10).tolist() == [[1, 3, 2, 0], [0, 1, 2, 3]]
+        assert top_k_indices(scores, 0).shape == (2, 0)
+
     @pytest.mark.integration
     def test_memory_query_by_embedding_batch(self, ds, documents):
         documents = [doc for doc in documents if doc.embedding is not None]
@@ -113,6 +251,109 @@ class TestInMemoryDocumentStore(DocumentStoreBaseTestAbstract):
             assert len(docs) == 5
             assert (docs[0].embedding == query_emb).all()
 
+    @pytest.mark.integration
+    def test_memory_query_by_embedding_batch_matches_query_by_embedding(self, documents):
+        ds = InMemoryDocumentStore(similarity="cosine", use_gpu=False)
+        ds.write_documents(documents)
+        query_embs = np.random.default_rng(42).random((3, 768), dtype=np.float32)
+        docs_batch = ds.query_by_embedding_batch(query_embs=query_embs, top_k=4)
+        for query_emb, docs in zip(query_embs, docs_batch):
+            expected = ds.query_by_embedding(query_emb=query_emb, top_k=4)
+            assert [doc.id for doc in docs] == [doc.id for doc in expected]
+            assert [doc.score for doc in docs] == pytest.approx([doc.score for doc in expected])
+
+    @pytest.mark.integration
+    def test_embedding_matrix_in_sync(self, ds, documents):
+        documents = [doc for doc in documents if doc.embedding is not None]
+        ds.write_documents(documents)
+        assert len(ds.embedding_matrices[ds.index]) == len(documents)
+
+        ds.delete_documents(ids=[documents[0].id])
+        assert documents[0].id not in ds.embedding_matrices[ds.index]
+        docs = ds.query_by_embedding(query_emb=documents[0].embedding, top_k=len(documents))
+        assert documents[0].id not in [doc.id for doc in docs]
+        assert len(docs) == len(documents) - 1
+
+        ds.delete_documents()
+        assert len(ds.embedding_matrices[ds.index]) == 0
+
+    @pytest.mark.integration
+    def test_write_with_wrong_embedding_dimension_changes_nothing(self, ds):
+        ds.write_documents([Document(content="first document", embedding=np.ones(768, dtype=np.float32))])
+        documents = [
+            Document(content="second document", embedding=np.ones(768, dtype=np.float32)),
+            Document(content="third document", embedding=np.ones(16, dtype=np.float32)),
+        ]
+        with pytest.raises(DocumentStoreError, match="dimension"):
+            ds.write_documents(documents)
+
+        assert ds.get_document_count() == 1
+        assert len(ds.embedding_matrices[ds.index]) == 1
+        assert [doc.content for doc in ds.query(query="document")] == ["first document"]
+
+    @pytest.mark.integration
+    def test_copy_on_read(self, ds, documents):
+        ds.write_documents(documents)
+        doc = ds.get_all_documents(filters={"name": documents[0].meta["name"]})[0]
+        doc.meta["name"] = "modified"
+        doc.embedding[0] = -1.0
+        stored_doc = ds.get_document_by_id(doc.id)
+        assert stored_doc.meta["name"] == documents[0].meta["name"]
+        assert stored_doc.embedding[0] != -1.0
+
+    @pytest.mark.integration
+    def test_no_copy_on_read(self, documents):
+        ds = InMemoryDocumentStore(return_embedding=True, copy_on_read=False, use_gpu=False)
+        ds.write_documents(documents)
+        doc = ds.get_all_documents(filters={"name": documents[0].meta["name"]})[0]
+        stored_doc = ds.get_document_by_id(doc.id)
+        assert doc is not stored_doc
+        assert doc.meta is stored_doc.meta
+        assert doc.embedding is stored_doc.embedding
+
+        doc_without_embedding = ds.get_all_documents(return_embedding=False)[0]
+        assert doc_without_embedding.embedding is None
+        assert ds.get_document_by_id(doc_without_embedding.id).embedding is not None
+
+    @pytest.mark.integration
+    def test_write_documents_copies_metadata(self, ds):
+        doc = Document(content="test", meta={"name": "original"})
+        ds.write_documents([doc])
+        doc.meta["name"] = "modified"
+        assert ds.get_document_by_id(doc.id).meta["name"] == "original"
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"name": "name_1"},
+            {"name": ["name_0", "name_2"], "year": {"$gte": "2021"}},
+            {"$or": {"month": "03", "year": {"$lt": "2021"}}},
+            {"$and": {"name": {"$eq": "name_0"}, "$not": {"month": "01"}}},
+            {"year": {"$ne": "2020"}},
+            {"numbers": {"$eq": [2, 4]}},
+        ],
+    )
+    def test_meta_index_filters(self, documents, filters):
+        ds = InMemoryDocumentStore(use_gpu=False)
+        indexed_ds = InMemoryDocumentStore(use_gpu=False, meta_index_fields=["name", "year", "month", "numbers"])
+        for store in (ds, indexed_ds):
+            store.write_documents(documents)
+            store.delete_documents(ids=[documents[0].id])
+            store.update_document_meta(id=documents[1].id, meta={"name": "name_2"})
+
+        expected = ds.get_all_documents(filters=filters)
+        result = indexed_ds.get_all_documents(filters=filters)
+        assert [doc.id for doc in result] == [doc.id for doc in expected]
+
+    @pytest.mark.unit
+    def test_meta_index_candidates(self):
+        ds = InMemoryDocumentStore(use_gpu=False, meta_index_fields=["tenant"])
+        ds.write_documents([Document(content=f"doc {i}", meta={"tenant": f"t{i % 10}"}) for i in range(100)])
+        candidates = ds.meta_indexes[ds.index].find_candidates(LogicalFilterClause.parse({"tenant": "t1"}))
+        assert len(candidates) == 10
+        assert ds.get_document_count(filters={"tenant": "t1"}) == 10
+
     @pytest.mark.integration
     def test_memory_query_by_embedding_docs_wo_embeddings(self, ds, caplog):
         # write document but don't update embeddings
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
+import numpy as np
 import pytest
 from haystack.document_stores.search_engine import SearchEngineDocumentStore, prepare_hosts
+from haystack.errors import DocumentStoreError
 
 
 @pytest.mark.unit
@@ -56,6 +58,40 @@ class SearchEngineDocumentStoreTestAbstract:
         result = ds.get_metadata_values_by_key(key="year", query="Bar")
         assert result == [{"count": 3, "value": "2021"}]
 
+    @pytest.mark.unit
+    def test_update_embeddings_resumes_from_checkpoint(self, mocked_document_store, monkeypatch, tmp_path):
+        hits = [{"_id": str(i), "_score": None, "_source": {"content": f"doc {i}"}} for i in range(10)]
+        monkeypatch.setattr(mocked_document_store, "_get_all_documents_in_index", lambda **kwargs: iter(hits))
+        monkeypatch.setattr(mocked_document_store, "get_document_count", lambda **kwargs: len(hits))
+        retriever = MagicMock()
+        retriever.embed_documents.side_effect = lambda docs: np.ones((len(docs), 768), dtype=np.float32)
+        written_ids = []
+
+        def failing_bulk(documents, **kwargs):
+            if len(written_ids) == 6:
+                raise DocumentStoreError("Cluster unavailable")
+            written_ids.extend(update["_id"] for update in documents)
+
+        monkeypatch.setattr(mocked_document_store, "_bulk", failing_bulk)
+        checkpoint_path = tmp_path / "checkpoint.txt"
+        with pytest.raises(DocumentStoreError):
+            mocked_document_store.update_embeddings(retriever, batch_size=3, checkpoint_path=checkpoint_path)
+        assert checkpoint_path.read_text().split() == written_ids == [str(i) for i in range(6)]
+
+        # The second run only embeds and writes the documents the first one didn't finish
+        retriever.embed_documents.reset_mock()
+        monkeypatch.setattr(
+            mocked_document_store,
+            "_bulk",
+            lambda documents, **kwargs: written_ids.extend(update["_id"] for update in documents),
+        )
+        mocked_document_store.update_embeddings(retriever, batch_size=3, checkpoint_path=checkpoint_path)
+
+        embedded_ids = [doc.id for call in retriever.embed_documents.call_args_list for doc in call.args[0]]
+        assert embedded_ids == [str(i) for i in range(6, 10)]
+        assert written_ids == [str(i) for i in range(10)]
+        assert not checkpoint_path.exists()
+
     @pytest.mark.unit
     def test_query_return_embedding_true(self, mocked_document_store):
         mocked_document_store.return_embedding = True
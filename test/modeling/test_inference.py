@@ -1,5 +1,7 @@
 import pytest
 
+from haystack.modeling.infer import Inferencer
+
 
 @pytest.mark.parametrize("multiprocessing_chunksize", [None, 2])
 @pytest.mark.parametrize("num_processes", [2, 0, None], scope="module")
@@ -73,3 +75,29 @@ def test_qa_format_and_results(adaptive_model_qa, multiprocessing_chunksize):
 
 if __name__ == "__main__":
     test_qa_format_and_results()
+
+
+def test_qa_dynamic_padding():
+    qa_inputs_dicts = [
+        {"questions": ["Who lives in Berlin?"], "text": "My name is Carla and I live in Berlin"},
+        {
+            "questions": ["In what country is Normandy"],
+            "text": "The Normans are an ethnic group that arose in Normandy, a northern region "
+            "of France, from contact between Viking settlers and indigenous Franks and Gallo-Romans",
+        },
+        {"questions": ["Who lives in Rome?"], "text": "My name is Christelle and I live in Rome"},
+    ]
+    inferencer = Inferencer.load(
+        "deepset/bert-medium-squad2-distilled", task_type="question_answering", batch_size=2, num_processes=0
+    )
+    expected = inferencer.inference_from_dicts(dicts=qa_inputs_dicts)
+
+    inferencer.dynamic_padding = True
+    results = inferencer.inference_from_dicts(dicts=qa_inputs_dicts)
+
+    assert len(results) == len(expected)
+    for result, expected_result in zip(results, expected):
+        answer = result["predictions"][0]["answers"][0]
+        expected_answer = expected_result["predictions"][0]["answers"][0]
+        assert answer["answer"] == expected_answer["answer"]
+        assert answer["score"] == pytest.approx(expected_answer["score"], abs=1e-4)
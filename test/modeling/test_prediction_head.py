@@ -1,5 +1,10 @@
 import logging
 
+import numpy as np
+import pytest
+import torch
+
+from haystack.modeling.model import prediction_head as prediction_head_module
 from haystack.modeling.model.adaptive_model import AdaptiveModel
 from haystack.modeling.model.language_model import get_language_model
 from haystack.modeling.model.prediction_head import QuestionAnsweringHead
@@ -28,3 +33,74 @@ def test_prediction_head_load_save(tmp_path, caplog=None):
     model.save(tmp_path)
     model_loaded = AdaptiveModel.load(tmp_path, device="cpu")
     assert model_loaded is not None
+
+
+def _brute_force_top_candidates(start_logits, end_logits, span_mask, n_best, duplicate_filtering, max_answer_length):
+    candidates = []
+    seq_len = len(start_logits)
+    for start in range(seq_len):
+        for end in range(seq_len):
+            valid = (
+                end >= start
+                and end - start < max_answer_length
+                and not (start == 0 and end != 0)
+                and span_mask[start] == 1
+                and span_mask[end] == 1
+            )
+            if valid and not (start == 0 and end == 0):
+                candidates.append((start_logits[start] + end_logits[end], start, end))
+    top = []
+    blocked_starts, blocked_ends = set(), set()
+    for score, start, end in sorted(candidates, reverse=True):
+        if duplicate_filtering > -1 and (start in blocked_starts or end in blocked_ends):
+            continue
+        top.append((start, end))
+        for i in range(duplicate_filtering + 1):
+            blocked_starts.update((start - i, start + i))
+            blocked_ends.update((end - i, end + i))
+        if len(top) == n_best:
+            break
+    return top
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("candidates_per_answer", [20, 1])
+def test_qa_head_logits_to_preds(monkeypatch, candidates_per_answer):
+    # With a single candidate per answer, most candidates are duplicates and more candidates need to be fetched
+    monkeypatch.setattr(prediction_head_module, "TOP_CANDIDATES_PER_ANSWER", candidates_per_answer)
+    head = QuestionAnsweringHead(n_best=3, n_best_per_sample=3, duplicate_filtering=0)
+    rng = np.random.default_rng(42)
+    batch_size, seq_len = 3, 12
+    logits = torch.tensor(rng.normal(size=(batch_size, seq_len, 2)), dtype=torch.float32)
+    span_mask = torch.ones((batch_size, seq_len), dtype=torch.long)
+    # question tokens and padding
+    span_mask[:, 1:4] = 0
+    span_mask[1, 9:] = 0
+
+    preds = head.logits_to_preds(
+        logits=logits.clone(),
+        span_mask=span_mask,
+        start_of_word=torch.ones_like(span_mask),
+        seq_2_start_t=torch.full((batch_size,), 4),
+        max_answer_length=5,
+    )
+
+    start_probs = torch.softmax(logits[:, :, 0], dim=-1).numpy()
+    end_probs = torch.softmax(logits[:, :, 1], dim=-1).numpy()
+    for sample_idx, sample_preds in enumerate(preds):
+        expected = _brute_force_top_candidates(
+            logits[sample_idx, :, 0].tolist(),
+            logits[sample_idx, :, 1].tolist(),
+            span_mask[sample_idx].tolist(),
+            n_best=3,
+            duplicate_filtering=0,
+            max_answer_length=5,
+        )
+        spans = [(pred.offset_answer_start, pred.offset_answer_end) for pred in sample_preds[:-1]]
+        assert spans == expected
+        for pred, (start, end) in zip(sample_preds, expected):
+            assert pred.score == pytest.approx(float(logits[sample_idx, start, 0] + logits[sample_idx, end, 1]))
+            assert pred.confidence == pytest.approx((start_probs[sample_idx, start] + end_probs[sample_idx, end]) / 2)
+        no_answer = sample_preds[-1]
+        assert no_answer.answer_type == "no_answer"
+        assert no_answer.score == pytest.approx(float(logits[sample_idx, 0, 0] + logits[sample_idx, 0, 1]))
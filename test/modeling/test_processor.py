@@ -296,3 +296,41 @@ def test_dataset_from_dicts_qa_labelconversion(samples_path, caplog=None):
                         12,
                         12,
                     ], f"Processing labels for {model} has changed."
+
+
+def test_dataset_from_dicts_qa_document_cache(caplog=None):
+    if caplog:
+        caplog.set_level(logging.CRITICAL)
+
+    tokenizer = AutoTokenizer.from_pretrained(pretrained_model_name_or_path="deepset/roberta-base-squad2")
+    processor = SquadProcessor(tokenizer, max_seq_len=256, data_dir=None, document_cache_size=2)
+    dicts = [{"questions": ["Who lives in Berlin?"], "text": "My name is Carla and I live in Berlin"}]
+    _, _, _, baskets = processor.dataset_from_dicts(dicts, indices=[0], return_baskets=True)
+    cache = processor._document_cache
+    assert len(cache) == 1
+
+    # The same document is taken from the cache
+    cached = cache.get(tokenizer, "My name is Carla and I live in Berlin")
+    _, _, _, cached_baskets = processor.dataset_from_dicts(dicts, indices=[0], return_baskets=True)
+    assert processor._document_cache is cache
+    assert cache.get(tokenizer, "My name is Carla and I live in Berlin") is cached
+    assert cached_baskets[0].raw["document_tokens"] == baskets[0].raw["document_tokens"]
+    assert cached_baskets[0].samples[0].features == baskets[0].samples[0].features
+    # The baskets get their own token lists and the shared offsets can't be modified
+    assert cached_baskets[0].raw["document_tokens"] is not baskets[0].raw["document_tokens"]
+    assert not cached_baskets[0].raw["document_offsets"].flags.writeable
+
+    # Changed content isn't found, and the least recently used documents are evicted
+    processor.dataset_from_dicts([{"questions": ["Who?"], "text": "My name is Paul"}], indices=[0])
+    processor.dataset_from_dicts([{"questions": ["Who?"], "text": "My name is Christelle"}], indices=[0])
+    assert len(cache) == 2
+    assert cache.get(tokenizer, "My name is Carla and I live in Berlin") is None
+    assert cache.get(tokenizer, "My name is Paul") is not None
+
+    # Other tokenizers don't share the entries
+    other_tokenizer = AutoTokenizer.from_pretrained(pretrained_model_name_or_path="deepset/bert-base-cased-squad2")
+    assert cache.get(other_tokenizer, "My name is Paul") is None
+
+    processor.document_cache_size = 0
+    processor.dataset_from_dicts(dicts, indices=[0])
+    assert processor._document_cache is None
@@ -185,6 +185,23 @@ def test_pdf_parallel_sort_by_position(Converter, samples_path):
     assert pages[-1] == "This is the page 50 of the document."
 
 
+@pytest.mark.unit
+def test_pdf_parallel_many_files(samples_path):
+    file_paths = [samples_path / "pdf" / name for name in ["sample_pdf_1.pdf", "sample_pdf_6.pdf", "sample_pdf_2.pdf"]]
+    expected = PDFToTextConverter(multiprocessing=False).run(file_paths=file_paths)[0]["documents"]
+
+    converter = PDFToTextConverter(multiprocessing=2)
+    try:
+        for _ in range(2):
+            documents = converter.run(file_paths=file_paths)[0]["documents"]
+            assert [doc.content for doc in documents] == [doc.content for doc in expected]
+        # The worker processes are reused across calls and no read-ahead is left behind
+        assert converter._worker_pool is not None
+        assert not converter._read_ahead
+    finally:
+        converter.close()
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("Converter", [PDFToTextConverter])
 def test_pdf_parallel_ocr(Converter, samples_path):
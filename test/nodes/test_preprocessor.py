@@ -177,6 +177,28 @@ def test_preprocess_word_split():
     assert len(documents) == 15
 
 
+@pytest.mark.unit
+def test_preprocess_with_num_workers():
+    documents = [Document(content=TEXT * (i % 4 + 1), meta={"i": i}) for i in range(12)]
+    serial_preprocessor = PreProcessor(split_length=15, split_by="word", split_respect_sentence_boundary=True)
+    parallel_preprocessor = PreProcessor(
+        split_length=15, split_by="word", split_respect_sentence_boundary=True, num_workers=2
+    )
+    try:
+        expected = serial_preprocessor.process(documents)
+        assert parallel_preprocessor.process(documents) == expected
+
+        # The pool is kept between calls and picks up configuration changes
+        worker_pool = parallel_preprocessor._worker_pool
+        parallel_preprocessor.split_length = 5
+        serial_preprocessor.split_length = 5
+        assert parallel_preprocessor.process(documents) == serial_preprocessor.process(documents)
+        assert parallel_preprocessor._worker_pool is worker_pool
+    finally:
+        parallel_preprocessor.close()
+    assert parallel_preprocessor._worker_pool is None
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("split_length_and_results", [(1, 3), (2, 2)])
 def test_preprocess_passage_split(split_length_and_results):
@@ -206,6 +228,51 @@ def test_clean_header_footer(samples_path):
     assert "footer" not in documents[0].content
 
 
+@pytest.mark.unit
+def test_find_longest_common_ngram():
+    preprocessor = PreProcessor()
+    sequences = [
+        "Copyright 2019 by ACME Inc.\nFirst page",
+        "Some intro. Copyright 2019 by ACME Inc.\nSecond page",
+        "Copyright 2019 by ACME Inc.\nThird page",
+    ]
+    assert preprocessor._find_longest_common_ngram(sequences) == "Copyright 2019 by ACME Inc."
+    assert preprocessor._find_longest_common_ngram(sequences, max_ngram=4) == "Copyright 2019 by"
+    assert preprocessor._find_longest_common_ngram(["one two three", "four five six"]) is None
+    assert preprocessor._find_longest_common_ngram(["Page 3 of 40", "Page 4 of 40"]) is None
+    assert (
+        preprocessor._find_longest_common_ngram(["Page 3 of 40", "Page 4 of 40"], ignore_digits=True) == "Page 3 of 40"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("ignore_digits", [True, False])
+def test_clean_header_footer_ignore_digits(ignore_digits):
+    bodies = [
+        "The quick brown fox.",
+        "Jumps over the lazy dog.",
+        "Lorem ipsum dolor sit amet.",
+        "Consectetur adipiscing elit.",
+        "Sed do eiusmod tempor.",
+    ]
+    document = Document(
+        content="\f".join(f"ACME annual report, page {i} of 5\n{body}" for i, body in enumerate(bodies))
+    )
+    preprocessor = PreProcessor(
+        clean_header_footer=True,
+        clean_whitespace=False,
+        clean_empty_lines=False,
+        split_by=None,
+        header_footer_ignore_digits=ignore_digits,
+    )
+    cleaned_document = preprocessor.process([document])[0]
+
+    if ignore_digits:
+        assert cleaned_document.content == "\f".join(f"\n{body}" for body in bodies)
+    else:
+        assert cleaned_document.content == "\f".join(f" {i} of 5\n{body}" for i, body in enumerate(bodies))
+
+
 @pytest.mark.unit
 def test_remove_substrings():
     document = Document(content="This is a header. Some additional text. wiki. Some emoji ✨ 🪲 Weird whitespace\b\b\b.")
@@ -45,6 +45,24 @@ def test_reader_basic(reader):
     assert isinstance(reader, BaseReader)
 
 
+@pytest.mark.integration
+def test_farm_reader_tokenization_cache(docs):
+    reader = FARMReader(model_name_or_path="deepset/tinyroberta-squad2", use_gpu=False, num_processes=0)
+    uncached_reader = FARMReader(
+        model_name_or_path="deepset/tinyroberta-squad2", use_gpu=False, num_processes=0, tokenization_cache_size=0
+    )
+
+    for query in ["Who lives in Berlin?", "Who lives in Rome?"]:
+        prediction = reader.predict(query=query, documents=docs, top_k=5)
+        expected = uncached_reader.predict(query=query, documents=docs, top_k=5)
+        assert [answer.answer for answer in prediction["answers"]] == [answer.answer for answer in expected["answers"]]
+        assert [answer.score for answer in prediction["answers"]] == pytest.approx(
+            [answer.score for answer in expected["answers"]]
+        )
+    assert len(reader.inferencer.processor._document_cache) == len({doc.content for doc in docs})
+    assert uncached_reader.inferencer.processor._document_cache is None
+
+
 def test_output(reader, docs):
     prediction = reader.predict(query="Who lives in Berlin?", documents=docs, top_k=5)
     assert prediction is not None
@@ -3,6 +3,7 @@ import logging
 
 import haystack
 from haystack import Pipeline, Document, Answer
+from haystack.nodes.base import BaseComponent
 from haystack.document_stores.memory import InMemoryDocumentStore
 from haystack.nodes.other.shaper import Shaper
 from haystack.nodes.retriever.sparse import BM25Retriever
@@ -155,6 +156,30 @@ def test_rename():
     assert results["invocation_context"]["questions"] == "test query"
 
 
+@pytest.mark.unit
+def test_branches_do_not_share_invocation_context():
+    class CollectInvocationContexts(BaseComponent):
+        outgoing_edges = 1
+
+        def run(self, inputs):
+            return {"invocation_contexts": [input_dict["invocation_context"] for input_dict in inputs]}, "output_1"
+
+        def run_batch(self):
+            pass
+
+    pipeline = Pipeline(max_workers=2)
+    pipeline.add_node(Shaper(func="rename", inputs={"value": "query"}, outputs=["question"]), "shaper", ["Query"])
+    pipeline.add_node(Shaper(func="rename", inputs={"value": "question"}, outputs=["first"]), "first", ["shaper"])
+    pipeline.add_node(Shaper(func="rename", inputs={"value": "question"}, outputs=["second"]), "second", ["shaper"])
+    pipeline.add_node(CollectInvocationContexts(), "collect", ["first", "second"])
+    results = pipeline.run(query="test query")
+    pipeline.close()
+
+    first_context, second_context = results["invocation_contexts"]
+    assert first_context == {"query": "test query", "question": "test query", "first": "test query"}
+    assert second_context == {"query": "test query", "question": "test query", "second": "test query"}
+
+
 @pytest.mark.unit
 def test_rename_yaml(tmp_path):
     with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from haystack.document_stores.memory import InMemoryDocumentStore
+from haystack.errors import DocumentStoreError
+from haystack.nodes import PreProcessor, SkipUnchangedDocuments
+from haystack.pipelines import Pipeline
+from haystack.schema import Document
+
+
+@pytest.fixture
+def indexing_pipeline():
+    document_store = InMemoryDocumentStore()
+    skip_unchanged = SkipUnchangedDocuments(document_store=document_store, delete_outdated_documents=True)
+    preprocessor = PreProcessor(split_by="word", split_length=3, split_overlap=0, split_respect_sentence_boundary=False)
+    pipeline = Pipeline()
+    pipeline.add_node(component=skip_unchanged, name="SkipUnchangedDocuments", inputs=["File"])
+    pipeline.add_node(component=preprocessor, name="PreProcessor", inputs=["SkipUnchangedDocuments"])
+    pipeline.add_node(component=document_store, name="DocumentStore", inputs=["PreProcessor"])
+    return pipeline
+
+
+@pytest.mark.unit
+def test_fingerprint_depends_on_content_and_meta():
+    node = SkipUnchangedDocuments(document_store=InMemoryDocumentStore())
+    doc = Document(content="text", meta={"name": "a.txt"})
+
+    assert node.fingerprint(doc) == node.fingerprint(Document(content="text", meta={"name": "a.txt"}))
+    assert node.fingerprint(doc) != node.fingerprint(Document(content="other text", meta={"name": "a.txt"}))
+    assert node.fingerprint(doc) != node.fingerprint(Document(content="text", meta={"name": "b.txt"}))
+    # The fingerprint field itself is ignored
+    assert node.fingerprint(doc) == node.fingerprint(Document(content="text", meta={"name": "a.txt", "fingerprint": 1}))
+
+
+@pytest.mark.unit
+def test_skip_unchanged_does_not_change_input_documents():
+    node = SkipUnchangedDocuments(document_store=InMemoryDocumentStore())
+    doc = Document(content="text", meta={"name": "a.txt"})
+
+    result, _ = node.run(documents=[doc])
+
+    assert result["documents"][0].meta == {"name": "a.txt", "fingerprint": node.fingerprint(doc)}
+    assert doc.meta == {"name": "a.txt"}
+
+
+@pytest.mark.integration
+def test_indexing_pipeline_skips_unchanged_documents(indexing_pipeline):
+    document_store = indexing_pipeline.get_node("DocumentStore")
+    docs = [
+        Document(content="one two three four five six", meta={"name": "a.txt"}),
+        Document(content="seven eight nine", meta={"name": "b.txt"}),
+    ]
+    indexing_pipeline.run(documents=docs)
+    assert document_store.get_document_count() == 3
+
+    skip_unchanged = indexing_pipeline.get_node("SkipUnchangedDocuments")
+    changed_doc = Document(content="seven eight nine ten", meta={"name": "b.txt"})
+    indexing_pipeline.run(documents=[docs[0], changed_doc])
+
+    stored_docs = document_store.get_all_documents()
+    a_docs = [doc for doc in stored_docs if doc.meta["name"] == "a.txt"]
+    b_docs = [doc for doc in stored_docs if doc.meta["name"] == "b.txt"]
+    assert len(a_docs) == 2
+    # The split of the earlier version of b.txt was replaced by the splits of the new version
+    assert len(b_docs) == 2
+    assert all(doc.meta["fingerprint"] == skip_unchanged.fingerprint(changed_doc) for doc in b_docs)
+
+
+@pytest.mark.integration
+def test_indexing_pipeline_writes_documents_of_failed_run_when_retried(indexing_pipeline):
+    document_store = indexing_pipeline.get_node("DocumentStore")
+    indexing_pipeline.run(documents=[Document(content="one two three", meta={"name": "a.txt"})])
+
+    changed_doc = Document(content="one two three four", meta={"name": "a.txt"})
+    with patch.object(document_store, "write_documents", side_effect=DocumentStoreError("Write failed")):
+        with pytest.raises(Exception, match="Write failed"):
+            indexing_pipeline.run(documents=[changed_doc])
+    # The outdated Documents were deleted before the failed write
+    assert document_store.get_document_count() == 0
+
+    indexing_pipeline.run(documents=[changed_doc])
+
+    assert sorted(doc.content.strip() for doc in document_store.get_all_documents()) == ["four", "one two three"]
@@ -16,7 +16,7 @@ from haystack.schema import Answer, Document, Span, Label
 from haystack.utils import print_answers
 from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudExperiments
 from haystack.utils.labels import aggregate_labels
-from haystack.utils.preprocessing import convert_files_to_docs, tika_convert_files_to_docs
+from haystack.utils.preprocessing import convert_files_to_docs, iter_convert_files_to_docs, tika_convert_files_to_docs
 from haystack.utils.cleaning import clean_wiki_text
 from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
 
@@ -168,6 +168,53 @@ def test_convert_files_to_docs(samples_path):
     assert documents and len(documents) > 0
 
 
+def test_iter_convert_files_to_docs_in_parallel(samples_path):
+    expected = convert_files_to_docs(dir_path=samples_path / "docs", split_paragraphs=True)
+    documents = list(iter_convert_files_to_docs(dir_path=samples_path / "docs", split_paragraphs=True, num_workers=2))
+    assert sorted(doc.id for doc in documents) == sorted(doc.id for doc in expected)
+
+
+def test_iter_convert_files_to_docs_with_cache(tmp_path):
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    (docs_path / "a.txt").write_text("First file")
+    (docs_path / "b.txt").write_text("Second file")
+    cache_path = tmp_path / "cache.sqlite"
+
+    documents = list(iter_convert_files_to_docs(dir_path=docs_path, cache_path=cache_path))
+    assert sorted(doc.content for doc in documents) == ["First file", "Second file"]
+
+    (docs_path / "b.txt").write_text("Second file, edited")
+    with mock.patch("haystack.utils.preprocessing.TextConverter.convert", autospec=True) as convert:
+        convert.return_value = [Document(content="Second file, edited")]
+        documents = list(iter_convert_files_to_docs(dir_path=docs_path, cache_path=cache_path))
+
+    # Only the file that changed since it was cached is converted again
+    assert convert.call_count == 1
+    assert convert.call_args.kwargs["file_path"].name == "b.txt"
+    assert sorted(doc.content for doc in documents) == ["First file", "Second file, edited"]
+
+
+def test_iter_convert_files_to_docs_with_cache_file_changed_during_conversion(tmp_path):
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    file_path = docs_path / "a.txt"
+    file_path.write_text("First file")
+    cache_path = tmp_path / "cache.sqlite"
+
+    def convert_and_edit(self, file_path, meta, encoding):
+        file_path.write_text("First file, edited during conversion")
+        return [Document(content="First file")]
+
+    with mock.patch("haystack.utils.preprocessing.TextConverter.convert", autospec=True) as convert:
+        convert.side_effect = convert_and_edit
+        list(iter_convert_files_to_docs(dir_path=docs_path, cache_path=cache_path))
+
+    # The text was cached for the file as it was before the conversion, so the edited file is converted again
+    documents = list(iter_convert_files_to_docs(dir_path=docs_path, cache_path=cache_path))
+    assert [doc.content for doc in documents] == ["First file, edited during conversion"]
+
+
 @pytest.mark.tika
 def test_tika_convert_files_to_docs(samples_path):
     documents = tika_convert_files_to_docs(dir_path=samples_path, clean_func=clean_wiki_text, split_paragraphs=True)
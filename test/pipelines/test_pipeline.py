@@ -1,7 +1,9 @@
 import ssl
+import asyncio
 import json
 import platform
 import sys
+import threading
 from typing import Tuple
 from copy import deepcopy
 from unittest import mock
@@ -39,7 +41,7 @@ from haystack.pipelines.utils import generate_code
 from haystack.errors import PipelineConfigError
 from haystack.nodes import PreProcessor, TextConverter
 from haystack.utils.deepsetcloud import DeepsetCloudError
-from haystack import Answer
+from haystack import Answer, Document
 
 from ..conftest import (
     MOCK_DC,
@@ -1787,6 +1789,172 @@ def test_parallel_paths_in_pipeline_graph():
     assert output["test"] == "ABCABD"
 
 
+@pytest.mark.unit
+def test_parallel_paths_in_pipeline_graph_with_max_workers():
+    # Both branches wait for each other, so the pipeline only completes if they run concurrently
+    barrier = threading.Barrier(2, timeout=10)
+
+    class A(RootNode):
+        def run(self):
+            return {"test": "A"}, "output_1"
+
+    class B(RootNode):
+        def run(self, test):
+            barrier.wait()
+            return {"test": test + "B"}, "output_1"
+
+    class C(RootNode):
+        def run(self, test):
+            barrier.wait()
+            return {"test": test + "C"}, "output_1"
+
+    class D(RootNode):
+        def run(self, test):
+            return {"test": test + "D"}, "output_1"
+
+    class JoinNode(RootNode):
+        def run(self, inputs):
+            return {"test": "".join(input_dict["test"] for input_dict in inputs)}, "output_1"
+
+    pipeline = Pipeline(max_workers=2)
+    pipeline.add_node(name="A", component=A(), inputs=["Query"])
+    pipeline.add_node(name="B", component=B(), inputs=["A"])
+    pipeline.add_node(name="C", component=C(), inputs=["A"])
+    pipeline.add_node(name="D", component=D(), inputs=["C"])
+    pipeline.add_node(name="E", component=JoinNode(), inputs=["B", "D"])
+    output = pipeline.run(query="test", debug=True)
+    assert output["test"] == "ABACD"
+    assert set(output["_debug"].keys()) == {"A", "B", "C", "D", "E"}
+
+    # The threads are kept for the next runs until the pipeline is closed
+    executor = pipeline._executor
+    assert pipeline.run(query="test")["test"] == "ABACD"
+    assert pipeline._executor is executor
+    pipeline.close()
+    assert pipeline._executor is None
+    assert pipeline.run(query="test")["test"] == "ABACD"
+    pipeline.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_async():
+    b_started = asyncio.Event()
+    c_started = asyncio.Event()
+
+    class A(RootNode):
+        def run(self):
+            return {"test": "A"}, "output_1"
+
+    # B and C wait for each other, so the pipeline only completes if they run concurrently
+    class B(RootNode):
+        def run(self, test):
+            raise AssertionError("run_async() should await async_run()")
+
+        async def async_run(self, test):
+            b_started.set()
+            await asyncio.wait_for(c_started.wait(), timeout=10)
+            return {"test": test + "B"}, "output_1"
+
+    class C(RootNode):
+        async def async_run(self, test):
+            c_started.set()
+            await asyncio.wait_for(b_started.wait(), timeout=10)
+            return {"test": test + "C"}, "output_1"
+
+    class D(RootNode):
+        def run(self, test):
+            return {"test": test + "D"}, "output_1"
+
+    class JoinNode(RootNode):
+        def run(self, inputs):
+            return {"test": "".join(input_dict["test"] for input_dict in inputs)}, "output_1"
+
+    pipeline = Pipeline()
+    pipeline.add_node(name="A", component=A(), inputs=["Query"])
+    pipeline.add_node(name="B", component=B(), inputs=["A"])
+    pipeline.add_node(name="C", component=C(), inputs=["A"])
+    pipeline.add_node(name="D", component=D(), inputs=["C"])
+    pipeline.add_node(name="E", component=JoinNode(), inputs=["B", "D"])
+    output = await pipeline.run_async(query="test", debug=True)
+    assert output["test"] == "ABACD"
+    assert output["query"] == "test"
+    assert set(output["_debug"].keys()) == {"A", "B", "C", "D", "E"}
+
+
+@pytest.mark.unit
+def test_pipeline_is_compiled_again_when_it_changes():
+    class A(RootNode):
+        def run(self, test=""):
+            return {"test": test + "A"}, "output_1"
+
+    class B(RootNode):
+        def run(self, test, top_k=None):
+            return {"test": test + "B"}, "output_1"
+
+    pipeline = Pipeline()
+    pipeline.add_node(name="A", component=A(), inputs=["Query"])
+    pipeline.compile()
+    execution_plan = pipeline._execution_plan
+    assert pipeline.run(query="test")["test"] == "A"
+    assert pipeline._execution_plan is execution_plan
+    with pytest.raises(ValueError, match="top_k"):
+        pipeline.run(query="test", params={"top_k": 1})
+
+    pipeline.add_node(name="B", component=B(), inputs=["A"])
+    assert pipeline._execution_plan is None
+    assert pipeline.run(query="test", params={"top_k": 1})["test"] == "AB"
+    assert pipeline.get_next_nodes("A", "output_1") == ["B"]
+
+
+@pytest.mark.unit
+def test_node_inputs_are_passed_by_reference_unless_node_mutates_inputs():
+    received = {}
+
+    class Reader(RootNode):
+        def run(self, documents):
+            received[self.name] = documents
+            return {}, "output_1"
+
+    class Mutator(Reader):
+        mutates_inputs = True
+
+        def run(self, documents):
+            for doc in documents:
+                doc.meta["mutated"] = True
+            return super().run(documents)
+
+    documents = [Document(content="doc")]
+    pipeline = Pipeline()
+    pipeline.add_node(name="Reader", component=Reader(), inputs=["Query"])
+    pipeline.add_node(name="Mutator", component=Mutator(), inputs=["Query"])
+    pipeline.run(documents=documents)
+
+    assert received["Reader"] is documents
+    assert received["Mutator"] is not documents
+    assert received["Mutator"][0].meta == {"mutated": True}
+    assert documents[0].meta == {}
+
+
+@pytest.mark.unit
+def test_node_inputs_are_copied_in_safe_mode(monkeypatch):
+    received = {}
+
+    class Reader(RootNode):
+        def run(self, documents):
+            received[self.name] = documents
+            return {}, "output_1"
+
+    monkeypatch.setattr("haystack.nodes.base.COPY_NODE_INPUTS", True)
+    documents = [Document(content="doc")]
+    pipeline = Pipeline()
+    pipeline.add_node(name="Reader", component=Reader(), inputs=["Query"])
+    pipeline.run(documents=documents)
+
+    assert received["Reader"] is not documents
+    assert received["Reader"] == documents
+
+
 def test_parallel_paths_in_pipeline_graph_with_branching():
     class AWithOutput1(RootNode):
         outgoing_edges = 2
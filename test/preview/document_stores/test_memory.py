@@ -36,3 +36,29 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):
     #
     # Test retrieval
     #
+
+
+class TestMemoryDocumentStoreWithMetadataIndex(TestMemoryDocumentStore):
+    """
+    Run the whole test suite with secondary indexes on the filterable metadata fields
+    """
+
+    @pytest.fixture
+    def docstore(self) -> MemoryDocumentStore:
+        return MemoryDocumentStore(metadata_index_fields=["name", "year", "month", "number", "date"])
+
+    def direct_write(self, docstore, documents):
+        """
+        Bypass `write_documents()`, keeping the metadata index in sync
+        """
+        for doc in documents:
+            docstore.storage[doc.id] = doc
+            docstore.metadata_index.add(doc.id, doc.metadata)
+
+    def direct_delete(self, docstore, ids):
+        """
+        Bypass `delete_documents()`, keeping the metadata index in sync
+        """
+        for doc_id in ids:
+            del docstore.storage[doc_id]
+            docstore.metadata_index.remove(doc_id)
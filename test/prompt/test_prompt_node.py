@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 from unittest.mock import MagicMock, Mock, patch
 
@@ -194,6 +196,43 @@ def test_get_prompt_template_with_default_template(mock_model):
     assert template.name == "custom-at-query-time"
 
 
+@pytest.mark.unit
+@patch("haystack.nodes.prompt.prompt_node.PromptModel")
+def test_run_batch_with_concurrent_invocation_layer(mock_model):
+    invoking_threads = set()
+
+    def invoke(prompt, **kwargs):
+        invoking_threads.add(threading.current_thread())
+        time.sleep(0.05)
+        return [prompt]
+
+    mock_model.return_value.invoke.side_effect = invoke
+    mock_model.return_value._ensure_token_limit.side_effect = lambda prompt: prompt
+    mock_model.return_value.model_invocation_layer.supports_concurrent_invocation = True
+
+    node = PromptNode(default_prompt_template=PromptTemplate(name="fake-template", prompt_text="Question: {query}"))
+    queries = [f"query {i}" for i in range(8)]
+    results, _ = node.run_batch(queries=queries)
+
+    # Results keep the order of the inputs even though the prompts were sent concurrently
+    assert results["results"] == [[f"Question: {query}"] for query in queries]
+    assert len(invoking_threads) > 1
+
+
+@pytest.mark.unit
+@patch("haystack.nodes.prompt.prompt_node.PromptModel")
+def test_run_does_not_change_invocation_context(mock_model):
+    mock_model.return_value.invoke.side_effect = lambda prompt, **kwargs: [prompt]
+    mock_model.return_value._ensure_token_limit.side_effect = lambda prompt: prompt
+
+    node = PromptNode(default_prompt_template=PromptTemplate(name="fake-template", prompt_text="Question: {query}"))
+    invocation_context = {"query": "What's the capital of Germany?"}
+    results, _ = node.run(invocation_context=invocation_context)
+
+    assert results["invocation_context"]["results"] == ["Question: What's the capital of Germany?"]
+    assert invocation_context == {"query": "What's the capital of Germany?"}
+
+
 @pytest.mark.integration
 def test_invalid_template_params():
     # TODO: This can be a PromptTemplate unit test
@@ -1,13 +1,49 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, Mock
 
 import pytest
 import requests
 
-from haystack.utils.requests import request_with_retry
+from haystack.utils.requests import concurrent_map, get_session, request_with_retry
+
+
+@pytest.fixture
+def mock_server():
+    state = {"clients": set(), "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with lock:
+                state["clients"].add(self.client_address)
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            time.sleep(0.05)
+            with lock:
+                state["in_flight"] -= 1
+            body = self.path.encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.mark.unit
-@patch("haystack.utils.requests.requests.request")
+@patch("haystack.utils.requests.requests.Session.request")
 def test_request_with_retry_defaults_successfully(mock_request):
     # Make requests with default retry configuration
     request_with_retry(method="GET", url="https://example.com")
@@ -17,7 +53,7 @@ def test_request_with_retry_defaults_successfully(mock_request):
 
 
 @pytest.mark.unit
-@patch("haystack.utils.requests.requests.request")
+@patch("haystack.utils.requests.requests.Session.request")
 def test_request_with_retry_custom_timeout(mock_request):
     # Make requests with default retry configuration
     request_with_retry(method="GET", url="https://example.com", timeout=5)
@@ -27,7 +63,7 @@ def test_request_with_retry_custom_timeout(mock_request):
 
 
 @pytest.mark.unit
-@patch("haystack.utils.requests.requests.request")
+@patch("haystack.utils.requests.requests.Session.request")
 def test_request_with_retry_failing_request_and_expected_status_code(mock_request):
     # Create fake failed response with status code that triggers retry
     fake_response = requests.Response()
@@ -43,7 +79,7 @@ def test_request_with_retry_failing_request_and_expected_status_code(mock_reques
 
 
 @pytest.mark.unit
-@patch("haystack.utils.requests.requests.request")
+@patch("haystack.utils.requests.requests.Session.request")
 def test_request_with_retry_failing_request_and_ignored_status_code(mock_request):
     # Create fake failed response with status code that doesn't trigger retry
     fake_response = requests.Response()
@@ -59,7 +95,7 @@ def test_request_with_retry_failing_request_and_ignored_status_code(mock_request
 
 
 @pytest.mark.unit
-@patch("haystack.utils.requests.requests.request")
+@patch("haystack.utils.requests.requests.Session.request")
 def test_request_with_retry_timed_out_request(mock_request: Mock):
     # Make request fail cause of a timeout
     mock_request.side_effect = TimeoutError()
@@ -70,3 +106,38 @@ def test_request_with_retry_timed_out_request(mock_request: Mock):
 
     # Verifies request has been retried the expected number of times
     assert mock_request.call_count == 2
+
+
+@pytest.mark.unit
+def test_request_with_retry_reuses_connections(mock_server):
+    url, state = mock_server
+    get_session().close()
+
+    for i in range(5):
+        assert request_with_retry(method="GET", url=f"{url}/{i}").text == f"/{i}"
+
+    # All requests went over the same kept-alive connection
+    assert len(state["clients"]) == 1
+
+
+@pytest.mark.unit
+def test_concurrent_map_keeps_order_and_bounds_concurrency(mock_server):
+    url, state = mock_server
+
+    results = concurrent_map(
+        lambda i: request_with_retry(method="GET", url=f"{url}/{i}").text, range(12), max_concurrency=4
+    )
+
+    assert results == [f"/{i}" for i in range(12)]
+    assert 1 < state["max_in_flight"] <= 4
+
+
+@pytest.mark.unit
+def test_concurrent_map_runs_nested_calls_sequentially():
+    def outer(_):
+        return threading.current_thread(), concurrent_map(lambda _: threading.current_thread(), range(3))
+
+    for outer_thread, inner_threads in concurrent_map(outer, range(4)):
+        # Nested calls stay on the worker thread that runs the outer call
+        assert outer_thread is not threading.main_thread()
+        assert inner_threads == [outer_thread] * 3